@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+name: zabbix_api_profile
+type: aggregate
+short_description: Report the Zabbix API calls made by the modules of a playbook run
+version_added: 2.2.0
+description:
+    - Aggregates the C(api_stats) returned by the Zabbix modules per module, per API method and per host.
+    - At the end of the playbook run, displays a report with the slowest API calls and the tasks calling the same API method
+      many times (N+1 patterns), which are candidates for batching.
+    - The modules only return C(api_stats) when the C(zabbix_api_stats) option of the httpapi plugin is enabled,
+      e.g. with C(ansible_zabbix_api_stats=true).
+    - Sizes are those of the JSON-encoded parameters and results of the calls, they approximate the HTTP traffic
+      which also contains the JSON-RPC envelope and may be compressed.
+requirements:
+    - enable in configuration, e.g. C(callbacks_enabled = community.zabbix.zabbix_api_profile) in C(ansible.cfg)
+options:
+    output_file:
+        description:
+            - If set, the aggregated statistics are also written as JSON to this file.
+        type: path
+        ini:
+            - section: callback_zabbix_api_profile
+              key: output_file
+        env:
+            - name: ANSIBLE_ZABBIX_API_PROFILE_OUTPUT_FILE
+    slowest_calls:
+        description:
+            - Number of slowest API calls listed in the report.
+        type: int
+        default: 10
+        ini:
+            - section: callback_zabbix_api_profile
+              key: slowest_calls
+        env:
+            - name: ANSIBLE_ZABBIX_API_PROFILE_SLOWEST_CALLS
+    repeated_calls_threshold:
+        description:
+            - A task calling the same API method at least this many times on a host is reported as an N+1 pattern.
+        type: int
+        default: 10
+        ini:
+            - section: callback_zabbix_api_profile
+              key: repeated_calls_threshold
+        env:
+            - name: ANSIBLE_ZABBIX_API_PROFILE_REPEATED_CALLS_THRESHOLD
+"""
+
+import json
+
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible.plugins.callback import CallbackBase
+
+
+class CallbackModule(CallbackBase):
+    """
+    Aggregates the Zabbix API statistics returned by modules and reports them at the end of the run.
+    """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'community.zabbix.zabbix_api_profile'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self):
+        super(CallbackModule, self).__init__()
+        self.totals = {'calls': 0, 'time': 0.0, 'params_json_size': 0, 'result_json_size': 0, 'cache_hits': 0}
+        self.modules = {}
+        self.methods = {}
+        self.hosts = {}
+        self.slowest = []
+        self.repeated = []
+
+    @staticmethod
+    def _add(stats, key, calls, duration, params_json_size=0, result_json_size=0):
+        entry = stats.setdefault(key, {'calls': 0, 'time': 0.0, 'params_json_size': 0, 'result_json_size': 0})
+        entry['calls'] += calls
+        entry['time'] += duration
+        entry['params_json_size'] += params_json_size
+        entry['result_json_size'] += result_json_size
+
+    def _record(self, result, api_stats):
+        host = result._host.get_name()
+        module = result._task.action
+        task = result._task.get_name()
+
+        self.totals['calls'] += api_stats.get('calls', 0)
+        self.totals['time'] += api_stats.get('time', 0.0)
+        self.totals['cache_hits'] += sum(api_stats.get('cache_hits', {}).values())
+        self._add(self.modules, module, api_stats.get('calls', 0), api_stats.get('time', 0.0))
+        self._add(self.hosts, host, api_stats.get('calls', 0), api_stats.get('time', 0.0))
+
+        threshold = self.get_option('repeated_calls_threshold')
+        for method, stats in api_stats.get('methods', {}).items():
+            self._add(self.methods, method, stats['calls'], stats['time'], stats['params_json_size'], stats['result_json_size'])
+            self.totals['params_json_size'] += stats['params_json_size']
+            self.totals['result_json_size'] += stats['result_json_size']
+            if stats['calls'] >= threshold:
+                self.repeated.append({'task': task, 'module': module, 'host': host, 'method': method, 'calls': stats['calls']})
+
+        for call in api_stats.get('call_log', []):
+            self.slowest.append(dict(call, task=task, module=module, host=host))
+        self.slowest.sort(key=lambda call: call['time'], reverse=True)
+        del self.slowest[self.get_option('slowest_calls'):]
+
+    def _process(self, result):
+        results = result._result.get('results')
+        if isinstance(results, list):
+            # loops return the result of each item
+            items = [item for item in results if isinstance(item, dict)]
+        else:
+            items = [result._result]
+        for item in items:
+            if isinstance(item.get('api_stats'), dict):
+                self._record(result, item['api_stats'])
+
+    def v2_runner_on_ok(self, result):
+        self._process(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._process(result)
+
+    def _display_table(self, title, stats, sizes=False):
+        self._display.display(title)
+        for key, entry in sorted(stats.items(), key=lambda item: item[1]['time'], reverse=True):
+            line = "  %-40s %6d calls %10.3fs" % (key, entry['calls'], entry['time'])
+            if sizes:
+                line += " %12d JSON bytes of params %12d JSON bytes of results" % (entry['params_json_size'], entry['result_json_size'])
+            self._display.display(line)
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.totals['calls']:
+            return
+
+        self._display.banner("ZABBIX API PROFILE")
+        self._display.display("%d API calls, %.3fs, %d calls answered from the per-run cache" % (
+            self.totals['calls'], self.totals['time'], self.totals['cache_hits']))
+        self._display_table("Per module:", self.modules)
+        self._display_table("Per API method:", self.methods, sizes=True)
+        self._display_table("Per host:", self.hosts)
+
+        self._display.display("Slowest calls:")
+        for call in self.slowest:
+            self._display.display("  %10.3fs %-30s %s on %s (status %s, %d JSON bytes of result)" % (
+                call['time'], call['method'], call['task'], call['host'], call['status'], call['result_json_size']))
+
+        if self.repeated:
+            self._display.display("Repeated calls (N+1 patterns):")
+            for pattern in sorted(self.repeated, key=lambda pattern: pattern['calls'], reverse=True):
+                self._display.display("  %s called %d times by task '%s' (%s) on %s" % (
+                    pattern['method'], pattern['calls'], pattern['task'], pattern['module'], pattern['host']))
+
+        output_file = self.get_option('output_file')
+        if output_file:
+            report = {
+                'totals': self.totals,
+                'modules': self.modules,
+                'methods': self.methods,
+                'hosts': self.hosts,
+                'slowest_calls': self.slowest,
+                'repeated_calls': self.repeated,
+            }
+            with open(to_bytes(output_file), 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
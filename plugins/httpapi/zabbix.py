@@ -47,23 +47,185 @@ options:
       - The http password to access zabbix url with Basic Auth
     vars:
       - name: http_login_password
+  zabbix_id_cache_ttl:
+    type: int
+    description:
+      - Number of seconds object name to ID lookups are cached for the life of the persistent connection.
+      - Set to C(0) to disable the cache.
+    default: 300
+    env:
+      - name: ANSIBLE_ZABBIX_ID_CACHE_TTL
+    vars:
+      - name: ansible_zabbix_id_cache_ttl
+  zabbix_session_cache:
+    type: bool
+    description:
+      - Store the API session of C(user.login) on the controller and reuse it for later connections
+        with the same URL and credentials.
+      - The stored session is validated with C(user.checkAuthentication) before it is reused and
+        is not logged out when the connection is closed. The Zabbix API version is requested in the same
+        JSON-RPC batch, so an upgraded Zabbix server is detected.
+      - Not used with I(zabbix_auth_key).
+    default: false
+    env:
+      - name: ANSIBLE_ZABBIX_SESSION_CACHE
+    vars:
+      - name: ansible_zabbix_session_cache
+  zabbix_session_cache_dir:
+    type: path
+    description:
+      - Directory where API sessions are stored when I(zabbix_session_cache) is enabled.
+      - The directory is created with mode C(0700) and the session files with mode C(0600).
+    default: ~/.ansible/zabbix_sessions
+    env:
+      - name: ANSIBLE_ZABBIX_SESSION_CACHE_DIR
+    vars:
+      - name: ansible_zabbix_session_cache_dir
+  zabbix_session_cache_ttl:
+    type: int
+    description:
+      - Number of seconds a session stored by I(zabbix_session_cache) is reused for, a new session
+        is logged in once it is older.
+    default: 3600
+    env:
+      - name: ANSIBLE_ZABBIX_SESSION_CACHE_TTL
+    vars:
+      - name: ansible_zabbix_session_cache_ttl
+  zabbix_keepalive:
+    type: bool
+    description:
+      - Send all API requests of the persistent connection over a single HTTP(S) connection kept alive between requests.
+      - The number of requests and of reused HTTP connections are displayed with C(-vvvv).
+      - When a proxy is configured in the environment (and C(use_proxy) is enabled), requests are sent
+        without keep-alive through the proxy.
+      - HTTP errors and redirects are handled as without keep-alive, a request redirected to another
+        host is sent over a new HTTP connection.
+    default: false
+    env:
+      - name: ANSIBLE_ZABBIX_KEEPALIVE
+    vars:
+      - name: ansible_zabbix_keepalive
+  zabbix_gzip_request_min_size:
+    type: int
+    description:
+      - Compress request bodies of at least this size in bytes with gzip, e.g. large C(configuration.import) requests.
+      - The Zabbix frontend does not decompress requests by itself, the web server in front of it has to
+        (for example Apache with C(SetInputFilter DEFLATE)).
+      - Set to C(0) to never compress requests. Responses are always requested with C(Accept-Encoding: gzip).
+    default: 0
+    env:
+      - name: ANSIBLE_ZABBIX_GZIP_REQUEST_MIN_SIZE
+    vars:
+      - name: ansible_zabbix_gzip_request_min_size
+  zabbix_api_stats:
+    type: bool
+    description:
+      - Return the API calls made by a module, with their duration and the size of their JSON-encoded parameters
+        and results (C(params_json_size) and C(result_json_size)), as C(api_stats) in the module result.
+      - These sizes approximate the size of the HTTP requests and responses, which also contain the JSON-RPC envelope
+        and may be compressed.
+      - See the C(community.zabbix.zabbix_api_profile) callback plugin to aggregate them over a playbook run.
+    default: false
+    env:
+      - name: ANSIBLE_ZABBIX_API_STATS
+    vars:
+      - name: ansible_zabbix_api_stats
+  zabbix_rate_limit:
+    type: float
+    description:
+      - Maximum number of API requests per second sent to the Zabbix frontend by all the forks of the controller together.
+      - Requests exceeding the rate wait for their turn, up to I(zabbix_rate_limit_burst) requests can be sent at once.
+      - The limit is shared through a state file in I(zabbix_rate_limit_dir), per Zabbix URL.
+      - Set to C(0) to disable the rate limit.
+    default: 0
+    env:
+      - name: ANSIBLE_ZABBIX_RATE_LIMIT
+    vars:
+      - name: ansible_zabbix_rate_limit
+  zabbix_rate_limit_burst:
+    type: int
+    description:
+      - Number of API requests that can be sent at once when the rate limit of I(zabbix_rate_limit) was not used for a while.
+    default: 10
+    env:
+      - name: ANSIBLE_ZABBIX_RATE_LIMIT_BURST
+    vars:
+      - name: ansible_zabbix_rate_limit_burst
+  zabbix_max_concurrency:
+    type: int
+    description:
+      - Maximum number of API requests sent to the Zabbix frontend at the same time by all the forks of the controller together.
+      - The actual limit adapts to the frontend between C(1) and this value, it is halved when requests fail with a
+        HTTP 5xx status, a timeout or a connection error or take more than I(zabbix_latency_factor) times the usual time,
+        and is increased again by successful requests.
+      - The limit is shared through a state file in I(zabbix_rate_limit_dir), per Zabbix URL.
+      - Set to C(0) to disable the limit.
+    default: 0
+    env:
+      - name: ANSIBLE_ZABBIX_MAX_CONCURRENCY
+    vars:
+      - name: ansible_zabbix_max_concurrency
+  zabbix_latency_factor:
+    type: float
+    description:
+      - Requests taking more than this factor times the usual time of a request reduce the concurrent
+        requests limit of I(zabbix_max_concurrency).
+    default: 3.0
+    env:
+      - name: ANSIBLE_ZABBIX_LATENCY_FACTOR
+    vars:
+      - name: ansible_zabbix_latency_factor
+  zabbix_rate_limit_dir:
+    type: path
+    description:
+      - Directory of the state files shared by the forks for I(zabbix_rate_limit) and I(zabbix_max_concurrency).
+    default: ~/.ansible/zabbix_rate_limit
+    env:
+      - name: ANSIBLE_ZABBIX_RATE_LIMIT_DIR
+    vars:
+      - name: ansible_zabbix_rate_limit_dir
 """
 
+import os
+import ssl
 import json
+import time
 import base64
+import hashlib
 
 from uuid import uuid4
 
-from ansible.module_utils.basic import to_text
+from ansible.module_utils.basic import to_bytes, to_text
+from ansible_collections.community.zabbix.plugins.module_utils.capabilities import get_capabilities
+from ansible_collections.community.zabbix.plugins.module_utils.codec import gzip_compress, gzip_decompress, json_dumps, json_loads
+from ansible_collections.community.zabbix.plugins.module_utils.rate_limiter import ZabbixRateLimiter
 from ansible.errors import AnsibleConnectionFailure
 from ansible.plugins.httpapi import HttpApiBase
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urljoin, urlparse
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 
 
 class HttpApi(HttpApiBase):
     zbx_api_version = None
     auth_key = None
     url_path = '/zabbix'  # By default Zabbix WebUI is on http(s)://FQDN/zabbix
+    # methods that must be called without authentication
+    no_auth_methods = ['user.login', 'user.checkAuthentication', 'apiinfo.version']
+    # redirects followed on the kept-alive connection, as many as urllib follows
+    max_redirects = 10
+
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        # {object_type: {name: (id, timestamp)}}
+        self.id_cache = {}
+        self._headers = None
+        self._bearer_headers = (None, None)
+        self._http_connection = None
+        self._rate_limiter = None
+        self._last_status = None
+        self.http_stats = {'requests': 0, 'connections': 0, 'reused': 0}
 
     def set_become(self, become_context):
         """As this is an http rpc call there is no elevation available
@@ -83,32 +245,102 @@ class HttpApi(HttpApiBase):
             # Provide "fake" auth so netcommon.connection does not replace our headers
             self.connection._auth = {'auth': 'fake'}
 
+        session_file = None
+        if self.get_option('zabbix_session_cache'):
+            session_file = self._session_cache_file(username, password)
+            session = self._session_cache_read(session_file)
+            if session and self._session_is_valid(session['sessionid']):
+                self.connection._auth = {'auth': session['sessionid']}
+                return
+
         # login() method is called "somehow" as a very first call to the REST API.
         # This collection's code first of all executes api_version() but login() anyway
         # is called first (I suspect due to complicated (for me) httpapi modules inheritance/communication
-        # model). Bottom line: at the time of login() execution we are not aware of Zabbix version.
-        # Proposed approach: first execute "user.login" with "user" parameter and if it fails then
-        # execute "user.login" with "username" parameter.
-        # Zabbix < 5.0 supports only "user" parameter.
-        # Zabbix >= 6.0 and <= 6.2 support both "user" and "username" parameters.
+        # model). Bottom line: at the time of login() execution we are not aware of Zabbix version,
+        # so it is requested here (apiinfo.version does not require authentication).
+        # Zabbix < 5.4 supports only "user" parameter.
+        # Zabbix >= 5.4 and <= 6.2 support both "user" and "username" parameters.
         # Zabbix >= 6.4 supports only "username" parameter.
-        try:
-            # Zabbix <= 6.2
-            payload = self.payload_builder("user.login", user=username, password=password)
-            code, response = self.send_request(data=payload)
-        except ConnectionError:
-            # Zabbix >= 6.4
+        version = self._request_api_version()
+        if get_capabilities(version).username_login:
             payload = self.payload_builder("user.login", username=username, password=password)
-            code, response = self.send_request(data=payload)
+        else:
+            payload = self.payload_builder("user.login", user=username, password=password)
+        code, response = self.send_request(data=payload)
 
         if code == 200 and response != '':
             # Replace auth with real api_key we got from Zabbix after successful login
             self.connection._auth = {'auth': response}
+            if session_file:
+                self._session_cache_write(session_file, {'sessionid': response, 'created': time.time()})
 
     def logout(self):
-        if self.connection._auth and not self.auth_key:
+        if self.connection._auth and not self.auth_key and not self.get_option('zabbix_session_cache'):
             payload = self.payload_builder("user.logout")
             self.send_request(data=payload)
+        if self._http_connection is not None:
+            self._http_connection.close()
+
+    def _session_cache_file(self, username, password):
+        # The file name is derived from the URL and the credentials, so a changed password
+        # or another Zabbix user never picks up a stored session
+        key = '|'.join([
+            to_text(self.connection._url), to_text(self.get_option('zabbix_url_path')),
+            to_text(username), to_text(password)
+        ])
+        cache_dir = os.path.expanduser(self.get_option('zabbix_session_cache_dir'))
+        return os.path.join(cache_dir, hashlib.sha256(to_bytes(key)).hexdigest() + '.json')
+
+    def _session_cache_read(self, session_file):
+        try:
+            with open(session_file) as f:
+                session = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(session, dict) or not session.get('sessionid') or not session.get('created'):
+            return None
+        if time.time() - session['created'] > self.get_option('zabbix_session_cache_ttl'):
+            return None
+        return session
+
+    def _session_cache_write(self, session_file, session):
+        cache_dir = os.path.dirname(session_file)
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            # write to a temporary file created with restrictive permissions and rename it,
+            # so concurrent connections never read a partially written session
+            tmp_file = '%s.%s.tmp' % (session_file, os.getpid())
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(session, f)
+            os.rename(tmp_file, session_file)
+        except (IOError, OSError) as e:
+            self.connection.queue_message("vvv", "Could not store Zabbix API session: %s" % e)
+
+    def _session_is_valid(self, sessionid):
+        # the API version is requested in the same batch rather than stored with the session,
+        # Zabbix may have been upgraded since
+        calls = [self.payload_builder("apiinfo.version"), self.payload_builder("user.checkAuthentication", sessionid=sessionid)]
+        try:
+            code, responses = self.send_batch_request(data=calls)
+        except ConnectionError:
+            return False
+        if code != 200:
+            return False
+        version, check = responses
+        if version.get('result'):
+            self.connection.zbx_api_version = version['result']
+        return isinstance(check.get('result'), dict) and bool(check['result'].get('userid'))
+
+    def _request_api_version(self):
+        if not hasattr(self.connection, 'zbx_api_version'):
+            code, version = self.send_request(data=self.payload_builder('apiinfo.version'))
+            if code == 200 and len(version) != 0:
+                self.connection.zbx_api_version = version
+            else:
+                raise ConnectionError("Could not get API version from Zabbix. Got HTTP code %s. Got version %s" % (code, version))
+        return self.connection.zbx_api_version
 
     def api_version(self):
         url_path = self.get_option('zabbix_url_path')
@@ -119,58 +351,290 @@ class HttpApi(HttpApiBase):
             else:
                 self.url_path = '/' + url_path
         if not self.zbx_api_version:
-            if not hasattr(self.connection, 'zbx_api_version'):
-                code, version = self.send_request(data=self.payload_builder('apiinfo.version'))
-                if code == 200 and len(version) != 0:
-                    self.connection.zbx_api_version = version
-                else:
-                    raise ConnectionError("Could not get API version from Zabbix. Got HTTP code %s. Got version %s" % (code, version))
-            self.zbx_api_version = self.connection.zbx_api_version
+            if not self.connection.connected:
+                # login() may already know the version, e.g. from a cached session
+                self.connection._connect()
+            self.zbx_api_version = self._request_api_version()
         return self.zbx_api_version
 
-    def send_request(self, data=None, request_method="POST", path="/api_jsonrpc.php"):
-        path = self.url_path + path
-        if not data:
-            data = {}
-
-        if self.connection._auth:
+    def _request_headers(self, bearer_auth=None):
+        # The headers only depend on the connection options and on the session,
+        # so they are built once and reused for all requests
+        if self._headers is None:
+            hdrs = {
+                'Content-Type': 'application/json-rpc',
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip',
+            }
+            http_login_user = self.get_option('http_login_user')
+            http_login_password = self.get_option('http_login_password')
+            if http_login_user and http_login_user != '-42':
+                # Need to add Basic auth header
+                credentials = (http_login_user + ':' + http_login_password).encode('ascii')
+                hdrs['Authorization'] = 'Basic ' + base64.b64encode(credentials).decode("ascii")
+            self._headers = hdrs
+
+        if not bearer_auth:
+            return self._headers
+
+        if self._bearer_headers[0] != bearer_auth:
+            hdrs = dict(self._headers)
+            hdrs['Authorization'] = 'Bearer ' + bearer_auth
+            self._bearer_headers = (bearer_auth, hdrs)
+        return self._bearer_headers[1]
+
+    def _bearer_auth(self, methods):
+        """Return the session id or API token to send in an Authorization header, None to send it in the request body."""
+        auth = self.connection._auth['auth'] if self.connection._auth else None
+        if not auth or auth == 'fake' or any(method in self.no_auth_methods for method in methods):
+            return None
+
+        # the Authorization header is already used by HTTP basic auth
+        if 'Authorization' in self._request_headers():
+            return None
+
+        version = getattr(self.connection, 'zbx_api_version', None)
+        if not version or not get_capabilities(version).supports_bearer_auth:
+            return None
+        return auth
+
+    def _add_auth(self, data, bearer_auth=None):
+        if self.connection._auth and not bearer_auth:
             data['auth'] = self.connection._auth['auth']
 
-        hdrs = {
-            'Content-Type': 'application/json-rpc',
-            'Accept': 'application/json',
-        }
-        http_login_user = self.get_option('http_login_user')
-        http_login_password = self.get_option('http_login_password')
-        if http_login_user and http_login_user != '-42':
-            # Need to add Basic auth header
-            credentials = (http_login_user + ':' + http_login_password).encode('ascii')
-            hdrs['Authorization'] = 'Basic ' + base64.b64encode(credentials).decode("ascii")
-
-        if data['method'] in ['user.login', 'apiinfo.version']:
-            # user.login and apiinfo.version do not need "auth" in data
+        if data['method'] in self.no_auth_methods:
+            # user.login, user.checkAuthentication and apiinfo.version do not need "auth" in data
             # we provided fake one in login() method to correctly handle HTTP basic auth header
             data.pop('auth', None)
 
-        data = json.dumps(data)
+    def _connection_option(self, option, default=None):
         try:
-            self._display_request(request_method, path)
+            return self.connection.get_option(option)
+        except KeyError:
+            return default
+
+    def _use_keepalive(self, url):
+        if not self.get_option('zabbix_keepalive'):
+            return False
+        # leave requests through a proxy to the connection plugin
+        if self._connection_option('use_proxy', True) and getproxies().get(url.scheme) and not proxy_bypass(url.hostname):
+            return False
+        return True
+
+    def _new_http_connection(self, url):
+        timeout = self._connection_option('persistent_command_timeout', 30)
+        if url.scheme != 'https':
+            return http_client.HTTPConnection(url.netloc, timeout=timeout)
+
+        if self._connection_option('validate_certs', True):
+            context = ssl.create_default_context(cafile=self._connection_option('ca_path'))
+        else:
+            context = ssl._create_unverified_context()
+        client_cert = self._connection_option('client_cert')
+        if client_cert:
+            context.load_cert_chain(client_cert, self._connection_option('client_key'))
+        return http_client.HTTPSConnection(url.netloc, timeout=timeout, context=context)
+
+    def _get_rate_limiter(self):
+        """Return the ZabbixRateLimiter shared by the forks for this Zabbix URL, None if no limit is configured."""
+        if self._rate_limiter is None:
+            rate = self.get_option('zabbix_rate_limit')
+            max_concurrency = self.get_option('zabbix_max_concurrency')
+            if not rate and not max_concurrency:
+                self._rate_limiter = False
+            else:
+                key = '|'.join([to_text(self.connection._url), to_text(self.get_option('zabbix_url_path'))])
+                state_dir = os.path.expanduser(self.get_option('zabbix_rate_limit_dir'))
+                self._rate_limiter = ZabbixRateLimiter(
+                    os.path.join(state_dir, hashlib.sha256(to_bytes(key)).hexdigest() + '.json'),
+                    rate=rate,
+                    burst=self.get_option('zabbix_rate_limit_burst'),
+                    max_concurrency=max_concurrency,
+                    latency_factor=self.get_option('zabbix_latency_factor'),
+                )
+        return self._rate_limiter or None
+
+    def _send(self, path, data, hdrs, request_method):
+        """Send the request and return the HTTP code and the response body as bytes."""
+        gzip_min_size = self.get_option('zabbix_gzip_request_min_size')
+        if gzip_min_size and len(data) >= gzip_min_size:
+            data = gzip_compress(data)
+            hdrs = dict(hdrs)
+            hdrs['Content-Encoding'] = 'gzip'
+
+        limiter = self._get_rate_limiter()
+        if limiter is None:
+            return self._send_http(path, data, hdrs, request_method)
+
+        if not self.connection.connected:
+            # login() sends its own requests, it must not run while this request holds a slot
+            self.connection._connect()
+        waited = limiter.acquire()
+        if waited >= 0.001:
+            self.connection.queue_message("vvvv", "Waited %.3fs for the Zabbix API request limits" % waited)
+        self._last_status = None
+        try:
+            return self._send_http(path, data, hdrs, request_method)
+        finally:
+            # no status means a timeout or a connection error
+            limiter.release(congested=self._last_status is None or self._last_status >= 500)
+
+    def _send_http(self, path, data, hdrs, request_method):
+        url = urlparse(self.connection._url)
+        if not self._use_keepalive(url):
             response, response_data = self.connection.send(
                 path,
                 data,
                 method=request_method,
                 headers=hdrs
             )
-            value = to_text(response_data.getvalue())
+            self._last_status = response.getcode()
+            return response.getcode(), gzip_decompress(response_data.getvalue())
+
+        if not self.connection.connected:
+            # login() is called when the connection plugin connects
+            self.connection._connect()
 
+        if self._http_connection is None:
+            self._http_connection = self._new_http_connection(url)
+
+        request_url = urlparse(self.connection._url + path)
+        for redirects in range(self.max_redirects + 1):
+            if (request_url.scheme, request_url.netloc) == (url.scheme, url.netloc):
+                status, reason, headers, body = self._request_keepalive(self._http_connection, request_method, path, data, hdrs)
+            else:
+                # redirected to another server, not worth keeping a connection to
+                connection = self._new_http_connection(request_url)
+                try:
+                    status, reason, headers, body = self._request_keepalive(connection, request_method, path, data, hdrs)
+                finally:
+                    connection.close()
+            self._last_status = status
+
+            location = headers.get('Location')
+            if status not in (301, 302, 303, 307, 308) or not location:
+                break
+            if redirects == self.max_redirects:
+                raise ConnectionError("HTTP Error %s: %s, too many redirects" % (status, reason), code=status)
+            # follow the redirect like urllib does for the connection plugin: only 307 and 308 repeat a POST
+            request_url = urlparse(urljoin(request_url.geturl(), location))
+            path = request_url.path + ('?' + request_url.query if request_url.query else '')
+            if status not in (307, 308):
+                request_method, data = 'GET', None
+                hdrs = dict((k, v) for k, v in hdrs.items() if k.lower() not in ('content-type', 'content-encoding'))
+
+        if status == 401:
+            # mapped to the authentication failure by send_request(), like the connection plugin does
+            raise AnsibleConnectionFailure("HTTP Error %s: %s" % (status, reason))
+        if status >= 400:
+            raise ConnectionError("HTTP Error %s: %s" % (status, reason), code=status)
+        return status, gzip_decompress(body)
+
+    def _request_keepalive(self, connection, request_method, path, data, hdrs):
+        """Send a request over a kept-alive connection, return the status, reason, headers and body."""
+        for attempt in range(2):
+            # http_client opens a new connection when the previous one was closed
+            reused = connection.sock is not None
             try:
-                json_data = json.loads(value) if value else {}
+                connection.request(request_method, path, body=data, headers=hdrs)
+                response = connection.getresponse()
+                body = response.read()
+            except (http_client.HTTPException, OSError) as e:
+                connection.close()
+                # the server may close an idle connection, retry once on a new one
+                if reused and not attempt and isinstance(e, (http_client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)):
+                    continue
+                raise AnsibleConnectionFailure("Could not connect to %s: %s" % (self.connection._url, e))
+            break
+
+        self.http_stats['requests'] += 1
+        self.http_stats['reused' if reused else 'connections'] += 1
+        self.connection.queue_message(
+            "vvvv",
+            "Zabbix API request %(requests)s, %(connections)s HTTP connection(s) opened, %(reused)s reused" % self.http_stats
+        )
+        return response.status, response.reason, response.msg, body
+
+    def connection_stats(self):
+        """Return the number of API requests sent and of HTTP connections opened and reused."""
+        return dict(self.http_stats)
+
+    def id_cache_lookup(self, object_type, names):
+        """Return the cached IDs of the given object names as a dict {name: id}.
+
+        Names that are not cached or whose entry is older than zabbix_id_cache_ttl are omitted.
+        """
+        ttl = self.get_option('zabbix_id_cache_ttl')
+        cache = self.id_cache.get(object_type, {})
+        if not ttl or not cache:
+            return {}
+
+        now = time.time()
+        ids = {}
+        for name in names:
+            if name in cache:
+                object_id, timestamp = cache[name]
+                if now - timestamp < ttl:
+                    ids[name] = object_id
+                else:
+                    del cache[name]
+        return ids
+
+    def id_cache_store(self, object_type, ids):
+        """Store the IDs of object names given as a dict {name: id}."""
+        if not self.get_option('zabbix_id_cache_ttl'):
+            return
+
+        now = time.time()
+        cache = self.id_cache.setdefault(object_type, {})
+        for name, object_id in ids.items():
+            cache[name] = (object_id, now)
+
+    def id_cache_invalidate(self, object_type, names=None):
+        """Drop the given names, or all names if none given, of an object type from the ID cache."""
+        if names is None:
+            self.id_cache.pop(object_type, None)
+            return
+
+        cache = self.id_cache.get(object_type, {})
+        for name in names:
+            cache.pop(name, None)
+
+    def _invalidate_id_cache(self, method):
+        # Names that were not found are never cached, so only writes which may rename
+        # or remove objects have to drop cached IDs
+        if method == 'configuration.import':
+            for object_type in ['host', 'hostgroup', 'template', 'templategroup']:
+                self.id_cache_invalidate(object_type)
+            return
+
+        object_type, dummy, action = method.partition('.')
+        if action in ['update', 'delete']:
+            self.id_cache_invalidate(object_type)
+
+    def send_request(self, data=None, request_method="POST", path="/api_jsonrpc.php"):
+        path = self.url_path + path
+        if not data:
+            data = {}
+
+        self._invalidate_id_cache(data['method'])
+        bearer_auth = self._bearer_auth([data['method']])
+        self._add_auth(data, bearer_auth)
+        hdrs = self._request_headers(bearer_auth)
+
+        data = json_dumps(data)
+        try:
+            self._display_request(request_method, path)
+            code, value = self._send(path, data, hdrs, request_method)
+
+            try:
+                json_data = json_loads(value) if value else {}
             # JSONDecodeError only available on Python 3.5+
             except ValueError:
-                raise ConnectionError("Invalid JSON response: %s" % value)
+                raise ConnectionError("Invalid JSON response: %s" % self._shorten(value))
 
             if "error" in json_data:
-                raise ConnectionError("REST API returned %s when sending %s" % (json_data["error"], data))
+                raise ConnectionError("REST API returned %s when sending %s" % (json_data["error"], self._shorten(data)))
 
             if "result" in json_data:
                 json_data = json_data["result"]
@@ -180,9 +644,9 @@ class HttpApi(HttpApiBase):
                 iter(json_data)
             except TypeError:
                 # Do not try to find "error" if it is not a dict
-                return response.getcode(), json_data
+                return code, json_data
 
-            return response.getcode(), json_data
+            return code, json_data
         except AnsibleConnectionFailure as e:
             self.connection.queue_message("vvv", "AnsibleConnectionFailure: %s" % e)
             if to_text("Could not connect to") in to_text(e):
@@ -194,6 +658,59 @@ class HttpApi(HttpApiBase):
         except Exception as e:
             raise e
 
+    def send_batch_request(self, data=None, request_method="POST", path="/api_jsonrpc.php"):
+        """Send several JSON-RPC calls in a single HTTP round trip.
+
+        data is a list of payloads as built by payload_builder(), each with a unique "id".
+        Returns the HTTP code and a list with one response object per call, in the order
+        of the request list. Each response carries either "result" or "error", errors of
+        one call do not affect the others.
+        """
+        path = self.url_path + path
+        if not data:
+            return 200, []
+
+        bearer_auth = self._bearer_auth([call['method'] for call in data])
+        for call in data:
+            self._invalidate_id_cache(call['method'])
+            self._add_auth(call, bearer_auth)
+        hdrs = self._request_headers(bearer_auth)
+
+        request_ids = [call['id'] for call in data]
+        data = json_dumps(data)
+        try:
+            self._display_request(request_method, path)
+            code, value = self._send(path, data, hdrs, request_method)
+
+            try:
+                json_data = json_loads(value) if value else []
+            # JSONDecodeError only available on Python 3.5+
+            except ValueError:
+                raise ConnectionError("Invalid JSON response: %s" % self._shorten(value))
+
+            if isinstance(json_data, dict):
+                # The whole batch was rejected, e.g. because of invalid JSON
+                raise ConnectionError("REST API returned %s when sending %s" % (json_data.get("error", json_data), self._shorten(data)))
+
+            # The order of responses in a batch is not guaranteed, match them back by id
+            responses = dict((item.get('id'), item) for item in json_data)
+            results = []
+            for request_id in request_ids:
+                results.append(responses.get(request_id, {
+                    'id': request_id,
+                    'error': {'code': -32603, 'message': 'No response', 'data': 'No response returned for this call'}
+                }))
+
+            return code, results
+        except AnsibleConnectionFailure as e:
+            self.connection.queue_message("vvv", "AnsibleConnectionFailure: %s" % e)
+            if to_text("Could not connect to") in to_text(e):
+                raise
+            if to_text("401") in to_text(e):
+                return 401, "Authentication failure"
+            else:
+                return 404, "Object not found"
+
     def _display_request(self, request_method, path):
         self.connection.queue_message(
             "vvvv",
@@ -205,10 +722,19 @@ class HttpApi(HttpApiBase):
 
     def _response_to_json(self, response_text):
         try:
-            return json.loads(response_text) if response_text else {}
+            return json_loads(response_text) if response_text else {}
         # JSONDecodeError only available on Python 3.5+
         except ValueError:
-            raise ConnectionError("Invalid JSON response: %s" % response_text)
+            raise ConnectionError("Invalid JSON response: %s" % self._shorten(response_text))
+
+    @staticmethod
+    def _shorten(data, limit=2048):
+        # requests like configuration.import and responses like configuration.export
+        # can be megabytes, only their beginning is useful in an error message
+        text = to_text(data[:limit], errors='surrogate_or_replace')
+        if len(data) > limit:
+            text += '... (%s bytes)' % len(data)
+        return text
 
     @staticmethod
     def payload_builder(method_, auth_=None, **kwargs):
@@ -228,11 +228,70 @@ options:
     add_zabbix_groups:
       description:
        - If set to True, hosts will be added to groups based on their zabbix groups
+       - The host groups are requested with the hosts (C(selectGroups), or C(selectHostGroups) on Zabbix 6.2 and newer).
+         They are only exposed as a host variable when requested in I(host_zapi_query).
       type: bool
       default: false
+    page_size:
+      description:
+       - Number of hosts requested with a single C(host.get).
+       - Hosts are retrieved in pages of C(hostid) ranges and added to the inventory page by page,
+         which keeps the memory usage on the frontend and on the controller bounded on large installations.
+       - Set to C(0) to retrieve all hosts with a single request.
+      type: int
+      default: 1000
+      version_added: 2.2.0
+    max_workers:
+      description:
+       - Number of pages of hosts (see I(page_size)) requested concurrently.
+       - Each worker keeps its own persistent HTTP connection to the Zabbix frontend.
+       - Pages are added to the inventory in C(hostid) order, so the result does not depend on this setting.
+      type: int
+      default: 1
+      version_added: 2.2.0
+    hostvar_fields:
+      description:
+       - Host fields exposed as host variables, by default all fields returned by C(host.get) are exposed.
+       - Fields of the host object are also used as C(output) of the C(host.get) query, unless I(host_zapi_query) sets C(output).
+       - Properties returned by C(select*) queries, like C(interfaces) or C(parentTemplates), have to be listed
+         in order to be exposed.
+       - C(host) is always requested, as it is used as the inventory hostname.
+      type: list
+      elements: str
+      default: []
+      version_added: 2.2.0
+    nested_hostvars:
+      description:
+       - If set to True, the host fields are exposed as a single C(zbx) dictionary host variable
+         instead of one C(zbx_<field>) host variable per field.
+      type: bool
+      default: false
+      version_added: 2.2.0
+    incremental:
+      description:
+       - Refresh cached hosts incrementally instead of retrieving all hosts again, requires I(cache).
+       - Hosts created, updated or deleted since the last refresh are looked up in the audit log (C(auditlog.get),
+         which requires a Super admin user) and only these hosts are requested again.
+       - Changes that are not recorded in the audit log for the host itself, like renaming a host group or template,
+         are only picked up by the next full resynchronization (see I(full_resync_age)).
+       - I(cache_timeout) should not be lower than I(full_resync_age), as an expired cache always results in a full resynchronization.
+      type: bool
+      default: false
+      version_added: 2.2.0
+    full_resync_age:
+      description:
+       - With I(incremental), age in seconds after which all hosts are retrieved again instead of only the changed ones.
+      type: int
+      default: 3600
+      version_added: 2.2.0
 extends_documentation_fragment:
     - constructed
     - inventory_cache
+notes:
+    - With I(cache) enabled the raw C(host.get) result is cached, so changes to I(compose), I(groups) and I(keyed_groups)
+      do not require new API requests. The cache is refreshed when it expires (I(cache_timeout)), when
+      I(server_url) or I(host_zapi_query) changes or when running with C(--flush-cache).
+    - With I(incremental) enabled the cached hosts are refreshed on every run from the Zabbix audit log.
 """
 
 EXAMPLES = r"""
@@ -297,18 +356,82 @@ server_url: https://zabbix.com
 auth_token: 3bc3dc85e13e2431812e7a32fa8341cbcf378e5101356c015fdf2e35fd511b06
 validate_certs: false
 
+#Exposing only the fields used by the playbooks, as a single zbx dictionary
+plugin: community.zabbix.zabbix_inventory
+server_url: https://zabbix.com
+login_user: Admin
+login_password: password
+host_zapi_query:
+  selectInterfaces: ['ip', 'dns']
+hostvar_fields: ['hostid', 'name', 'status', 'interfaces']
+nested_hostvars: true
+compose:
+  ansible_host: zbx.interfaces[0].ip
+
+#Caching the Zabbix hosts for one hour
+plugin: community.zabbix.zabbix_inventory
+server_url: https://zabbix.com
+login_user: Admin
+login_password: password
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/zabbix_inventory
+cache_timeout: 3600
+
+#Refreshing only the hosts changed since the last run, with a full resynchronization every 6 hours
+plugin: community.zabbix.zabbix_inventory
+server_url: https://zabbix.com
+login_user: Admin
+login_password: password
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/zabbix_inventory
+cache_timeout: 21600
+incremental: true
+full_resync_age: 21600
+
 """
 
 from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable, to_safe_group_name
 import os
 import atexit
-import json
+import time
+import ssl
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from ansible.module_utils.urls import Request
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible.module_utils.compat.version import LooseVersion
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+from ansible_collections.community.zabbix.plugins.module_utils.capabilities import get_capabilities
+from ansible_collections.community.zabbix.plugins.module_utils.codec import gzip_decompress, json_dumps, json_loads
 from ansible.errors import AnsibleParserError
 
 
+# host.get select* parameters and the host property they return
+SELECT_FIELDS = {
+    'selectApplications': 'applications',
+    'selectDashboards': 'dashboards',
+    'selectDiscoveries': 'discoveries',
+    'selectDiscoveryRule': 'discoveryRule',
+    'selectGraphs': 'graphs',
+    'selectGroups': 'groups',
+    'selectHostDiscovery': 'hostDiscovery',
+    'selectHostGroups': 'hostgroups',
+    'selectHttpTests': 'httpTests',
+    'selectInheritedTags': 'inheritedTags',
+    'selectInterfaces': 'interfaces',
+    'selectInventory': 'inventory',
+    'selectItems': 'items',
+    'selectMacros': 'macros',
+    'selectParentTemplates': 'parentTemplates',
+    'selectTags': 'tags',
+    'selectTriggers': 'triggers',
+    'selectValueMaps': 'valuemaps',
+}
+
+
 class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     NAME = 'community.zabbix.zabbix_inventory'
@@ -317,6 +440,11 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         super().__init__()
         self.auth = ''
         self.zabbix_verion = ''
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._groups_field = None
+        self._hidden_fields = []
 
     def api_request(self, method, params=None):
         # set proxy information if required
@@ -330,7 +458,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         validate_certs = self.get_option('validate_certs')
         timeout = self.get_option('timeout')
 
-        headers = {'Content-Type': 'application/json-rpc'}
+        headers = {'Content-Type': 'application/json-rpc', 'Accept-Encoding': 'gzip'}
         payload = {
             'jsonrpc': '2.0',
             'method': method,
@@ -342,7 +470,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             payload['params'] = params
 
         if self.auth != '':
-            if (LooseVersion(self.zabbix_version) >= LooseVersion('6.4')):
+            if self.capabilities.supports_bearer_auth:
                 headers['Authorization'] = 'Bearer ' + self.auth
             else:
                 payload['auth'] = self.auth
@@ -355,20 +483,68 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         )
         try:
             self.display.vvv("Sending request to {0}".format(api_url))
-            response = req.post(api_url, data=json.dumps(payload))
+            if not proxy:
+                body = self._keepalive_post(api_url, headers, json_dumps(payload))
+            else:
+                body = req.post(api_url, data=json_dumps(payload)).read()
+            return json_loads(gzip_decompress(body))
         except ValueError:
             raise AnsibleParserError("something went wrong with JSON loading")
         except (URLError, HTTPError) as error:
             raise AnsibleParserError(error)
 
-        return response
+    def _get_connection(self, api_url):
+        # one persistent connection per thread, http_client reconnects by itself once it was closed
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            url = urlparse(api_url)
+            timeout = self.get_option('timeout')
+            if url.scheme == 'https':
+                if self.get_option('validate_certs'):
+                    context = ssl.create_default_context()
+                else:
+                    context = ssl._create_unverified_context()
+                connection = http_client.HTTPSConnection(url.netloc, timeout=timeout, context=context)
+            else:
+                connection = http_client.HTTPConnection(url.netloc, timeout=timeout)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _keepalive_post(self, api_url, headers, data):
+        url = urlparse(api_url)
+        path = url.path + ('?' + url.query if url.query else '')
+        connection = self._get_connection(api_url)
+        for attempt in range(2):
+            try:
+                connection.request('POST', path, body=data, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http_client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as error:
+                # the server closed an idle keep-alive connection, retry once on a new one
+                connection.close()
+                if attempt:
+                    raise AnsibleParserError(error)
+                continue
+            except (http_client.HTTPException, OSError) as error:
+                connection.close()
+                raise AnsibleParserError(error)
+            if response.status >= 400:
+                raise AnsibleParserError("HTTP Error {0}: {1}".format(response.status, response.reason))
+            return body
+
+    def _close_connections(self):
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
 
     def get_version(self):
-        response = self.api_request(
+        res = self.api_request(
             'apiinfo.version'
         )
-        res = json.load(response)
         self.zabbix_version = res['result']
+        self.capabilities = get_capabilities(self.zabbix_version)
 
     def logout_zabbix(self):
         self.api_request(
@@ -386,14 +562,13 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         login_user = self.get_option('login_user')
         login_password = self.get_option('login_password')
-        response = self.api_request(
+        res = self.api_request(
             'user.login',
             {
                 "username": login_user,
                 "password": login_password
             }
         )
-        res = json.load(response)
         self.auth = res["result"]
 
     def verify_file(self, path):
@@ -406,6 +581,60 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                     'Skipping due to inventory source not ending in "zabbix_inventory.yaml" nor "zabbix_inventory.yml"')
         return valid
 
+    def get_hosts(self, zapi_query):
+        """Yield the hosts matching zapi_query, one page of at most page_size hosts at a time."""
+        page_size = self.get_option('page_size')
+        if not page_size:
+            res = self.api_request(
+                'host.get',
+                zapi_query
+            )
+            yield res['result']
+            return
+
+        # host.get has no range filter for hostid, so the matching hostids are requested first
+        # (a cheap query without any select*) and the hosts are then retrieved in hostid ranges.
+        id_query = dict((k, v) for k, v in zapi_query.items() if not k.startswith('select'))
+        id_query.update({'output': ['hostid'], 'sortfield': 'hostid', 'sortorder': 'ASC'})
+        res = self.api_request(
+            'host.get',
+            id_query
+        )
+        hostids = [host['hostid'] for host in res['result']]
+
+        pages = [hostids[start:start + page_size] for start in range(0, len(hostids), page_size)]
+        max_workers = max(self.get_option('max_workers'), 1)
+        if max_workers == 1 or len(pages) == 1:
+            for page in pages:
+                yield self._get_hosts_page(zapi_query, page)
+            return
+
+        # At most max_workers pages are in flight and they are yielded in order,
+        # so the inventory is the same as with sequential requests.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for page in pages:
+                pending.append(executor.submit(self._get_hosts_page, zapi_query, page))
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _get_hosts_page(self, zapi_query, hostids):
+        page_query = dict(zapi_query)
+        page_query.pop('limit', None)
+        page_query.update({
+            'hostids': hostids,
+            'sortfield': 'hostid',
+            'sortorder': 'ASC'
+        })
+        res = self.api_request(
+            'host.get',
+            page_query
+        )
+        self.display.vvv("Retrieved {0} hosts starting at hostid {1}".format(len(res['result']), hostids[0]))
+        return res['result']
+
     def parse(self, inventory, loader, path,
               cache=True):  # Plugin interface (2)
         super(InventoryModule, self).parse(inventory, loader, path)
@@ -416,24 +645,189 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         self.use_cache = self.get_option('cache') and cache
         self.update_cache = self.get_option('cache') and not cache
 
-        self.get_version()
-        self.login_zabbix()
         zapi_query = self.get_option('host_zapi_query')
-        response = self.api_request(
-            'host.get',
-            zapi_query
-        )
-        res = json.load(response)
-        content = res['result']
-
+        add_zabbix_groups = self.get_option('add_zabbix_groups')
+        hostvar_fields = self.get_option('hostvar_fields')
+
+        # The raw host.get result is cached, so that compose, groups and keyed_groups
+        # can be changed without querying Zabbix again. It is only used for the same query.
+        cached = None
+        if self.use_cache:
+            try:
+                cached = self._cache[self.cache_key]
+                if not (cached.get('server_url') == self.get_option('server_url') and cached.get('host_zapi_query') == zapi_query
+                        and cached.get('hostvar_fields', []) == hostvar_fields and (cached.get('groups_field') or not add_zabbix_groups)):
+                    cached = None
+            except (KeyError, AttributeError):
+                cached = None
+
+        incremental = self.get_option('incremental') and self.get_option('cache')
+        if cached is not None:
+            self._groups_field = cached.get('groups_field') if add_zabbix_groups else None
+            self._hidden_fields = cached.get('hidden_fields', [])
+            if not incremental:
+                self.display.vvv("Using cached Zabbix hosts")
+                self._populate(cached['hosts'])
+                return
+
+            if 'audit_clock' in cached and time.time() - cached.get('snapshot_time', 0) < self.get_option('full_resync_age'):
+                self.get_version()
+                self.login_zabbix()
+                try:
+                    content = self._refresh_hosts(cached, self._host_query(zapi_query))
+                finally:
+                    self._close_connections()
+                if content is not None:
+                    self._populate(content)
+                    cached['hosts'] = content
+                    self._cache[self.cache_key] = cached
+                    return
+
+        if not self.auth:
+            self.get_version()
+            self.login_zabbix()
+
+        host_query = self._host_query(zapi_query)
+
+        # Changes made while the hosts are retrieved are picked up by the next incremental refresh
+        snapshot_time = time.time()
+        audit_clock = self._last_audit_clock() if incremental else None
+
+        # hosts are added to the inventory as the pages arrive, they are only
+        # kept in memory afterwards if they have to be written to the cache
+        keep_hosts = self.use_cache or self.update_cache
+        content = []
+        try:
+            for page in self.get_hosts(host_query):
+                self._populate(page)
+                if keep_hosts:
+                    content.extend(page)
+        finally:
+            self._close_connections()
+
+        if keep_hosts:
+            self._cache[self.cache_key] = {
+                'server_url': self.get_option('server_url'),
+                'host_zapi_query': zapi_query,
+                'hostvar_fields': hostvar_fields,
+                'groups_field': self._groups_field,
+                'hidden_fields': self._hidden_fields,
+                'hosts': content
+            }
+            if audit_clock is not None:
+                self._cache[self.cache_key].update({
+                    'snapshot_time': snapshot_time,
+                    'audit_clock': audit_clock
+                })
+
+    def _auditlog(self, params):
+        """Return the audit log records of host changes or None if they cannot be retrieved."""
+        query = {
+            'output': ['clock', 'action', 'resourceid'],
+            # resourcetype 4: host, action 0: add, 1: update, 2: delete
+            'filter': {'resourcetype': 4, 'action': [0, 1, 2]}
+        }
+        query.update(params)
+        res = self.api_request('auditlog.get', query)
+        if 'error' in res:
+            self.display.warning("Unable to read the Zabbix audit log, retrieving all hosts: {0}".format(res['error'].get('data')))
+            return None
+        return res['result']
+
+    def _last_audit_clock(self):
+        records = self._auditlog({'sortfield': 'clock', 'sortorder': 'DESC', 'limit': 1})
+        if records is None:
+            return None
+        return int(records[0]['clock']) if records else 0
+
+    def _refresh_hosts(self, cached, host_query):
+        """
+        Return the cached hosts updated with the hosts changed since the last refresh,
+        or None if a full resynchronization is needed.
+        """
+        records = self._auditlog({'time_from': cached['audit_clock'], 'sortfield': 'clock', 'sortorder': 'ASC'})
+        if records is None:
+            return None
+
+        hosts = dict((host['hostid'], host) for host in cached['hosts'])
+        changed = []
+        for record in records:
+            hostid = record['resourceid']
+            # created or updated hosts are requested again, hosts that no longer match the query are dropped
+            hosts.pop(hostid, None)
+            if record['action'] != '2' and hostid not in changed:
+                changed.append(hostid)
+            elif record['action'] == '2' and hostid in changed:
+                changed.remove(hostid)
+            cached['audit_clock'] = max(cached['audit_clock'], int(record['clock']))
+
+        self.display.vvv("Refreshing {0} changed Zabbix hosts".format(len(changed)))
+        page_size = self.get_option('page_size') or len(changed)
+        for start in range(0, len(changed), page_size):
+            for host in self._get_hosts_page(host_query, changed[start:start + page_size]):
+                hosts[host['hostid']] = host
+
+        return sorted(hosts.values(), key=lambda host: int(host['hostid']))
+
+    def _host_query(self, zapi_query):
+        """
+        Return the host.get query, with the output limited to hostvar_fields and the host groups
+        names requested when add_zabbix_groups is set, so that the groups are built from the same
+        request as the host variables.
+        """
+        self._groups_field = None
+        self._hidden_fields = []
+        host_query = dict(zapi_query)
+
+        hostvar_fields = self.get_option('hostvar_fields')
+        if hostvar_fields and host_query.get('output', 'extend') == 'extend':
+            selected = [SELECT_FIELDS.get(key) for key in host_query if key.startswith('select')]
+            host_query['output'] = ['host'] + [field for field in hostvar_fields if field not in selected and field != 'host']
+
+        # the incremental refresh replaces cached hosts by hostid
+        output = host_query.get('output', 'extend')
+        if self.get_option('incremental') and isinstance(output, list) and 'hostid' not in output:
+            host_query['output'] = output + ['hostid']
+            self._hidden_fields.append('hostid')
+
+        if not self.get_option('add_zabbix_groups'):
+            return host_query
+
+        if self.capabilities.split_template_groups:
+            select, self._groups_field = 'selectHostGroups', 'hostgroups'
+        else:
+            select, self._groups_field = 'selectGroups', 'groups'
+
+        requested = host_query.get(select)
+        if not requested:
+            # not asked for in host_zapi_query, so not exposed as a host variable either
+            host_query[select] = ['name']
+            self._hidden_fields.append(self._groups_field)
+        elif requested != 'extend':
+            if not isinstance(requested, list):
+                requested = [requested]
+            if 'name' not in requested:
+                host_query[select] = requested + ['name']
+        return host_query
+
+    def _populate(self, content):
         strict = self.get_option('strict')
+        hostvar_fields = self.get_option('hostvar_fields')
+        nested_hostvars = self.get_option('nested_hostvars')
 
         for record in content:
             # add host to inventory
             host_name = self.inventory.add_host(record['host'])
             # set variables for host
-            for k in record.keys():
-                self.inventory.set_variable(host_name, 'zbx_%s' % k, record[k])
+            if hostvar_fields:
+                hostvars = dict((k, record[k]) for k in hostvar_fields if k in record)
+            else:
+                hostvars = dict((k, v) for k, v in record.items() if k not in self._hidden_fields)
+            if nested_hostvars:
+                self.inventory.set_variable(host_name, 'zbx', hostvars)
+            else:
+                for k, v in hostvars.items():
+                    self.inventory.set_variable(host_name, 'zbx_%s' % k, v)
 
             # added for compose vars and keyed groups
             self._set_composite_vars(
@@ -443,13 +837,9 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             self._add_host_to_composed_groups(self.get_option('groups'), dict(), host_name, strict)
             self._add_host_to_keyed_groups(self.get_option('keyed_groups'), dict(), host_name, strict)
 
-        # organize inventory by zabbix groups
-        if self.get_option('add_zabbix_groups'):
-            content = self._zapi.host.get({'selectGroups': ['name']})
-            for record in content:
-                host_name = record['host']
-                if len(record['groups']) >= 1:
-                    for group in record['groups']:
-                        group_name = to_safe_group_name(group['name'])
-                        self.inventory.add_group(group_name)
-                        self.inventory.add_child(group_name, host_name)
+            # organize inventory by zabbix groups
+            if self._groups_field:
+                for group in record.get(self._groups_field, []):
+                    group_name = to_safe_group_name(group['name'])
+                    self.inventory.add_group(group_name)
+                    self.inventory.add_child(group_name, host_name)
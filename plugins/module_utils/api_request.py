@@ -10,12 +10,148 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+import hashlib
+import json
+import time
+
 from uuid import uuid4
 
 from ansible.module_utils.urls import CertificateError
 from ansible.module_utils.connection import ConnectionError
 from ansible.module_utils.connection import Connection
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
+
+from ansible_collections.community.zabbix.plugins.module_utils.codec import json_dumps
+
+
+# object type: other object types whose "get" results may change when it is written,
+# e.g. host.update changes the results of hostinterface.get or of hostgroup.get with "hostids"
+CACHE_DEPENDENCIES = {
+    "host": ("hostgroup", "hostinterface", "usermacro", "template", "item", "trigger", "graph", "discoveryrule",
+             "httptest", "event", "problem", "maintenance", "proxy"),
+    "hostgroup": ("host", "template", "maintenance"),
+    "hostinterface": ("host", "item"),
+    "template": ("host", "hostgroup", "templategroup", "usermacro", "item", "trigger", "graph", "discoveryrule", "httptest"),
+    "templategroup": ("template",),
+    "usermacro": ("host", "template"),
+    "user": ("usergroup", "mediatype"),
+    "usergroup": ("user",),
+    "mediatype": ("user", "action"),
+    "item": ("host", "template", "trigger", "graph"),
+    "trigger": ("host", "template", "event", "problem"),
+    "event": ("problem", "trigger"),
+    "problem": ("event", "trigger"),
+    "proxy": ("host",),
+    "maintenance": ("host",),
+}
+
+# API methods which do not modify anything
+READ_ACTIONS = ("get", "export", "version", "checkAuthentication")
+
+# object types read page by page and never twice with the same parameters, caching them only costs memory
+UNCACHED_OBJECT_TYPES = ("problem",)
+
+
+class ZabbixApiCache(object):
+    """
+    Read-through cache of the "<object>.get" results of a module run.
+
+    Entries are keyed on the method and a canonical form of the parameters. Any other call
+    to an object type (create, update, delete, mass*, ...) drops the cached results of that
+    object type and of the object types depending on it (CACHE_DEPENDENCIES), configuration.import
+    drops everything. Results are copied in and out, so callers may modify them.
+
+    There is a single instance per module, shared by all ZabbixApiRequest objects of the module.
+    """
+    def __init__(self):
+        # {object type: {key: result}}
+        self.entries = {}
+
+    @staticmethod
+    def is_cacheable(method):
+        object_type, dummy, action = method.partition(".")
+        return action == "get" and object_type not in UNCACHED_OBJECT_TYPES
+
+    @staticmethod
+    def is_write(method):
+        return method.partition(".")[2] not in READ_ACTIONS
+
+    @staticmethod
+    def _key(method, params):
+        canonical = json.dumps([method, params], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(to_bytes(canonical)).hexdigest()
+
+    def lookup(self, method, params):
+        """Return (True, result) if the call is cached, (False, None) otherwise."""
+        entries = self.entries.get(method.partition(".")[0], {})
+        key = self._key(method, params)
+        if key not in entries:
+            return False, None
+        return True, copy.deepcopy(entries[key])
+
+    def store(self, method, params, result):
+        self.entries.setdefault(method.partition(".")[0], {})[self._key(method, params)] = copy.deepcopy(result)
+
+    def invalidate(self, method):
+        object_type = method.partition(".")[0]
+        if object_type == "configuration":
+            self.entries = {}
+            return
+        for dependent in (object_type,) + CACHE_DEPENDENCIES.get(object_type, ()):
+            self.entries.pop(dependent, None)
+
+
+class ZabbixApiStats(object):
+    """
+    Records every API call of a module run and adds a summary as "api_stats" to the module result.
+
+    There is a single instance per module, shared by all ZabbixApiRequest objects of the module.
+    """
+    def __init__(self, module):
+        self.calls = []
+        self.cache_hits = {}
+        self._wrap_result(module, 'exit_json')
+        self._wrap_result(module, 'fail_json')
+
+    def _wrap_result(self, module, name):
+        result_method = getattr(module, name)
+
+        # some modules pass the message of fail_json() as a positional argument
+        def wrapper(*args, **kwargs):
+            kwargs.setdefault('api_stats', self.summary())
+            result_method(*args, **kwargs)
+
+        setattr(module, name, wrapper)
+
+    def record(self, method, params, response, status, duration):
+        # sizes of the JSON-encoded params and result, not of the HTTP bodies which may be batched or compressed
+        self.calls.append({
+            'method': method,
+            'params_json_size': len(json_dumps(params)),
+            'result_json_size': len(json_dumps(response)) if status == 200 else 0,
+            'status': status,
+            'time': round(duration, 6),
+        })
+
+    def record_cache_hit(self, method):
+        self.cache_hits[method] = self.cache_hits.get(method, 0) + 1
+
+    def summary(self):
+        methods = {}
+        for call in self.calls:
+            stats = methods.setdefault(call['method'], {'calls': 0, 'time': 0.0, 'params_json_size': 0, 'result_json_size': 0})
+            stats['calls'] += 1
+            stats['time'] = round(stats['time'] + call['time'], 6)
+            stats['params_json_size'] += call['params_json_size']
+            stats['result_json_size'] += call['result_json_size']
+        return {
+            'calls': len(self.calls),
+            'time': round(sum(call['time'] for call in self.calls), 6),
+            'methods': methods,
+            'call_log': self.calls,
+            'cache_hits': self.cache_hits,
+        }
 
 
 class ZabbixApiRequest(object):
@@ -23,16 +159,37 @@ class ZabbixApiRequest(object):
     def __init__(self, module):
         self.module = module
         self.connection = Connection(self.module._socket_path)
+        self.stats = self._get_stats()
+        self.cache = getattr(self.module, '_zabbix_api_cache', None)
+        if self.cache is None:
+            self.cache = self.module._zabbix_api_cache = ZabbixApiCache()
+
+    def _get_stats(self):
+        stats = getattr(self.module, '_zabbix_api_stats', None)
+        if stats is None:
+            try:
+                enabled = self.connection.get_option('zabbix_api_stats')
+            except ConnectionError:
+                enabled = False
+            stats = ZabbixApiStats(self.module) if enabled else False
+            self.module._zabbix_api_stats = stats
+        return stats
 
     def _httpapi_error_handle(self, payload=None):
+        start = time.time()
+        code = None
         try:
             code, response = self.connection.send_request(data=payload)
         except ConnectionError as e:
+            self._record(payload, 'error', None, start)
             self.module.fail_json(msg="connection error occurred: {0}".format(e))
         except CertificateError as e:
+            self._record(payload, 'error', None, start)
             self.module.fail_json(msg="certificate error occurred: {0}".format(e))
         except ValueError as e:
+            self._record(payload, 'error', None, start)
             self.module.fail_json(msg="certificate not found: {0}".format(e))
+        self._record(payload, code, response, start)
 
         if code == 404:
             if to_text(u"Object not found") in to_text(response) or to_text(
@@ -49,9 +206,117 @@ class ZabbixApiRequest(object):
 
         return response
 
+    def _cached_call(self, payload):
+        """Return the cached result of a "get" call or send the call, dropping cached results it may change."""
+        method = payload['method']
+        if self.cache.is_cacheable(method):
+            found, result = self.cache.lookup(method, payload['params'])
+            if found:
+                if self.stats:
+                    self.stats.record_cache_hit(method)
+                return result
+            result = self._httpapi_error_handle(payload=payload)
+            self.cache.store(method, payload['params'], result)
+            return result
+
+        if self.cache.is_write(method):
+            self.cache.invalidate(method)
+        return self._httpapi_error_handle(payload=payload)
+
+    def _record(self, payload, status, response, start):
+        if self.stats:
+            self.stats.record(payload['method'], payload['params'], response, status, time.time() - start)
+
     def api_version(self):
         return self.connection.api_version()
 
+    def call_many(self, calls):
+        """Execute several API calls in one JSON-RPC batch request.
+
+        Parameters:
+            calls: list of (method, params) tuples, e.g. [("host.get", {...}), ("template.get", {...})]
+
+        Returns:
+            list: results of the calls, in the same order as calls.
+            The module fails listing every call that returned an error.
+        """
+        if not calls:
+            return []
+
+        # cached "get" results are not sent again; results are only cached when
+        # the batch does not write anything, as the order of execution is unknown
+        cached = {}
+        payloads = []
+        writes = False
+        for index, (method, params) in enumerate(calls):
+            params = params or {}
+            if self.cache.is_write(method):
+                self.cache.invalidate(method)
+                writes = True
+            elif self.cache.is_cacheable(method):
+                found, result = self.cache.lookup(method, params)
+                if found:
+                    if self.stats:
+                        self.stats.record_cache_hit(method)
+                    cached[index] = result
+                    continue
+            payloads.append(self.payload_builder(method, params, reqid=str(index)))
+
+        if not payloads:
+            return [cached[index] for index in range(len(calls))]
+
+        start = time.time()
+        try:
+            code, response = self.connection.send_batch_request(data=payloads)
+        except ConnectionError as e:
+            self._record_batch(payloads, 'error', None, start)
+            self.module.fail_json(msg="connection error occurred: {0}".format(e))
+        except CertificateError as e:
+            self._record_batch(payloads, 'error', None, start)
+            self.module.fail_json(msg="certificate error occurred: {0}".format(e))
+        except ValueError as e:
+            self._record_batch(payloads, 'error', None, start)
+            self.module.fail_json(msg="certificate not found: {0}".format(e))
+        self._record_batch(payloads, code, response, start)
+
+        if not (code >= 200 and code < 300):
+            self.module.fail_json(
+                msg="Zabbix httpapi returned error {0} with message {1}".format(
+                    code, response
+                )
+            )
+
+        results = [cached.get(index) for index in range(len(calls))]
+        errors = []
+        for payload, item in zip(payloads, response):
+            index = int(payload['id'])
+            if "error" in item:
+                errors.append({"index": index, "method": calls[index][0], "error": item["error"]})
+            else:
+                results[index] = item.get("result")
+                if not writes and self.cache.is_cacheable(payload['method']):
+                    self.cache.store(payload['method'], payload['params'], results[index])
+
+        if errors:
+            self.module.fail_json(
+                msg="Zabbix API returned errors for {0} of {1} batched calls: {2}".format(
+                    len(errors), len(calls),
+                    "; ".join("{0} (call {1}): {2}".format(e["method"], e["index"], e["error"]) for e in errors)
+                ),
+                errors=errors
+            )
+
+        return results
+
+    def _record_batch(self, payloads, status, response, start):
+        if not self.stats:
+            return
+        # the calls of a batch share one HTTP request, its time is split between them
+        duration = (time.time() - start) / len(payloads)
+        for index, payload in enumerate(payloads):
+            item = response[index] if status == 200 else None
+            self.stats.record(payload['method'], payload['params'], item, status, duration)
+
     @staticmethod
     def payload_builder(method_, params, jsonrpc_version='2.0', reqid=str(uuid4()), **kwargs):
         req = {'jsonrpc': jsonrpc_version, 'method': method_, 'id': reqid}
@@ -79,6 +344,6 @@ class ZabbixApiSection(object):
             if not opts:
                 opts = {}
             payload = ZabbixApiRequest.payload_builder(_method, opts)
-            return self.parent._httpapi_error_handle(payload=payload)
+            return self.parent._cached_call(payload)
 
         return method
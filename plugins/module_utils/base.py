@@ -8,6 +8,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.community.zabbix.plugins.module_utils.api_request import ZabbixApiRequest
+from ansible_collections.community.zabbix.plugins.module_utils.capabilities import get_capabilities
+from ansible_collections.community.zabbix.plugins.module_utils.id_resolver import ZabbixIdResolver
 
 
 class ZabbixBase(object):
@@ -18,3 +20,5 @@ class ZabbixBase(object):
         self._module = module
         self._zapi = ZabbixApiRequest(module)
         self._zbx_api_version = self._zapi.api_version()
+        self._capabilities = get_capabilities(self._zbx_api_version)
+        self._resolver = ZabbixIdResolver(self._zapi)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from collections import namedtuple
+
+from ansible.module_utils.compat.version import LooseVersion
+
+
+# capability: first Zabbix version providing it
+ZABBIX_CAPABILITIES = (
+    # user.login takes "username" instead of "user"
+    ("username_login", "5.4"),
+    # regexp API
+    ("regexp_api", "6.0"),
+    # template groups are separate from host groups (templategroup API, selectHostGroups, *group_rights)
+    ("split_template_groups", "6.2"),
+    # userdirectory API, LDAP servers are no longer part of the authentication settings
+    ("user_directories", "6.2"),
+    # API tokens and session ids can be sent in an "Authorization: Bearer" header
+    ("supports_bearer_auth", "6.4"),
+    # user provisioning, SAML user directories and ldap_auth_enabled authentication setting
+    ("user_provisioning", "6.4"),
+    # script media type parameters are objects with sortorder and value
+    ("script_parameter_objects", "6.4"),
+    # proxy groups
+    ("proxy_groups", "7.0"),
+)
+
+
+class ZabbixCapabilities(namedtuple("ZabbixCapabilities", ["version"] + [name for name, dummy in ZABBIX_CAPABILITIES])):
+    """
+    Immutable set of feature flags of a Zabbix API version, see ZABBIX_CAPABILITIES.
+    Use get_capabilities() to obtain an instance.
+    """
+    __slots__ = ()
+
+
+_capabilities_cache = {}
+
+
+def get_capabilities(version):
+    """Return the ZabbixCapabilities of the Zabbix API version string, computed once per version."""
+    capabilities = _capabilities_cache.get(version)
+    if capabilities is None:
+        api_version = LooseVersion(version)
+        flags = dict((name, api_version >= LooseVersion(first)) for name, first in ZABBIX_CAPABILITIES)
+        capabilities = _capabilities_cache[version] = ZabbixCapabilities(version=version, **flags)
+    return capabilities
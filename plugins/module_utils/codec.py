@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import gzip
+import json
+
+from ansible.module_utils._text import to_bytes
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+if HAS_ORJSON:
+    JSON_CODEC = 'orjson'
+elif HAS_UJSON:
+    JSON_CODEC = 'ujson'
+else:
+    JSON_CODEC = 'json'
+
+
+def json_loads(data):
+    """
+    Decode JSON from bytes (or text) with the fastest available library.
+
+    Bytes are decoded directly, without creating a text copy first.
+    Raises ValueError on invalid JSON, whatever the library used.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if HAS_UJSON:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Encode obj as JSON bytes with the fastest available library."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers larger than 64 bits or non string keys, which the stdlib handles
+            pass
+    elif HAS_UJSON:
+        try:
+            return to_bytes(ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False))
+        except (TypeError, OverflowError):
+            pass
+    return to_bytes(json.dumps(obj))
+
+
+def gzip_compress(data):
+    """Return the gzip compressed bytes of data."""
+    return gzip.compress(data)
+
+
+def gzip_decompress(data):
+    """
+    Return the decompressed data if it is gzip compressed, unchanged otherwise.
+
+    Depending on the HTTP client, a response with "Content-Encoding: gzip" may already be
+    decompressed, so the data itself is checked. JSON never starts with the gzip magic bytes.
+    """
+    if data[:2] == GZIP_MAGIC:
+        return gzip.decompress(data)
+    return data
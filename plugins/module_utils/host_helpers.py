@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+
+import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
+
+
+HOST_GET_OUTPUT = [
+    "inventory_mode",
+    "hostid",
+    "proxy_hostid",
+    "host",
+    "status",
+    "lastaccess",
+    "ipmi_authtype",
+    "ipmi_privilege",
+    "ipmi_username",
+    "ipmi_password",
+    "maintenanceid",
+    "maintenance_status",
+    "maintenance_type",
+    "maintenance_from",
+    "name",
+    "flags",
+    "templateid",
+    "description",
+    "tls_connect",
+    "tls_accept",
+    "tls_issuer",
+    "tls_subject",
+    "proxy_address",
+    "auto_compress",
+    "custom_interfaces",
+    "uuid"
+]
+
+
+def construct_host_interfaces(module, interfaces):
+    """Ensures interfaces object is properly formatted before submitting it to API.
+
+    Args:
+        module: AnsibleModule used to report errors
+        interfaces (list): list of dictionaries for each interface present on the host.
+
+    Returns:
+        (interfaces, ip) - where interfaces is original list reformated into a valid format
+            and ip is any IP address found on interface of type agent (printing purposes only).
+    """
+    ip = ""
+    interface_types = {"agent": 1, "snmp": 2, "ipmi": 3, "jmx": 4}
+    type_to_port = {1: "10050", 2: "161", 3: "623", 4: "12345"}
+
+    for interface in interfaces:
+        if interface["type"] in list(interface_types.keys()):
+            interface["type"] = interface_types[interface["type"]]
+        else:
+            interface["type"] = int(interface["type"])
+
+        if interface["type"] == 1:
+            ip = interface.get("ip", "")
+
+        for key in ["ip", "dns"]:
+            if key not in interface or interface[key] is None:
+                interface[key] = ""
+
+        if "port" not in interface or interface["port"] is None:
+            interface["port"] = type_to_port.get(interface["type"], "")
+
+        if "bulk" in interface:
+            del interface["bulk"]
+
+        # Not handled in argument_spec with required_if since only SNMP interfaces are using details
+        if interface["type"] == 2:
+            if not interface["details"]:
+                module.fail_json(msg="Option 'details' required for SNMP interface {0}".format(interface))
+
+            i_details = interface["details"]
+            if i_details["version"] < 3 and not i_details.get("community", False):
+                module.fail_json(
+                    msg="Option 'community' is required in 'details' for SNMP interface {0}".format(interface))
+
+        else:
+            interface["details"] = {}
+
+    return (interfaces, ip)
+
+
+# Add all default values to all missing parameters for existing interfaces
+def update_exist_interfaces_with_defaults(exist_interfaces):
+
+    new_exist_interfaces = []
+    default_interface = {
+        "main": "0",
+        "useip": "0",
+        "ip": "",
+        "dns": "",
+        "port": ""
+    }
+    default_interface_details = {
+        "version": 2,
+        "bulk": 1,
+        "community": "",
+        "securityname": "",
+        "contextname": "",
+        "securitylevel": 0,
+        "authprotocol": 0,
+        "authpassphrase": "",
+        "privprotocol": 0,
+        "privpassphrase": ""
+    }
+    for interface in exist_interfaces:
+        new_interface = default_interface.copy()
+        new_interface.update(interface)
+        new_interface["details"] = default_interface_details.copy()
+        if "details" in interface:
+            new_interface["details"].update(interface["details"])
+        new_exist_interfaces.append(new_interface)
+
+    return new_exist_interfaces
+
+
+def normalize_exist_interfaces(exist_interfaces):
+    """Sorts interfaces returned by the API, adds defaults and converts integer properties from strings.
+
+    Args:
+        exist_interfaces (list): interfaces as returned by hostinterface.get or host.get with selectInterfaces.
+
+    Returns:
+        list: normalized interfaces, comparable with interfaces built by construct_host_interfaces().
+    """
+    exist_interfaces = sorted(exist_interfaces, key=lambda x: int(x["interfaceid"]))
+    exist_interfaces = update_exist_interfaces_with_defaults(exist_interfaces)
+
+    # Convert integer parameters from strings to ints
+    for idx, interface in enumerate(copy.deepcopy(exist_interfaces)):
+        for key in tuple(interface.keys()):
+            # fix values for properties
+            if key in ["useip", "main", "type", "bulk"]:
+                exist_interfaces[idx][key] = int(interface[key])
+            elif key == "details":
+                if not interface[key]:
+                    exist_interfaces[idx][key] = {}
+                else:
+                    for d_key in interface[key].keys():
+                        if d_key in ["version", "bulk", "securitylevel", "authprotocol", "privprotocol"]:
+                            exist_interfaces[idx][key][d_key] = int(interface[key][d_key])
+
+    return exist_interfaces
+
+
+def merge_host_interfaces(interfaces, exist_interfaces, force):
+    """Compiles the final list of interfaces of an existing host in place.
+
+    Requested interfaces matching an existing one get its "interfaceid" and "hostid" so that
+    Zabbix updates the existing interface instead of adding a new one. Without requested
+    interfaces the existing ones are kept. With force=False unmatched existing interfaces are
+    kept, otherwise they are overwritten by requested interfaces of the same type.
+
+    Args:
+        interfaces (list): requested interfaces as built by construct_host_interfaces().
+        exist_interfaces (list): existing interfaces as built by normalize_exist_interfaces().
+        force (bool): overwrite existing interfaces.
+
+    Returns:
+        list: interfaces
+    """
+    interfaces_copy = copy.deepcopy(interfaces)
+    found_in_interfaces = []
+    for idx, interface in enumerate(copy.deepcopy(exist_interfaces)):
+        interfaceid = interface["interfaceid"]
+        hostid = interface["hostid"]
+
+        if not interfaces_copy:
+            # Whe no interfaces specified, copy existing interfaces
+            interfaces.append(interface)
+            continue
+
+        # Find already configured interfaces in requested interfaces and compile final list of
+        # interfaces in "interfaces" variable. Every element of the list defines one interface.
+        # If an element has "interfaceid" field then Zabbix will update existing interface otherwise
+        # a new interface will be added.
+        found = False
+        for idx1, iface in enumerate(interfaces_copy):
+            diff_dict = {}
+            zabbix_utils.helper_cleanup_data(zabbix_utils.helper_compare_dictionaries(iface, interface, diff_dict))
+            if diff_dict == {}:
+                found = True
+                found_in_interfaces.append(iface)
+                interfaces[idx1]["interfaceid"] = interfaceid
+                interfaces[idx1]["hostid"] = hostid
+                break
+
+        if not found:
+            if not force:
+                interfaces.append(interface)
+            else:
+                # if force == True overwrite existing interfaces with provided interfaces with the same type
+                for idx1, iface in enumerate(interfaces_copy):
+                    if interface["type"] == iface["type"] and iface not in found_in_interfaces:
+                        found_in_interfaces.append(iface)
+                        interfaces[idx1]["interfaceid"] = interfaceid
+                        interfaces[idx1]["hostid"] = hostid
+                        break
+
+    return interfaces
+
+
+# check the exist_interfaces whether it equals the interfaces or not
+def check_interface_properties(exist_interfaces, interfaces):
+    # Find already configured interfaces in requested interfaces
+    if len(exist_interfaces) != len(interfaces):
+        return True
+
+    for iface in interfaces:
+        found = False
+        for e_int in exist_interfaces:
+            diff_dict = {}
+            zabbix_utils.helper_cleanup_data(zabbix_utils.helper_compare_dictionaries(iface, e_int, diff_dict))
+            if diff_dict == {}:
+                found = True
+                break
+
+    if interfaces and not found:
+        return True
+
+    return False
+
+
+def normalize_macro_name(macro_name):
+    # Zabbix handles macro names in upper case characters
+    if ":" in macro_name:
+        macro_name = ":".join([macro_name.split(":")[0].upper(), ":".join(macro_name.split(":")[1:])])
+    else:
+        macro_name = macro_name.upper()
+
+    # Valid format for macro is {$MACRO}
+    if not macro_name.startswith("{$"):
+        macro_name = "{$" + macro_name
+    if not macro_name.endswith("}"):
+        macro_name = macro_name + "}"
+
+    return macro_name
+
+
+def normalize_host_macros(macros):
+    """Converts macros to zabbix native format - {$MACRO} and numeric type, in place."""
+    for macro in macros or []:
+        macro["macro"] = normalize_macro_name(macro["macro"])
+
+        if "type" in macro:
+            if macro["type"] == "text":
+                macro["type"] = "0"
+            elif macro["type"] == "secret":
+                macro["type"] = "1"
+
+    return macros
+
+
+def merge_host_macros(macros, existing_macros):
+    """Adds existing macros, which are not present in macros, to macros in place.
+
+    Macros not present in host.update will be removed if we dont copy them when force=no.
+    """
+    for macro in existing_macros:
+        macro.pop("hostmacroid", None)
+        macro.pop("hostid", None)
+        macro.pop("automatic", None)
+        found = False
+        for idx1, prov_macro in enumerate(macros):
+            diff_dict = {}
+            zabbix_utils.helper_compare_dictionaries(prov_macro, macro, diff_dict)
+            if diff_dict == {}:
+                found = True
+                break
+        if found:
+            macros[idx1] = macro
+        else:
+            macros.append(macro)
+
+    return macros
+
+
+def merge_host_tags(tags, existing_tags):
+    """Adds existing tags, which are not present in tags, to tags in place.
+
+    Tags not present in host.update will be removed if we dont copy them when force=no.
+    """
+    provided_tags = [t["tag"] for t in tags]
+    for tag in existing_tags:
+        if tag["tag"] not in provided_tags:
+            tags.append(tag)
+
+    return tags
+
+
+def inventory_mode_numeric(inventory_mode):
+    if inventory_mode == "automatic":
+        return int(1)
+    elif inventory_mode == "manual":
+        return int(0)
+    elif inventory_mode == "disabled":
+        return int(-1)
+    return inventory_mode
+
+
+def get_host_changes(host, exist_interfaces, exist_group_ids, exist_template_ids, group_ids, status, interfaces,
+                     template_ids, proxy_id, visible_name, description, inventory_mode, inventory_zabbix,
+                     tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject, tls_connect, ipmi_authtype,
+                     ipmi_privilege, ipmi_username, ipmi_password, macros, tags):
+    """Compares an existing host with the requested properties.
+
+    Args:
+        host (dict): existing host as returned by host.get.
+        exist_interfaces (list): existing interfaces as built by normalize_exist_interfaces().
+        exist_group_ids (list): existing host groups as [{"groupid": ...}].
+        exist_template_ids (list): IDs of templates linked to the existing host.
+
+    Returns:
+        list: names of the properties which differ, empty if the host is up to date.
+            One of groups, status, interfaces, templates, proxy, name, description,
+            inventory_mode, inventory, tls, ipmi, macros, tags.
+    """
+    changes = []
+
+    if sorted(group_ids, key=lambda k: k["groupid"]) != sorted(exist_group_ids, key=lambda k: k["groupid"]):
+        changes.append("groups")
+
+    if int(status) != int(host["status"]):
+        changes.append("status")
+
+    if check_interface_properties(exist_interfaces, interfaces):
+        changes.append("interfaces")
+
+    if set(list(template_ids)) != set(exist_template_ids):
+        changes.append("templates")
+
+    if int(host["proxy_hostid"]) != int(proxy_id):
+        changes.append("proxy")
+
+    # Check whether the visible_name has changed; Zabbix defaults to the technical hostname if not set.
+    if visible_name:
+        if host["name"] != visible_name:
+            changes.append("name")
+
+    # Only compare description if it is given as a module parameter
+    if description:
+        if host["description"] != description:
+            changes.append("description")
+
+    if inventory_mode:
+        if int(host["inventory_mode"]) != inventory_mode_numeric(inventory_mode):
+            changes.append("inventory_mode")
+
+    if inventory_zabbix:
+        proposed_inventory = copy.deepcopy(host["inventory"])
+        proposed_inventory.update(inventory_zabbix)
+        if proposed_inventory != host["inventory"]:
+            changes.append("inventory")
+
+    tls_changed = False
+    if tls_accept is not None and "tls_accept" in host:
+        if int(host["tls_accept"]) != tls_accept:
+            tls_changed = True
+
+    # in Zabbix >= 5.4 these parameters are write-only and are not returned in host.get response
+    if tls_psk_identity is not None or tls_psk is not None:
+        tls_changed = True
+
+    if tls_issuer is not None and "tls_issuer" in host:
+        if host["tls_issuer"] != tls_issuer:
+            tls_changed = True
+
+    if tls_subject is not None and "tls_subject" in host:
+        if host["tls_subject"] != tls_subject:
+            tls_changed = True
+
+    if tls_connect is not None and "tls_connect" in host:
+        if int(host["tls_connect"]) != tls_connect:
+            tls_changed = True
+    if tls_changed:
+        changes.append("tls")
+
+    ipmi_changed = False
+    if ipmi_authtype is not None:
+        if int(host["ipmi_authtype"]) != ipmi_authtype:
+            ipmi_changed = True
+    if ipmi_privilege is not None:
+        if int(host["ipmi_privilege"]) != ipmi_privilege:
+            ipmi_changed = True
+    if ipmi_username is not None:
+        if host["ipmi_username"] != ipmi_username:
+            ipmi_changed = True
+    if ipmi_password is not None:
+        if host["ipmi_password"] != ipmi_password:
+            ipmi_changed = True
+    if ipmi_changed:
+        changes.append("ipmi")
+
+    # hostmacroid and hostid are present in every item of host["macros"] and need to be removed
+    if macros is not None and "macros" in host:
+        t_macros = copy.deepcopy(macros)  # make copy to prevent change in original data
+        for macro in host["macros"]:
+            macro.pop("hostid", False)
+            macro.pop("hostmacroid", False)
+
+        diff = []
+        zabbix_utils.helper_compare_lists(t_macros, host["macros"], diff)
+        if diff != []:
+            changes.append("macros")
+
+    if tags is not None and "tags" in host:
+        if sorted(tags, key=lambda k: k["tag"]) != sorted(host["tags"], key=lambda k: k["tag"]):
+            changes.append("tags")
+
+    return changes
+
+
+def get_host_update_params(host_id, changes, discovered_host, group_ids, status, interfaces, template_ids,
+                           exist_template_ids, proxy_id, visible_name, description, inventory_mode, inventory_zabbix,
+                           tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject, tls_connect, ipmi_authtype,
+                           ipmi_privilege, ipmi_username, ipmi_password, macros, tags):
+    """Builds the host.update parameters of the changed properties of a host.
+
+    Properties which are not listed in changes are not sent, so that e.g. template linkage
+    is not recomputed by Zabbix when templates did not change.
+
+    Args:
+        host_id (str): ID of the existing host.
+        changes (list): names of the changed properties, as returned by get_host_changes().
+        discovered_host (bool): whether the host was discovered via a Discovery Rule,
+            only a few of its properties can be changed.
+        exist_template_ids (list): IDs of templates linked to the existing host.
+
+    Returns:
+        dict: parameters of host.update.
+    """
+    parameters = {"hostid": host_id}
+    if "status" in changes:
+        parameters["status"] = status
+    if not discovered_host:
+        if "groups" in changes:
+            parameters["groups"] = group_ids
+        if "interfaces" in changes and interfaces:
+            parameters["interfaces"] = interfaces
+        if "proxy" in changes and proxy_id >= 0:
+            parameters["proxy_hostid"] = proxy_id
+        if "name" in changes:
+            parameters["name"] = visible_name
+        if "description" in changes:
+            parameters["description"] = description
+        if "tls" in changes:
+            if tls_connect:
+                parameters["tls_connect"] = tls_connect
+            if tls_accept:
+                parameters["tls_accept"] = tls_accept
+            if tls_psk_identity is not None:
+                parameters["tls_psk_identity"] = tls_psk_identity
+            if tls_psk is not None:
+                parameters["tls_psk"] = tls_psk
+            if tls_issuer is not None:
+                parameters["tls_issuer"] = tls_issuer
+            if tls_subject is not None:
+                parameters["tls_subject"] = tls_subject
+        if "ipmi" in changes:
+            # the Zabbix API resets absent ipmi_* options to their defaults
+            if ipmi_authtype is not None:
+                parameters["ipmi_authtype"] = ipmi_authtype
+            if ipmi_privilege is not None:
+                parameters["ipmi_privilege"] = ipmi_privilege
+            if ipmi_username is not None:
+                parameters["ipmi_username"] = ipmi_username
+            if ipmi_password is not None:
+                parameters["ipmi_password"] = ipmi_password
+    if "macros" in changes:
+        parameters["macros"] = macros
+    if "tags" in changes:
+        parameters["tags"] = tags
+    if "templates" in changes:
+        # link new templates, unlink and clear templates no longer requested
+        template_ids = set(template_ids)
+        parameters["templates"] = [{"templateid": template_id} for template_id in template_ids]
+        parameters["templates_clear"] = [{"templateid": template_id} for template_id in set(exist_template_ids).difference(template_ids)]
+    if "inventory_mode" in changes:
+        # watch for - https://support.zabbix.com/browse/ZBX-6033
+        parameters["inventory_mode"] = inventory_mode_numeric(inventory_mode)
+    if "inventory" in changes:
+        parameters["inventory"] = inventory_zabbix
+    return parameters
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.connection import ConnectionError
+
+
+# object type: (ID field, name field used in "filter")
+ID_LOOKUP_FIELDS = {
+    "action": ("actionid", "name"),
+    "drule": ("druleid", "name"),
+    "host": ("hostid", "host"),
+    "hostgroup": ("groupid", "name"),
+    "maintenance": ("maintenanceid", "name"),
+    "mediatype": ("mediatypeid", "name"),
+    "proxy": ("proxyid", "host"),
+    "script": ("scriptid", "name"),
+    "template": ("templateid", "host"),
+    "templategroup": ("groupid", "name"),
+    "user": ("userid", "username"),
+    "usergroup": ("usrgrpid", "name"),
+}
+
+
+class ZabbixIdResolver(object):
+    """
+    Resolves object names to IDs.
+
+    Names are queued with add() and resolved all at once with resolve(), which
+    sends a single "<object>.get" per object type, all of them in one JSON-RPC batch.
+    Resolved IDs are memoized in the httpapi connection, so they are shared by all
+    modules using the same persistent connection until zabbix_id_cache_ttl expires
+    or the objects are updated or deleted through the connection.
+    """
+    def __init__(self, zapi):
+        self._zapi = zapi
+        self._pending = {}
+        self._resolved = {}
+
+    def add(self, object_type, names):
+        """Queue object names to be resolved by the next resolve() call."""
+        if object_type not in ID_LOOKUP_FIELDS:
+            raise ValueError("Unsupported object type for ID lookup: %s" % object_type)
+
+        resolved = self._resolved.setdefault(object_type, {})
+        pending = self._pending.setdefault(object_type, [])
+        for name in names or []:
+            if name not in resolved and name not in pending:
+                pending.append(name)
+
+    def resolve(self):
+        """Resolve all queued names."""
+        calls = []
+        for object_type, names in self._pending.items():
+            if not names:
+                continue
+            ids = self._cache_lookup(object_type, names)
+            self._resolved[object_type].update(ids)
+            missing = [name for name in names if name not in ids]
+            if missing:
+                id_field, name_field = ID_LOOKUP_FIELDS[object_type]
+                calls.append((object_type, missing, (
+                    "%s.get" % object_type,
+                    {"output": [id_field, name_field], "filter": {name_field: missing}}
+                )))
+        self._pending = {}
+
+        if not calls:
+            return
+
+        results = self._zapi.call_many([call[2] for call in calls])
+        for (object_type, names, dummy), objects in zip(calls, results):
+            id_field, name_field = ID_LOOKUP_FIELDS[object_type]
+            ids = {}
+            for obj in objects:
+                if obj[name_field] in names and obj[name_field] not in ids:
+                    ids[obj[name_field]] = obj[id_field]
+            self._cache_store(object_type, ids)
+            # missing names are not remembered, they are looked up again as they may be created later on
+            self._resolved[object_type].update(ids)
+
+    def get_ids(self, object_type, names):
+        """Return a dict {name: id}; names that do not exist in Zabbix are omitted."""
+        self.add(object_type, names)
+        self.resolve()
+        resolved = self._resolved[object_type]
+        return dict((name, resolved[name]) for name in names or [] if name in resolved)
+
+    def get_id(self, object_type, name):
+        """Return the ID of the object name or None if it does not exist in Zabbix."""
+        return self.get_ids(object_type, [name]).get(name)
+
+    def _cache_lookup(self, object_type, names):
+        try:
+            return self._zapi.connection.id_cache_lookup(object_type, names) or {}
+        except ConnectionError:
+            return {}
+
+    def _cache_store(self, object_type, ids):
+        if not ids:
+            return
+        try:
+            self._zapi.connection.id_cache_store(object_type, ids)
+        except ConnectionError:
+            pass
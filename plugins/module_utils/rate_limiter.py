@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import errno
+import fcntl
+import json
+import os
+import time
+
+
+class ZabbixRateLimiter(object):
+    """
+    Limits the API requests sent to a Zabbix frontend by all the processes of the controller.
+
+    The state is kept in a JSON file locked with flock(), so it is shared by the persistent
+    connections of all forks:
+
+    - a token bucket refilled with rate tokens per second, holding at most burst tokens;
+      each request takes a token. Disabled when rate is 0.
+    - an AIMD (additive increase, multiplicative decrease) limit of concurrent requests between
+      1 and max_concurrency: it grows by 1 / limit after each fast successful request and is halved,
+      at most once per request duration, after a 5xx response, a timeout or connection error, or a
+      request taking more than latency_factor times the usual latency. Disabled when max_concurrency is 0.
+
+    Requests of processes which died are removed from the state when the next request is acquired.
+    """
+    # seconds between two checks of the state file while waiting
+    poll_interval = 0.05
+    # weight of slower requests in the usual latency, which otherwise follows the fastest requests
+    latency_drift = 0.01
+
+    def __init__(self, state_file, rate=0, burst=1, max_concurrency=0, latency_factor=3.0):
+        self.state_file = state_file
+        self.rate = float(rate or 0)
+        self.burst = max(1, burst or 1)
+        self.max_concurrency = max_concurrency or 0
+        self.latency_factor = latency_factor
+        self.pid = str(os.getpid())
+        self._acquired = None
+
+    def _update(self, update):
+        """Call update(state, now) with the state file locked, store and return the modified state."""
+        state_dir = os.path.dirname(self.state_file)
+        if not os.path.isdir(state_dir):
+            try:
+                os.makedirs(state_dir, 0o700)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+        fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+                now = time.time()
+                state.setdefault('tokens', float(self.burst))
+                state.setdefault('timestamp', now)
+                state.setdefault('limit', float(self.max_concurrency or 1))
+                state.setdefault('inflight', {})
+                state.setdefault('latency', None)
+                state.setdefault('decreased', 0.0)
+                result = update(state, now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return result
+
+    @staticmethod
+    def _is_alive(pid):
+        try:
+            os.kill(int(pid), 0)
+        except OSError as e:
+            return e.errno == errno.EPERM
+        return True
+
+    def _try_acquire(self, state, now):
+        """Return 0 if the request may be sent, else the number of seconds to wait."""
+        if self.rate:
+            state['tokens'] = min(float(self.burst), state['tokens'] + (now - state['timestamp']) * self.rate)
+        state['timestamp'] = now
+
+        inflight = state['inflight']
+        if self.max_concurrency:
+            state['limit'] = min(state['limit'], float(self.max_concurrency))
+            for pid in list(inflight):
+                if pid != self.pid and not self._is_alive(pid):
+                    del inflight[pid]
+            if sum(inflight.values()) >= int(state['limit']):
+                return self.poll_interval
+
+        if self.rate:
+            if state['tokens'] < 1:
+                return max(self.poll_interval, (1 - state['tokens']) / self.rate)
+            state['tokens'] -= 1
+
+        if self.max_concurrency:
+            inflight[self.pid] = inflight.get(self.pid, 0) + 1
+        return 0
+
+    def acquire(self):
+        """Wait until a request may be sent, return the number of seconds waited."""
+        start = time.time()
+        while True:
+            wait = self._update(self._try_acquire)
+            if not wait:
+                self._acquired = time.time()
+                return self._acquired - start
+            time.sleep(min(wait, 1.0))
+
+    def release(self, congested=False):
+        """
+        Record the end of the request started by the last acquire().
+        congested is True when the request failed because of the server: 5xx, timeout or connection error.
+        """
+        duration = time.time() - self._acquired
+
+        def update(state, now):
+            inflight = state['inflight']
+            if self.pid in inflight:
+                inflight[self.pid] -= 1
+                if inflight[self.pid] <= 0:
+                    del inflight[self.pid]
+            if not self.max_concurrency:
+                return
+
+            latency = state['latency']
+            slow = latency is not None and duration > self.latency_factor * latency
+            if congested or slow:
+                # decrease once per round trip, not for each of the concurrent requests which failed at the same time
+                if now - state['decreased'] >= duration:
+                    state['limit'] = max(1.0, state['limit'] / 2)
+                    state['decreased'] = now
+            else:
+                state['limit'] = min(float(self.max_concurrency), state['limit'] + 1 / state['limit'])
+
+            if not congested:
+                if latency is None or duration < latency:
+                    state['latency'] = duration
+                else:
+                    state['latency'] = latency + (duration - latency) * self.latency_drift
+
+        self._update(update)
+        return duration
@@ -797,6 +797,43 @@ class Zapi(ZabbixBase):
     def __init__(self, module, zbx=None):
         super(Zapi, self).__init__(module, zbx)
         self._zapi_wrapper = self
+        if zbx is not None:
+            # share resolved IDs with the wrapper
+            self._resolver = zbx._resolver
+
+    def prefetch_ids(self, operations, conditions):
+        """Resolve IDs of all objects referenced by operations and conditions at once.
+
+        Args:
+            operations: list of operations, recovery operations and update operations
+            conditions: list of filter conditions
+
+        """
+        for operation in operations:
+            self._resolver.add("user", operation.get("send_to_users"))
+            self._resolver.add("usergroup", operation.get("send_to_groups"))
+            self._resolver.add("hostgroup", operation.get("run_on_groups"))
+            self._resolver.add("hostgroup", operation.get("host_groups"))
+            self._resolver.add("template", operation.get("templates"))
+            self._resolver.add("host", [h for h in operation.get("run_on_hosts") or [] if str(h) != "0"])
+            if operation.get("script_name") is not None:
+                self._resolver.add("script", [operation["script_name"]])
+            if operation.get("media_type") is not None and str(operation["media_type"]).lower() != "all":
+                self._resolver.add("mediatype", [operation["media_type"]])
+
+        condition_object_types = {
+            "host_group": "hostgroup",
+            "host": "host",
+            "host_template": "template",
+            "discovery_rule": "drule",
+            "proxy": "proxy",
+        }
+        for condition in conditions:
+            object_type = condition_object_types.get(condition.get("type"))
+            if object_type is not None and condition.get("value") is not None:
+                self._resolver.add(object_type, [condition["value"]])
+
+        self._resolver.resolve()
 
     def check_if_action_exists(self, name):
         """Check if action exists.
@@ -854,15 +891,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            host_list = self._zapi.host.get({
-                "output": "extend",
-                "selectInventory": "extend",
-                "filter": {"host": [host_name]}
-            })
-            if len(host_list) < 1:
+            host_id = self._resolver.get_id("host", host_name)
+            if host_id is None:
                 self._module.fail_json(msg="Host not found: %s" % host_name)
             else:
-                return host_list[0]
+                return {"hostid": host_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get host '%s': %s" % (host_name, e))
 
@@ -877,14 +910,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            hostgroup_list = self._zapi.hostgroup.get({
-                "output": "extend",
-                "filter": {"name": [hostgroup_name]}
-            })
-            if len(hostgroup_list) < 1:
+            hostgroup_id = self._resolver.get_id("hostgroup", hostgroup_name)
+            if hostgroup_id is None:
                 self._module.fail_json(msg="Host group not found: %s" % hostgroup_name)
             else:
-                return hostgroup_list[0]
+                return {"groupid": hostgroup_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get host group '%s': %s" % (hostgroup_name, e))
 
@@ -899,14 +929,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            template_list = self._zapi.template.get({
-                "output": "extend",
-                "filter": {"host": [template_name]}
-            })
-            if len(template_list) < 1:
+            template_id = self._resolver.get_id("template", template_name)
+            if template_id is None:
                 self._module.fail_json(msg="Template not found: %s" % template_name)
             else:
-                return template_list[0]
+                return {"templateid": template_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get template '%s': %s" % (template_name, e))
 
@@ -943,14 +970,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            discovery_rule_list = self._zapi.drule.get({
-                "output": "extend",
-                "filter": {"name": [discovery_rule_name]}
-            })
-            if len(discovery_rule_list) < 1:
+            drule_id = self._resolver.get_id("drule", discovery_rule_name)
+            if drule_id is None:
                 self._module.fail_json(msg="Discovery rule not found: %s" % discovery_rule_name)
             else:
-                return discovery_rule_list[0]
+                return {"druleid": drule_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get discovery rule '%s': %s" % (discovery_rule_name, e))
 
@@ -1013,14 +1037,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            proxy_list = self._zapi.proxy.get({
-                "output": "extend",
-                "filter": {"host": [proxy_name]}
-            })
-            if len(proxy_list) < 1:
+            proxy_id = self._resolver.get_id("proxy", proxy_name)
+            if proxy_id is None:
                 self._module.fail_json(msg="Proxy not found: %s" % proxy_name)
             else:
-                return proxy_list[0]
+                return {"proxyid": proxy_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get proxy '%s': %s" % (proxy_name, e))
 
@@ -1034,19 +1055,14 @@ class Zapi(ZabbixBase):
             mediatype matching mediatype name
 
         """
-        filter = {"name": [mediatype_name]}
-
         try:
             if str(mediatype_name).lower() == "all":
                 return "0"
-            mediatype_list = self._zapi.mediatype.get({
-                "output": "extend",
-                "filter": filter
-            })
-            if len(mediatype_list) < 1:
+            mediatype_id = self._resolver.get_id("mediatype", mediatype_name)
+            if mediatype_id is None:
                 self._module.fail_json(msg="Media type not found: %s" % mediatype_name)
             else:
-                return mediatype_list[0]["mediatypeid"]
+                return mediatype_id
         except Exception as e:
             self._module.fail_json(msg="Failed to get mediatype '%s': %s" % (mediatype_name, e))
 
@@ -1061,15 +1077,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            filter = {"username": [user_name]}
-            user_list = self._zapi.user.get({
-                "output": "extend",
-                "filter": filter,
-            })
-            if len(user_list) < 1:
+            user_id = self._resolver.get_id("user", user_name)
+            if user_id is None:
                 self._module.fail_json(msg="User not found: %s" % user_name)
             else:
-                return user_list[0]
+                return {"userid": user_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get user '%s': %s" % (user_name, e))
 
@@ -1084,14 +1096,11 @@ class Zapi(ZabbixBase):
 
         """
         try:
-            usergroup_list = self._zapi.usergroup.get({
-                "output": "extend",
-                "filter": {"name": [usergroup_name]}
-            })
-            if len(usergroup_list) < 1:
+            usergroup_id = self._resolver.get_id("usergroup", usergroup_name)
+            if usergroup_id is None:
                 self._module.fail_json(msg="User group not found: %s" % usergroup_name)
             else:
-                return usergroup_list[0]
+                return {"usrgrpid": usergroup_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get user group '%s': %s" % (usergroup_name, e))
 
@@ -1109,14 +1118,11 @@ class Zapi(ZabbixBase):
         try:
             if script_name is None:
                 return {}
-            script_list = self._zapi.script.get({
-                "output": "extend",
-                "filter": {"name": [script_name]}
-            })
-            if len(script_list) < 1:
+            script_id = self._resolver.get_id("script", script_name)
+            if script_id is None:
                 self._module.fail_json(msg="Script not found: %s" % script_name)
             else:
-                return script_list[0]
+                return {"scriptid": script_id}
         except Exception as e:
             self._module.fail_json(msg="Failed to get script '%s': %s" % (script_name, e))
 
@@ -2218,6 +2224,10 @@ def main():
     action = Action(module)
 
     action_exists = zapi_wrapper.check_if_action_exists(name)
+    if state == "present":
+        zapi_wrapper.prefetch_ids(
+            (operations or []) + (recovery_operations or []) + (acknowledge_operations or []),
+            conditions or [])
     ops = Operations(module, zapi_wrapper)
     recovery_ops = RecoveryOperations(module, zapi_wrapper)
     acknowledge_ops = AcknowledgeOperations(module, zapi_wrapper)
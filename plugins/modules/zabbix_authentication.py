@@ -410,7 +410,6 @@ msg:
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
-from ansible.module_utils.compat.version import LooseVersion
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
 
@@ -490,14 +489,14 @@ class Authentication(ZabbixBase):
             if isinstance(http_case_sensitive, bool):
                 params["http_case_sensitive"] = str(int(http_case_sensitive))
 
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.4"):
+            if not self._capabilities.user_provisioning:
                 if isinstance(ldap_configured, bool):
                     params["ldap_configured"] = str(int(ldap_configured))
             else:
                 if isinstance(ldap_auth_enabled, bool):
                     params["ldap_auth_enabled"] = str(int(ldap_auth_enabled))
 
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.2"):
+            if not self._capabilities.user_directories:
                 if ldap_host:
                     params["ldap_host"] = ldap_host
 
@@ -533,7 +532,7 @@ class Authentication(ZabbixBase):
             if isinstance(saml_auth_enabled, bool):
                 params["saml_auth_enabled"] = str(int(saml_auth_enabled))
 
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.4"):
+            if not self._capabilities.user_provisioning:
                 if saml_idp_entityid:
                     params["saml_idp_entityid"] = saml_idp_entityid
 
@@ -654,12 +653,12 @@ class Authentication(ZabbixBase):
             future_authentication = current_authentication.copy()
             future_authentication.update(params)
 
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.4"):
+            if not self._capabilities.user_provisioning:
                 if (
                     current_authentication["ldap_configured"] == "0"
                     and future_authentication["ldap_configured"] == "1"
                 ):
-                    if LooseVersion(self._zbx_api_version) < LooseVersion("6.2"):
+                    if not self._capabilities.user_directories:
                         if (
                             not ldap_host
                             or not ldap_port
@@ -684,7 +683,7 @@ class Authentication(ZabbixBase):
                             msg="Please set ldap_userdirectory when you change a value of ldap_auth_enabled to true."
                         )
 
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.4"):
+            if not self._capabilities.user_provisioning:
                 if (
                     current_authentication["saml_auth_enabled"] == "0"
                     and future_authentication["saml_auth_enabled"] == "1"
@@ -26,12 +26,13 @@ options:
     macro_name:
         description:
             - Name of the global macro in zabbix native format C({$MACRO}) or simple format C(MACRO).
-        required: true
+            - Required if I(macros) is not used.
+        required: false
         type: str
     macro_value:
         description:
             - Value of the global macro.
-            - Required if I(state=present).
+            - Required if I(state=present) and I(macros) is not used.
         type: str
     macro_type:
         description:
@@ -62,6 +63,43 @@ options:
             - Only updates an existing macro if set to C(yes).
         default: "yes"
         type: bool
+    macros:
+        description:
+            - List of global macros to manage at once, instead of I(macro_name).
+            - All the global macros are read with a single API call, and created, updated or deleted with at most one API call each.
+            - I(state) and I(force) apply to all of them.
+        type: list
+        elements: dict
+        version_added: 2.2.0
+        suboptions:
+            macro_name:
+                description:
+                    - Name of the global macro in zabbix native format C({$MACRO}) or simple format C(MACRO).
+                required: true
+                type: str
+            macro_value:
+                description:
+                    - Value of the global macro.
+                    - Required if I(state=present).
+                type: str
+            macro_type:
+                description:
+                    - Type of the global macro.
+                choices: [text, secret, vault]
+                default: text
+                type: str
+            macro_description:
+                description:
+                    - Text Description of the global macro.
+                type: str
+                default: ""
+    exclusive:
+        description:
+            - Delete the global macros which are not in I(macros).
+            - Only used with I(macros) and I(state=present).
+        default: "no"
+        type: bool
+        version_added: 2.2.0
 
 notes:
     - This module returns changed=true when I(macro_type=secret).
@@ -120,9 +158,45 @@ EXAMPLES = r"""
   community.zabbix.zabbix_globalmacro:
     macro_name: "{$EXAMPLE.MACRO}"
     state: absent
+- name: Create or update several global macros at once
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_globalmacro:
+    macros:
+      - macro_name: EXAMPLE.MACRO
+        macro_value: Example value
+      - macro_name: "{$SNMP_COMMUNITY}"
+        macro_value: public
+        macro_type: secret
+    state: present
 """
 
 RETURN = r"""
+created:
+    description: Names of the macros created, when I(macros) is used.
+    returned: when I(macros) is used
+    type: list
+    elements: str
+    sample: ["{$EXAMPLE.MACRO}"]
+updated:
+    description: Names of the macros updated, when I(macros) is used.
+    returned: when I(macros) is used
+    type: list
+    elements: str
+    sample: ["{$SNMP_COMMUNITY}"]
+deleted:
+    description: Names of the macros deleted, when I(macros) is used.
+    returned: when I(macros) is used
+    type: list
+    elements: str
+    sample: []
 """
 
 
@@ -182,6 +256,53 @@ class GlobalMacro(ZabbixBase):
         except Exception as e:
             self._module.fail_json(msg="Failed to delete global macro %s: %s" % (macro_name, e))
 
+    # get all the global macros, as {macro name: macro}
+    def get_global_macros(self):
+        try:
+            all_global_macro_list = self._zapi.usermacro.get({"globalmacro": "true"})
+        except Exception as e:
+            self._module.fail_json(msg="Failed to get global macros: %s" % e)
+        return dict((global_macro_obj["macro"], global_macro_obj) for global_macro_obj in all_global_macro_list)
+
+    # compare the global macros with the wanted ones, return the macros to create, update and delete
+    def diff_global_macros(self, global_macros, macros, state, force, exclusive):
+        to_create = []
+        to_update = []
+        to_delete = []
+        for macro in macros:
+            global_macro_obj = global_macros.get(macro["macro"])
+            if state == "absent":
+                if global_macro_obj:
+                    to_delete.append(global_macro_obj)
+            elif not global_macro_obj:
+                to_create.append(macro)
+            elif force:
+                if global_macro_obj["type"] == "0" or global_macro_obj["type"] == "2":
+                    if (global_macro_obj["value"] == macro["value"] and global_macro_obj["type"] == macro["type"]
+                            and global_macro_obj["description"] == macro["description"]):
+                        continue
+                to_update.append(dict(macro, globalmacroid=global_macro_obj["globalmacroid"]))
+        if exclusive and state == "present":
+            macro_names = set(macro["macro"] for macro in macros)
+            to_delete.extend(global_macro_obj for macro_name, global_macro_obj in sorted(global_macros.items())
+                             if macro_name not in macro_names)
+        return to_create, to_update, to_delete
+
+    # create, update and delete global macros, with one API call each
+    def apply_global_macros(self, to_create, to_update, to_delete):
+        try:
+            if to_delete:
+                self._zapi.usermacro.deleteglobal([global_macro_obj["globalmacroid"] for global_macro_obj in to_delete])
+            if to_update:
+                self._zapi.usermacro.updateglobal(to_update)
+            if to_create:
+                self._zapi.usermacro.createglobal(to_create)
+        except Exception as e:
+            self._module.fail_json(msg="Failed to update global macros: %s" % e)
+
+
+MACRO_TYPES = {"text": "0", "secret": "1", "vault": "2"}
+
 
 def normalize_macro_name(macro_name):
     # Zabbix handles macro names in upper case characters
@@ -199,24 +320,67 @@ def normalize_macro_name(macro_name):
     return macro_name
 
 
+def bulk_global_macros(module):
+    state = module.params["state"]
+    macros = []
+    for macro in module.params["macros"]:
+        if state == "present" and macro["macro_value"] is None:
+            module.fail_json(msg="macro_value is required for macro %s when state is present" % macro["macro_name"])
+        macros.append({"macro": normalize_macro_name(macro["macro_name"]), "value": macro["macro_value"],
+                       "type": MACRO_TYPES[macro["macro_type"]], "description": macro["macro_description"]})
+
+    global_macro_class_obj = GlobalMacro(module)
+    global_macros = global_macro_class_obj.get_global_macros()
+    to_create, to_update, to_delete = global_macro_class_obj.diff_global_macros(
+        global_macros, macros, state, module.params["force"], module.params["exclusive"])
+
+    changed = bool(to_create or to_update or to_delete)
+    if changed and not module.check_mode:
+        global_macro_class_obj.apply_global_macros(to_create, to_update, to_delete)
+    module.exit_json(changed=changed,
+                     created=[macro["macro"] for macro in to_create],
+                     updated=[macro["macro"] for macro in to_update],
+                     deleted=[global_macro_obj["macro"] for global_macro_obj in to_delete])
+
+
 def main():
     argument_spec = zabbix_utils.zabbix_common_argument_spec()
     argument_spec.update(dict(
-        macro_name=dict(type="str", required=True),
+        macro_name=dict(type="str", required=False),
         macro_value=dict(type="str", required=False, no_log=True),
         macro_type=dict(type="str", default="text", choices=["text", "secret", "vault"]),
         macro_description=dict(type="str", default=""),
         state=dict(type="str", default="present", choices=["present", "absent"]),
-        force=dict(type="bool", default=True)
+        force=dict(type="bool", default=True),
+        macros=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                macro_name=dict(type="str", required=True),
+                macro_value=dict(type="str", required=False, no_log=True),
+                macro_type=dict(type="str", default="text", choices=["text", "secret", "vault"]),
+                macro_description=dict(type="str", default=""),
+            )),
+        exclusive=dict(type="bool", default=False)
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
         required_if=[
-            ["state", "present", ["macro_value"]]
+            ["state", "present", ["macro_value", "macros"], True]
+        ],
+        required_one_of=[
+            ["macro_name", "macros"]
+        ],
+        mutually_exclusive=[
+            ["macro_name", "macros"],
+            ["macro_value", "macros"]
         ],
         supports_check_mode=True
     )
 
+    if module.params["macros"] is not None:
+        bulk_global_macros(module)
+
     macro_name = normalize_macro_name(module.params["macro_name"])
     macro_value = module.params["macro_value"]
     macro_type = module.params["macro_type"]
@@ -87,12 +87,16 @@ triggers_problem:
                     description: If set to true return only acknowledged events
                     type: int
                 acknowledges:
-                    description: acknowledges informations
+                    description: acknowledges informations, empty for events which are not acknowledged
                     type: complex
                     contains:
                         alias:
+                            description: Account who acknowledge, same as I(username)
+                            type: str
+                        username:
                             description: Account who acknowledge
                             type: str
+                            version_added: 2.2.0
                         clock:
                             description: Time when the event was created (timestamp)
                             type: int
@@ -135,6 +139,11 @@ triggers_problem:
           value:
             description: Whether the trigger is in OK or problem state
             type: int
+truncated:
+    description: Whether I(limit) triggers were returned, more triggers may match.
+    returned: On success
+    type: bool
+    version_added: 2.2.0
 """
 
 DOCUMENTATION = """
@@ -167,6 +176,22 @@ options:
             - high
             - disaster
         type: str
+    problems_only:
+        description:
+            - Only request the triggers in problem state, I(triggers_ok) is then empty.
+            - Saves fetching all the triggers in OK state of large host groups.
+        required: false
+        default: false
+        type: bool
+        version_added: 2.2.0
+    limit:
+        description:
+            - Maximum number of triggers to return, the triggers which changed state most recently first.
+            - I(truncated) is true when the limit is reached.
+            - Combine with I(problems_only=true) to cap the number of triggers in problem state.
+        required: false
+        type: int
+        version_added: 2.2.0
 extends_documentation_fragment:
 - community.zabbix.zabbix
 
@@ -218,21 +243,28 @@ class Host(ZabbixBase):
             self._module.fail_json(msg="Hostgroup not found: %s" % group_names)
         return group_list
 
-    def get_triggers_by_group_id_in_problem_state(self, group_id, trigger_severity):
-        """ Get triggers in problem state from a groupid"""
+    def get_triggers_by_group_ids_in_problem_state(self, group_ids, trigger_severity, problems_only=False, limit=None):
+        """ Get triggers from a list of groupids, with the last event of each trigger"""
         output = "extend"
-        triggers_list = self._zapi.trigger.get({"output": output, "groupids": group_id,
-                                                "min_severity": trigger_severity})
-        return triggers_list
+        params = {"output": output, "groupids": group_ids, "min_severity": trigger_severity,
+                  "selectLastEvent": ["eventid", "clock", "acknowledged", "value"]}
+        if problems_only:
+            params["filter"] = {"value": 1}
+        if limit:
+            params.update({"limit": limit, "sortfield": "lastchange", "sortorder": "DESC"})
+        return self._zapi.trigger.get(params)
 
-    def get_last_event_by_trigger_id(self, triggers_id):
-        """ Get the last event from triggerid"""
-        output = ["eventid", "clock", "acknowledged", "value"]
-        select_acknowledges = ["clock", "alias", "message"]
-        event = self._zapi.event.get({"output": output, "objectids": triggers_id,
-                                      "select_acknowledges": select_acknowledges, "limit": 1, "sortfield": "clock",
-                                      "sortorder": "DESC"})
-        return event[0]
+    def get_acknowledges_by_event_ids(self, event_ids):
+        """ Get the acknowledges of each eventid"""
+        if not event_ids:
+            return {}
+        events = self._zapi.event.get({"output": ["eventid"], "eventids": event_ids,
+                                       "selectAcknowledges": ["clock", "message", "username"]})
+        for event in events:
+            for acknowledge in event["acknowledges"]:
+                # the user alias was renamed username in Zabbix 5.4
+                acknowledge["alias"] = acknowledge["username"]
+        return dict((event["eventid"], event["acknowledges"]) for event in events)
 
 
 def main():
@@ -244,6 +276,8 @@ def main():
             required=False,
             default="average",
             choices=["not_classified", "information", "warning", "average", "high", "disaster"]),
+        problems_only=dict(type="bool", required=False, default=False),
+        limit=dict(type="int", required=False),
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -252,31 +286,37 @@ def main():
 
     trigger_severity_map = {"not_classified": 0, "information": 1, "warning": 2, "average": 3, "high": 4, "disaster": 5}
     trigger_severity = trigger_severity_map[module.params["trigger_severity"]]
+    problems_only = module.params["problems_only"]
+    limit = module.params["limit"]
 
     hostgroup_name = module.params["hostgroup_name"]
 
     host = Host(module)
     host_groups = host.get_group_ids_by_group_names(hostgroup_name)
-    triggers = []
-
-    for host_group in host_groups:
-        host_group_id = host_group["groupid"]
-        host_group_triggers = host.get_triggers_by_group_id_in_problem_state(host_group_id, trigger_severity)
-        triggers = triggers + host_group_triggers
+    triggers = host.get_triggers_by_group_ids_in_problem_state(
+        [host_group["groupid"] for host_group in host_groups], trigger_severity, problems_only, limit)
 
     triggers_ok = []
     triggers_problem = []
     for trigger in triggers:
-        # tGet last event for trigger with problem value = 1
+        # Get last event for trigger with problem value = 1
         # https://www.zabbix.com/documentation/3.4/manual/api/reference/trigger/object
+        last_event = trigger.pop("lastEvent", [])
         if int(trigger["value"]) == 1:
-            event = host.get_last_event_by_trigger_id(trigger["triggerid"])
-            trigger["last_event"] = event
+            trigger["last_event"] = last_event
             triggers_problem.append(trigger)
         else:
             triggers_ok.append(trigger)
 
-    module.exit_json(ok=True, host_groups=host_groups, triggers_ok=triggers_ok, triggers_problem=triggers_problem)
+    acknowledges = host.get_acknowledges_by_event_ids(
+        [trigger["last_event"]["eventid"] for trigger in triggers_problem
+         if trigger["last_event"] and int(trigger["last_event"]["acknowledged"]) == 1])
+    for trigger in triggers_problem:
+        if trigger["last_event"]:
+            trigger["last_event"]["acknowledges"] = acknowledges.get(trigger["last_event"]["eventid"], [])
+
+    module.exit_json(ok=True, host_groups=host_groups, triggers_ok=triggers_ok, triggers_problem=triggers_problem,
+                     truncated=bool(limit) and len(triggers) >= limit)
 
 
 if __name__ == "__main__":
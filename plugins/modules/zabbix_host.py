@@ -431,26 +431,20 @@ EXAMPLES = r"""
 """
 
 
-import copy
-
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
 
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
+import ansible_collections.community.zabbix.plugins.module_utils.host_helpers as host_utils
 
 
 class Host(ZabbixBase):
-    # exist host
-    def is_host_exist(self, host_name):
-        result = self._zapi.host.get({"filter": {"host": host_name}})
-        return result
-
     # check if host group exists
     def check_host_group_exist(self, group_names):
+        group_ids = self._resolver.get_ids("hostgroup", group_names)
         for group_name in group_names:
-            result = self._zapi.hostgroup.get({"filter": {"name": group_name}})
-            if not result:
+            if group_name not in group_ids:
                 self._module.fail_json(msg="Hostgroup not found: %s" % group_name)
         return True
 
@@ -458,18 +452,17 @@ class Host(ZabbixBase):
         template_ids = []
         if template_list is None or len(template_list) == 0:
             return template_ids
+        resolved_ids = self._resolver.get_ids("template", template_list)
         for template in template_list:
-            template_list = self._zapi.template.get({"output": "extend", "filter": {"host": template}})
-            if len(template_list) < 1:
+            if template not in resolved_ids:
                 self._module.fail_json(msg="Template not found: %s" % template)
             else:
-                template_id = template_list[0]["templateid"]
-                template_ids.append(template_id)
+                template_ids.append(resolved_ids[template])
         return template_ids
 
     def add_host(self, host_name, group_ids, status, interfaces, proxy_id, visible_name, description, tls_connect,
                  tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject, ipmi_authtype, ipmi_privilege,
-                 ipmi_username, ipmi_password, macros, tags):
+                 ipmi_username, ipmi_password, macros, tags, template_ids, inventory_mode, inventory_zabbix):
         try:
             if self._module.check_mode:
                 self._module.exit_json(changed=True)
@@ -504,6 +497,12 @@ class Host(ZabbixBase):
                 parameters["macros"] = macros
             if tags is not None:
                 parameters["tags"] = tags
+            if template_ids:
+                parameters["templates"] = [{"templateid": template_id} for template_id in set(template_ids)]
+            if inventory_mode:
+                parameters["inventory_mode"] = self.inventory_mode_numeric(inventory_mode)
+            if inventory_zabbix:
+                parameters["inventory"] = inventory_zabbix
 
             host_list = self._zapi.host.create(parameters)
             if len(host_list) >= 1:
@@ -511,51 +510,23 @@ class Host(ZabbixBase):
         except Exception as e:
             self._module.fail_json(msg="Failed to create host %s: %s" % (host_name, e))
 
-    def update_host(self, host_name, group_ids, status, host_id, interfaces, exist_interface_list, proxy_id,
-                    visible_name, description, tls_connect, tls_accept, tls_psk_identity, tls_psk, tls_issuer,
-                    tls_subject, ipmi_authtype, ipmi_privilege, ipmi_username, ipmi_password, macros, tags, discovered_host):
+    def update_host(self, host_name, group_ids, status, host_id, interfaces, proxy_id, visible_name, description,
+                    tls_connect, tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject, ipmi_authtype,
+                    ipmi_privilege, ipmi_username, ipmi_password, macros, tags, template_ids, exist_template_ids,
+                    inventory_mode, inventory_zabbix, discovered_host, changes):
+        """Update all changed properties of the host with a single host.update request.
+
+        Properties which are not listed in changes (see check_all_properties()) are not sent,
+        see host_utils.get_host_update_params().
+        """
         try:
             if self._module.check_mode:
                 self._module.exit_json(changed=True)
-            if discovered_host:
-                # The host was discovered via Discovery Rule
-                parameters = {"hostid": host_id, "status": status}
-            else:
-                # A "plain" host
-                parameters = {"hostid": host_id, "groups": group_ids, "status": status}
-                if proxy_id >= 0:
-                    parameters["proxy_hostid"] = proxy_id
-                if visible_name:
-                    parameters["name"] = visible_name
-                if tls_connect:
-                    parameters["tls_connect"] = tls_connect
-                if tls_accept:
-                    parameters["tls_accept"] = tls_accept
-                if tls_psk_identity:
-                    parameters["tls_psk_identity"] = tls_psk_identity
-                if tls_psk:
-                    parameters["tls_psk"] = tls_psk
-                if tls_issuer:
-                    parameters["tls_issuer"] = tls_issuer
-                if tls_subject:
-                    parameters["tls_subject"] = tls_subject
-                if description:
-                    parameters["description"] = description
-                if ipmi_authtype:
-                    parameters["ipmi_authtype"] = ipmi_authtype
-                if ipmi_privilege:
-                    parameters["ipmi_privilege"] = ipmi_privilege
-                if ipmi_username:
-                    parameters["ipmi_username"] = ipmi_username
-                if ipmi_password:
-                    parameters["ipmi_password"] = ipmi_password
-                if interfaces:
-                    parameters["interfaces"] = interfaces
-            if macros is not None:
-                parameters["macros"] = macros
-            if tags is not None:
-                parameters["tags"] = tags
-
+            parameters = host_utils.get_host_update_params(
+                host_id, changes, discovered_host, group_ids, status, interfaces, template_ids, exist_template_ids,
+                proxy_id, visible_name, description, inventory_mode, inventory_zabbix, tls_accept, tls_psk_identity,
+                tls_psk, tls_issuer, tls_subject, tls_connect, ipmi_authtype, ipmi_privilege, ipmi_username,
+                ipmi_password, macros, tags)
             self._zapi.host.update(parameters)
         except Exception as e:
             self._module.fail_json(msg="Failed to update host %s: %s" % (host_name, e))
@@ -570,38 +541,27 @@ class Host(ZabbixBase):
 
     # get host by host name
     def get_host_by_host_name(self, host_name):
+        """Get the host with its interfaces, groups and linked templates in a single request.
+
+        Returns:
+            dict: the host, with host groups in "groups" regardless of the Zabbix version, or None
+                if the host does not exist
+        """
+        if self._capabilities.split_template_groups:
+            select_groups = "selectHostGroups"
+            groups_key = "hostgroups"
+        else:
+            select_groups = "selectGroups"
+            groups_key = "groups"
+
         params = {
-            "output": [
-                "inventory_mode",
-                "hostid",
-                "proxy_hostid",
-                "host",
-                "status",
-                "lastaccess",
-                "ipmi_authtype",
-                "ipmi_privilege",
-                "ipmi_username",
-                "ipmi_password",
-                "maintenanceid",
-                "maintenance_status",
-                "maintenance_type",
-                "maintenance_from",
-                "name",
-                "flags",
-                "templateid",
-                "description",
-                "tls_connect",
-                "tls_accept",
-                "tls_issuer",
-                "tls_subject",
-                "proxy_address",
-                "auto_compress",
-                "custom_interfaces",
-                "uuid"
-            ],
+            "output": host_utils.HOST_GET_OUTPUT,
             "selectInventory": "extend",
             "selectMacros": "extend",
             "selectTags": ["tag", "value"],
+            "selectInterfaces": "extend",
+            "selectParentTemplates": ["templateid"],
+            select_groups: ["groupid"],
             "filter": {
                 "host": [host_name]
             }
@@ -609,333 +569,57 @@ class Host(ZabbixBase):
 
         host_list = self._zapi.host.get(params)
         if len(host_list) < 1:
-            self._module.fail_json(msg="Host not found: %s" % host_name)
-        else:
-            return host_list[0]
+            return None
+
+        host = host_list[0]
+        host["groups"] = [{"groupid": group["groupid"]} for group in host.pop(groups_key, [])]
+        for interface in host["interfaces"]:
+            interface.setdefault("hostid", host["hostid"])
+        return host
 
     # get proxyid by proxy name
     def get_proxyid_by_proxy_name(self, proxy_name):
-        proxy_list = self._zapi.proxy.get({"output": "extend", "filter": {"host": [proxy_name]}})
-        if len(proxy_list) < 1:
+        proxy_id = self._resolver.get_id("proxy", proxy_name)
+        if proxy_id is None:
             self._module.fail_json(msg="Proxy not found: %s" % proxy_name)
         else:
-            return int(proxy_list[0]["proxyid"])
+            return int(proxy_id)
 
     # get group ids by group names
     def get_group_ids_by_group_names(self, group_names):
         if self.check_host_group_exist(group_names):
-            return self._zapi.hostgroup.get({"output": "extend", "filter": {"name": group_names}})
+            group_ids = self._resolver.get_ids("hostgroup", group_names)
+            return [{"groupid": group_id} for group_id in sorted(set(group_ids.values()))]
 
-    # get host groups ids by host id
-    def get_group_ids_by_host_id(self, host_id):
-        return self._zapi.hostgroup.get({"output": "extend", "hostids": host_id})
+    # get host groups ids by host
+    def get_group_ids_by_host(self, host):
+        return list(host["groups"])
 
-    # get host templates by host id
-    def get_host_templates_by_host_id(self, host_id):
-        template_ids = []
-        template_list = self._zapi.template.get({"output": "extend", "hostids": host_id})
-        for template in template_list:
-            template_ids.append(template["templateid"])
-        return template_ids
+    # get host templates by host
+    def get_host_templates_by_host(self, host):
+        return [template["templateid"] for template in host["parentTemplates"]]
 
     def construct_host_interfaces(self, interfaces):
-        """Ensures interfaces object is properly formatted before submitting it to API.
-
-        Args:
-            interfaces (list): list of dictionaries for each interface present on the host.
-
-        Returns:
-            (interfaces, ip) - where interfaces is original list reformated into a valid format
-                and ip is any IP address found on interface of type agent (printing purposes only).
-        """
-        ip = ""
-        interface_types = {"agent": 1, "snmp": 2, "ipmi": 3, "jmx": 4}
-        type_to_port = {1: "10050", 2: "161", 3: "623", 4: "12345"}
-
-        for interface in interfaces:
-            if interface["type"] in list(interface_types.keys()):
-                interface["type"] = interface_types[interface["type"]]
-            else:
-                interface["type"] = int(interface["type"])
-
-            if interface["type"] == 1:
-                ip = interface.get("ip", "")
-
-            for key in ["ip", "dns"]:
-                if key not in interface or interface[key] is None:
-                    interface[key] = ""
-
-            if "port" not in interface or interface["port"] is None:
-                interface["port"] = type_to_port.get(interface["type"], "")
-
-            if "bulk" in interface:
-                del interface["bulk"]
-
-            # Not handled in argument_spec with required_if since only SNMP interfaces are using details
-            if interface["type"] == 2:
-                if not interface["details"]:
-                    self._module.fail_json(msg="Option 'details' required for SNMP interface {0}".format(interface))
-
-                i_details = interface["details"]
-                if i_details["version"] < 3 and not i_details.get("community", False):
-                    self._module.fail_json(
-                        msg="Option 'community' is required in 'details' for SNMP interface {0}".format(interface))
-
-            else:
-                interface["details"] = {}
-
-        return (interfaces, ip)
+        return host_utils.construct_host_interfaces(self._module, interfaces)
 
     # check the exist_interfaces whether it equals the interfaces or not
     def check_interface_properties(self, exist_interfaces, interfaces):
-        # Find already configured interfaces in requested interfaces
-        if len(exist_interfaces) != len(interfaces):
-            return True
-
-        for iface in interfaces:
-            found = False
-            for e_int in exist_interfaces:
-                diff_dict = {}
-                zabbix_utils.helper_cleanup_data(zabbix_utils.helper_compare_dictionaries(iface, e_int, diff_dict))
-                if diff_dict == {}:
-                    found = True
-                    break
-
-        if interfaces and not found:
-            return True
-
-        return False
-
-    # get the status of host by host
-    def get_host_status_by_host(self, host):
-        return host["status"]
-
-    # check all the properties before link or clear template
-    def check_all_properties(self, host_id, group_ids, status, interfaces, template_ids,
+        return host_utils.check_interface_properties(exist_interfaces, interfaces)
+
+    # check all the properties of the host, returns the list of changed properties
+    def check_all_properties(self, group_ids, status, interfaces, template_ids,
                              exist_interfaces, host, proxy_id, visible_name, description, host_name,
                              inventory_mode, inventory_zabbix, tls_accept, tls_psk_identity, tls_psk,
                              tls_issuer, tls_subject, tls_connect, ipmi_authtype, ipmi_privilege,
                              ipmi_username, ipmi_password, macros, tags):
-        # get the existing host's groups
-        exist_host_groups = sorted(self.get_group_ids_by_host_id(host_id), key=lambda k: k["groupid"])
-        if sorted(group_ids, key=lambda k: k["groupid"]) != exist_host_groups:
-            return True
-
-        # get the existing status
-        exist_status = self.get_host_status_by_host(host)
-        if int(status) != int(exist_status):
-            return True
-
-        # check the exist_interfaces whether it equals the interfaces or not
-        if self.check_interface_properties(exist_interfaces, interfaces):
-            return True
-
-        # get the existing templates
-        exist_template_ids = self.get_host_templates_by_host_id(host_id)
-        if set(list(template_ids)) != set(exist_template_ids):
-            return True
-
-        if int(host["proxy_hostid"]) != int(proxy_id):
-            return True
-
-        # Check whether the visible_name has changed; Zabbix defaults to the technical hostname if not set.
-        if visible_name:
-            if host["name"] != visible_name:
-                return True
-
-        # Only compare description if it is given as a module parameter
-        if description:
-            if host["description"] != description:
-                return True
-
-        if inventory_mode:
-            if int(host["inventory_mode"]) != self.inventory_mode_numeric(inventory_mode):
-                return True
-
-        if inventory_zabbix:
-            proposed_inventory = copy.deepcopy(host["inventory"])
-            proposed_inventory.update(inventory_zabbix)
-            if proposed_inventory != host["inventory"]:
-                return True
-
-        if tls_accept is not None and "tls_accept" in host:
-            if int(host["tls_accept"]) != tls_accept:
-                return True
-
-        # in Zabbix >= 5.4 these parameters are write-only and are not returned in host.get response
-        if tls_psk_identity is not None or tls_psk is not None:
-            return True
-
-        if tls_issuer is not None and "tls_issuer" in host:
-            if host["tls_issuer"] != tls_issuer:
-                return True
-
-        if tls_subject is not None and "tls_subject" in host:
-            if host["tls_subject"] != tls_subject:
-                return True
-
-        if tls_connect is not None and "tls_connect" in host:
-            if int(host["tls_connect"]) != tls_connect:
-                return True
-        if ipmi_authtype is not None:
-            if int(host["ipmi_authtype"]) != ipmi_authtype:
-                return True
-        if ipmi_privilege is not None:
-            if int(host["ipmi_privilege"]) != ipmi_privilege:
-                return True
-        if ipmi_username is not None:
-            if host["ipmi_username"] != ipmi_username:
-                return True
-        if ipmi_password is not None:
-            if host["ipmi_password"] != ipmi_password:
-                return True
-
-        # hostmacroid and hostid are present in every item of host["macros"] and need to be removed
-        if macros is not None and "macros" in host:
-            t_macros = copy.deepcopy(macros)  # make copy to prevent change in original data
-            for macro in host["macros"]:
-                macro.pop("hostid", False)
-                macro.pop("hostmacroid", False)
-
-            diff = []
-            zabbix_utils.helper_compare_lists(t_macros, host["macros"], diff)
-            if diff != []:
-                return True
-
-        if tags is not None and "tags" in host:
-            if sorted(tags, key=lambda k: k["tag"]) != sorted(host["tags"], key=lambda k: k["tag"]):
-                return True
-
-        return False
-
-    # link or clear template of the host
-    def link_or_clear_template(self, host_id, template_id_list, tls_connect, tls_accept, tls_psk_identity, tls_psk,
-                               tls_issuer, tls_subject, ipmi_authtype, ipmi_privilege, ipmi_username, ipmi_password, discovered_host):
-        # get host's exist template ids
-        exist_template_id_list = self.get_host_templates_by_host_id(host_id)
-
-        exist_template_ids = set(exist_template_id_list)
-        template_ids = set(template_id_list)
-        template_id_list = list(template_ids)
-
-        # get unlink and clear templates
-        templates_clear = exist_template_ids.difference(template_ids)
-        templates_clear_list = list(templates_clear)
-        if discovered_host:
-            # The host was discovered via Discovery Rule
-            request_str = {"hostid": host_id, "templates": template_id_list, "templates_clear": templates_clear_list}
-        else:
-            # A "plain" host
-            request_str = {"hostid": host_id, "templates": template_id_list, "templates_clear": templates_clear_list,
-                           "ipmi_authtype": ipmi_authtype, "ipmi_privilege": ipmi_privilege, "ipmi_username": ipmi_username, "ipmi_password": ipmi_password}
-            if tls_connect:
-                request_str["tls_connect"] = tls_connect
-            if tls_accept:
-                request_str["tls_accept"] = tls_accept
-            if tls_psk_identity is not None:
-                request_str["tls_psk_identity"] = tls_psk_identity
-            if tls_psk is not None:
-                request_str["tls_psk"] = tls_psk
-            if tls_issuer is not None:
-                request_str["tls_issuer"] = tls_issuer
-            if tls_subject is not None:
-                request_str["tls_subject"] = tls_subject
-        try:
-            if self._module.check_mode:
-                self._module.exit_json(changed=True)
-            self._zapi.host.update(request_str)
-        except Exception as e:
-            self._module.fail_json(msg="Failed to link template to host: %s" % e)
+        return host_utils.get_host_changes(
+            host, exist_interfaces, self.get_group_ids_by_host(host), self.get_host_templates_by_host(host), group_ids,
+            status, interfaces, template_ids, proxy_id, visible_name, description, inventory_mode, inventory_zabbix,
+            tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject, tls_connect, ipmi_authtype, ipmi_privilege,
+            ipmi_username, ipmi_password, macros, tags)
 
     def inventory_mode_numeric(self, inventory_mode):
-        if inventory_mode == "automatic":
-            return int(1)
-        elif inventory_mode == "manual":
-            return int(0)
-        elif inventory_mode == "disabled":
-            return int(-1)
-        return inventory_mode
-
-    # Update the host inventory_mode
-    def update_inventory_mode(self, host_id, inventory_mode):
-
-        # nothing was set, do nothing
-        if not inventory_mode:
-            return
-
-        inventory_mode = self.inventory_mode_numeric(inventory_mode)
-
-        # watch for - https://support.zabbix.com/browse/ZBX-6033
-        request_str = {"hostid": host_id, "inventory_mode": inventory_mode}
-        try:
-            if self._module.check_mode:
-                self._module.exit_json(changed=True)
-            self._zapi.host.update(request_str)
-        except Exception as e:
-            self._module.fail_json(msg="Failed to set inventory_mode to host: %s" % e)
-
-    def update_inventory_zabbix(self, host_id, inventory):
-
-        if not inventory:
-            return
-
-        request_str = {"hostid": host_id, "inventory": inventory}
-        try:
-            if self._module.check_mode:
-                self._module.exit_json(changed=True)
-            self._zapi.host.update(request_str)
-        except Exception as e:
-            self._module.fail_json(msg="Failed to set inventory to host: %s" % e)
-
-
-# Add all default values to all missing parameters for existing interfaces
-def update_exist_interfaces_with_defaults(exist_interfaces):
-
-    new_exist_interfaces = []
-    default_interface = {
-        "main": "0",
-        "useip": "0",
-        "ip": "",
-        "dns": "",
-        "port": ""
-    }
-    default_interface_details = {
-        "version": 2,
-        "bulk": 1,
-        "community": "",
-        "securityname": "",
-        "contextname": "",
-        "securitylevel": 0,
-        "authprotocol": 0,
-        "authpassphrase": "",
-        "privprotocol": 0,
-        "privpassphrase": ""
-    }
-    for interface in exist_interfaces:
-        new_interface = default_interface.copy()
-        new_interface.update(interface)
-        new_interface["details"] = default_interface_details.copy()
-        if "details" in interface:
-            new_interface["details"].update(interface["details"])
-        new_exist_interfaces.append(new_interface)
-
-    return new_exist_interfaces
-
-
-def normalize_macro_name(macro_name):
-    # Zabbix handles macro names in upper case characters
-    if ":" in macro_name:
-        macro_name = ":".join([macro_name.split(":")[0].upper(), ":".join(macro_name.split(":")[1:])])
-    else:
-        macro_name = macro_name.upper()
-
-    # Valid format for macro is {$MACRO}
-    if not macro_name.startswith("{$"):
-        macro_name = "{$" + macro_name
-    if not macro_name.endswith("}"):
-        macro_name = macro_name + "}"
-
-    return macro_name
+        return host_utils.inventory_mode_numeric(inventory_mode)
 
 
 def main():
@@ -1051,6 +735,13 @@ def main():
 
     host = Host(module)
 
+    # resolve all referenced names in one request, the lookups below are then served from the resolver
+    host._resolver.add("template", link_templates)
+    host._resolver.add("hostgroup", host_groups)
+    if proxy:
+        host._resolver.add("proxy", [proxy])
+    host._resolver.resolve()
+
     template_ids = []
     if link_templates:
         template_ids = host.get_template_ids(link_templates)
@@ -1064,14 +755,7 @@ def main():
 
     if macros:
         # convert macros to zabbix native format - {$MACRO}
-        for macro in macros:
-            macro["macro"] = normalize_macro_name(macro["macro"])
-
-            if "type" in macro:
-                if macro["type"] == "text":
-                    macro["type"] = "0"
-                elif macro["type"] == "secret":
-                    macro["type"] = "1"
+        host_utils.normalize_host_macros(macros)
 
     # Use proxy specified, or set to 0
     if proxy:
@@ -1079,12 +763,10 @@ def main():
     else:
         proxy_id = 0
 
-    # check if host exist
-    is_host_exist = host.is_host_exist(host_name)
+    # get the host if it exists
+    zabbix_host_obj = host.get_host_by_host_name(host_name)
 
-    if is_host_exist:
-        # get host id by host name
-        zabbix_host_obj = host.get_host_by_host_name(host_name)
+    if zabbix_host_obj:
         host_id = zabbix_host_obj["hostid"]
         discovered_host = zabbix_host_obj["flags"] == '4'
 
@@ -1100,118 +782,41 @@ def main():
             if not host_groups:
                 # if host_groups have not been specified when updating an existing host, just
                 # get the group_ids from the existing host without updating them.
-                group_ids = host.get_group_ids_by_host_id(host_id)
+                group_ids = host.get_group_ids_by_host(zabbix_host_obj)
 
             # get existing host's interfaces
-            exist_interfaces = host._zapi.hostinterface.get({"output": "extend", "hostids": host_id})
-            exist_interfaces.sort(key=lambda x: int(x["interfaceid"]))
-            exist_interfaces = update_exist_interfaces_with_defaults(exist_interfaces)
-
-            # Convert integer parameters from strings to ints
-            for idx, interface in enumerate(copy.deepcopy(exist_interfaces)):
-                for key in tuple(interface.keys()):
-                    # fix values for properties
-                    if key in ["useip", "main", "type", "bulk"]:
-                        exist_interfaces[idx][key] = int(interface[key])
-                    elif key == "details":
-                        if not interface[key]:
-                            exist_interfaces[idx][key] = {}
-                        else:
-                            for d_key in interface[key].keys():
-                                if d_key in ["version", "bulk", "securitylevel", "authprotocol", "privprotocol"]:
-                                    exist_interfaces[idx][key][d_key] = int(interface[key][d_key])
-
-            interfaces_copy = copy.deepcopy(interfaces)
-            found_in_interfaces = []
-            for idx, interface in enumerate(copy.deepcopy(exist_interfaces)):
-                interfaceid = interface["interfaceid"]
-                hostid = interface["hostid"]
-
-                if not interfaces_copy:
-                    # Whe no interfaces specified, copy existing interfaces
-                    interfaces.append(interface)
-                    continue
-
-                # Find already configured interfaces in requested interfaces and compile final list of
-                # interfaces in "interfaces" variable. Every element of the list defines one interface.
-                # If an element has "interfaceid" field then Zabbix will update existing interface otherwise
-                # a new interface will be added.
-                found = False
-                for idx1, iface in enumerate(interfaces_copy):
-                    diff_dict = {}
-                    zabbix_utils.helper_cleanup_data(zabbix_utils.helper_compare_dictionaries(iface, interface, diff_dict))
-                    if diff_dict == {}:
-                        found = True
-                        found_in_interfaces.append(iface)
-                        interfaces[idx1]["interfaceid"] = interfaceid
-                        interfaces[idx1]["hostid"] = hostid
-                        break
-
-                if not found:
-                    if not force:
-                        interfaces.append(interface)
-                    else:
-                        # if force == True overwrite existing interfaces with provided interfaces with the same type
-                        for idx1, iface in enumerate(interfaces_copy):
-                            if interface["type"] == iface["type"] and iface not in found_in_interfaces:
-                                found_in_interfaces.append(iface)
-                                interfaces[idx1]["interfaceid"] = interfaceid
-                                interfaces[idx1]["hostid"] = hostid
-                                break
+            exist_interfaces = host_utils.normalize_exist_interfaces(zabbix_host_obj["interfaces"])
+            host_utils.merge_host_interfaces(interfaces, exist_interfaces, force)
 
             if not force or link_templates is None:
-                template_ids = list(set(template_ids + host.get_host_templates_by_host_id(host_id)))
+                template_ids = list(set(template_ids + host.get_host_templates_by_host(zabbix_host_obj)))
 
             if not force:
-                for group_id in host.get_group_ids_by_host_id(host_id):
+                for group_id in host.get_group_ids_by_host(zabbix_host_obj):
                     if group_id not in group_ids:
                         group_ids.append(group_id)
 
                 # Macros not present in host.update will be removed if we dont copy them when force=no
                 if macros is not None and "macros" in zabbix_host_obj.keys():
-                    existing_macros = zabbix_host_obj["macros"]
-                    for macro in existing_macros:
-                        macro.pop("hostmacroid", None)
-                        macro.pop("hostid", None)
-                        macro.pop("automatic", None)
-                        found = False
-                        for idx1, prov_macro in enumerate(macros):
-                            diff_dict = {}
-                            zabbix_utils.helper_compare_dictionaries(prov_macro, macro, diff_dict)
-                            if diff_dict == {}:
-                                found = True
-                                break
-                        if found:
-                            macros[idx1] = macro
-                        else:
-                            macros.append(macro)
+                    host_utils.merge_host_macros(macros, zabbix_host_obj["macros"])
 
                 # Tags not present in host.update will be removed if we dont copy them when force=no
                 if tags is not None and "tags" in zabbix_host_obj.keys():
-                    provided_tags = [t["tag"] for t in tags]
-                    existing_tags = zabbix_host_obj["tags"]
-                    for tag in existing_tags:
-                        if tag["tag"] not in provided_tags:
-                            tags.append(tag)
+                    host_utils.merge_host_tags(tags, zabbix_host_obj["tags"])
 
             # update host
-            if host.check_all_properties(
-                    host_id, group_ids, status, interfaces, template_ids, exist_interfaces, zabbix_host_obj, proxy_id,
-                    visible_name, description, host_name, inventory_mode, inventory_zabbix, tls_accept, tls_psk_identity, tls_psk,
-                    tls_issuer, tls_subject, tls_connect, ipmi_authtype, ipmi_privilege,
-                    ipmi_username, ipmi_password, macros, tags):
-
+            changes = host.check_all_properties(
+                group_ids, status, interfaces, template_ids, exist_interfaces, zabbix_host_obj, proxy_id,
+                visible_name, description, host_name, inventory_mode, inventory_zabbix, tls_accept, tls_psk_identity, tls_psk,
+                tls_issuer, tls_subject, tls_connect, ipmi_authtype, ipmi_privilege,
+                ipmi_username, ipmi_password, macros, tags)
+            if changes:
                 host.update_host(
-                    host_name, group_ids, status, host_id, interfaces, exist_interfaces, proxy_id, visible_name,
-                    description, tls_connect, tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject,
-                    ipmi_authtype, ipmi_privilege, ipmi_username, ipmi_password, macros, tags, discovered_host)
-
-                host.link_or_clear_template(
-                    host_id, template_ids, tls_connect, tls_accept, tls_psk_identity, tls_psk, tls_issuer,
-                    tls_subject, ipmi_authtype, ipmi_privilege, ipmi_username, ipmi_password, discovered_host)
-
-                host.update_inventory_mode(host_id, inventory_mode)
-                host.update_inventory_zabbix(host_id, inventory_zabbix)
+                    host_name, group_ids, status, host_id, interfaces, proxy_id, visible_name, description,
+                    tls_connect, tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject, ipmi_authtype,
+                    ipmi_privilege, ipmi_username, ipmi_password, macros, tags, template_ids,
+                    host.get_host_templates_by_host(zabbix_host_obj), inventory_mode, inventory_zabbix,
+                    discovered_host, changes)
 
                 module.exit_json(changed=True,
                                  result="Successfully update host %s (%s) and linked with template '%s'"
@@ -1220,8 +825,6 @@ def main():
                 module.exit_json(changed=False)
 
     else:
-        discovered_host = False
-
         if state == "absent":
             # the host is already deleted.
             module.exit_json(changed=False)
@@ -1230,17 +833,10 @@ def main():
             module.fail_json(msg="Specify at least one group for creating host '%s'." % host_name)
 
         # create host
-        host_id = host.add_host(
+        host.add_host(
             host_name, group_ids, status, interfaces, proxy_id, visible_name, description, tls_connect, tls_accept,
             tls_psk_identity, tls_psk, tls_issuer, tls_subject, ipmi_authtype, ipmi_privilege, ipmi_username,
-            ipmi_password, macros, tags)
-
-        host.link_or_clear_template(
-            host_id, template_ids, tls_connect, tls_accept, tls_psk_identity, tls_psk, tls_issuer, tls_subject,
-            ipmi_authtype, ipmi_privilege, ipmi_username, ipmi_password, discovered_host)
-
-        host.update_inventory_mode(host_id, inventory_mode)
-        host.update_inventory_zabbix(host_id, inventory_zabbix)
+            ipmi_password, macros, tags, template_ids, inventory_mode, inventory_zabbix)
 
         module.exit_json(changed=True, result="Successfully added host %s (%s) and linked with template '%s'" % (
             host_name, ip, link_templates))
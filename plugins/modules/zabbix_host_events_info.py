@@ -86,12 +86,16 @@ triggers_problem:
                     description: If set to true return only acknowledged events
                     type: int
                 acknowledges:
-                    description: acknowledges informations
+                    description: acknowledges informations, empty for events which are not acknowledged
                     type: complex
                     contains:
                         alias:
+                            description: Account who acknowledge, same as I(username)
+                            type: str
+                        username:
                             description: Account who acknowledge
                             type: str
+                            version_added: 2.2.0
                         clock:
                             description: Time when the event was created (timestamp)
                             type: int
@@ -134,6 +138,11 @@ triggers_problem:
           value:
             description: Whether the trigger is in OK or problem state
             type: int
+truncated:
+    description: Whether I(limit) triggers were returned, more triggers may match.
+    returned: On success
+    type: bool
+    version_added: 2.2.0
 """
 
 DOCUMENTATION = """
@@ -177,6 +186,22 @@ options:
             - high
             - disaster
         type: str
+    problems_only:
+        description:
+            - Only request the triggers in problem state, I(triggers_ok) is then empty.
+            - Saves fetching all the triggers in OK state of large host groups.
+        required: false
+        default: false
+        type: bool
+        version_added: 2.2.0
+    limit:
+        description:
+            - Maximum number of triggers to return, the triggers which changed state most recently first.
+            - I(truncated) is true when the limit is reached.
+            - Combine with I(problems_only=true) to cap the number of triggers in problem state.
+        required: false
+        type: int
+        version_added: 2.2.0
 extends_documentation_fragment:
 - community.zabbix.zabbix
 
@@ -234,21 +259,28 @@ class Host(ZabbixBase):
         else:
             return host[0]
 
-    def get_triggers_by_host_id_in_problem_state(self, host_id, trigger_severity):
-        """ Get triggers in problem state from a hostid"""
+    def get_triggers_by_host_id_in_problem_state(self, host_id, trigger_severity, problems_only=False, limit=None):
+        """ Get triggers from a hostid, with the last event of each trigger"""
         output = "extend"
-        triggers_list = self._zapi.trigger.get({"output": output, "hostids": host_id,
-                                                "min_severity": trigger_severity})
-        return triggers_list
+        params = {"output": output, "hostids": host_id, "min_severity": trigger_severity,
+                  "selectLastEvent": ["eventid", "clock", "acknowledged", "value"]}
+        if problems_only:
+            params["filter"] = {"value": 1}
+        if limit:
+            params.update({"limit": limit, "sortfield": "lastchange", "sortorder": "DESC"})
+        return self._zapi.trigger.get(params)
 
-    def get_last_event_by_trigger_id(self, triggers_id):
-        """ Get the last event from triggerid"""
-        output = ["eventid", "clock", "acknowledged", "value"]
-        select_acknowledges = ["clock", "alias", "message"]
-        event = self._zapi.event.get({"output": output, "objectids": triggers_id,
-                                      "select_acknowledges": select_acknowledges, "limit": 1, "sortfield": "clock",
-                                      "sortorder": "DESC"})
-        return event[0]
+    def get_acknowledges_by_event_ids(self, event_ids):
+        """ Get the acknowledges of each eventid"""
+        if not event_ids:
+            return {}
+        events = self._zapi.event.get({"output": ["eventid"], "eventids": event_ids,
+                                       "selectAcknowledges": ["clock", "message", "username"]})
+        for event in events:
+            for acknowledge in event["acknowledges"]:
+                # the user alias was renamed username in Zabbix 5.4
+                acknowledge["alias"] = acknowledge["username"]
+        return dict((event["eventid"], event["acknowledges"]) for event in events)
 
 
 def main():
@@ -264,6 +296,8 @@ def main():
             required=False,
             default="average",
             choices=["not_classified", "information", "warning", "average", "high", "disaster"]),
+        problems_only=dict(type="bool", required=False, default=False),
+        limit=dict(type="int", required=False),
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -274,6 +308,8 @@ def main():
     host_id = module.params["host_identifier"]
     host_id_type = module.params["host_id_type"]
     trigger_severity = trigger_severity_map[module.params["trigger_severity"]]
+    problems_only = module.params["problems_only"]
+    limit = module.params["limit"]
 
     host_inventory = "hostid"
 
@@ -291,21 +327,29 @@ def main():
         # check hostid exist
         zabbix_host = host.get_host(host_id, host_inventory, "hostid")
 
-    triggers = host.get_triggers_by_host_id_in_problem_state(host_id, trigger_severity)
+    triggers = host.get_triggers_by_host_id_in_problem_state(host_id, trigger_severity, problems_only, limit)
 
     triggers_ok = []
     triggers_problem = []
     for trigger in triggers:
-        # tGet last event for trigger with problem value = 1
+        # Get last event for trigger with problem value = 1
         # https://www.zabbix.com/documentation/3.4/manual/api/reference/trigger/object
+        last_event = trigger.pop("lastEvent", [])
         if int(trigger["value"]) == 1:
-            event = host.get_last_event_by_trigger_id(trigger["triggerid"])
-            trigger["last_event"] = event
+            trigger["last_event"] = last_event
             triggers_problem.append(trigger)
         else:
             triggers_ok.append(trigger)
 
-    module.exit_json(ok=True, triggers_ok=triggers_ok, triggers_problem=triggers_problem)
+    acknowledges = host.get_acknowledges_by_event_ids(
+        [trigger["last_event"]["eventid"] for trigger in triggers_problem
+         if trigger["last_event"] and int(trigger["last_event"]["acknowledged"]) == 1])
+    for trigger in triggers_problem:
+        if trigger["last_event"]:
+            trigger["last_event"]["acknowledges"] = acknowledges.get(trigger["last_event"]["eventid"], [])
+
+    module.exit_json(ok=True, triggers_ok=triggers_ok, triggers_problem=triggers_problem,
+                     truncated=bool(limit) and len(triggers) >= limit)
 
 
 if __name__ == "__main__":
@@ -64,6 +64,16 @@ options:
         elements: str
         required: false
         default: []
+    output_fields:
+        description:
+            - List of host fields to return, e.g. C(host), C(name) and C(status).
+            - C(hostid) and C(name) are always returned.
+            - All the host fields are returned if fields are not specified.
+        type: list
+        elements: str
+        required: false
+        default: []
+        version_added: 2.2.0
 extends_documentation_fragment:
 - community.zabbix.zabbix
 
@@ -118,6 +128,24 @@ EXAMPLES = r"""
     timeout: 10
     exact_match: no
     remove_duplicate: yes
+
+- name: Only return a few host fields of all the web servers
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_host_info:
+    host_name: web
+    output_fields:
+      - host
+      - status
+    host_inventory:
+      - location
 """
 
 
@@ -128,27 +156,30 @@ import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabb
 
 
 class Host(ZabbixBase):
-    def get_hosts_by_host_name(self, host_name, exact_match, host_inventory):
-        """ Get host by host name """
+    def get_hosts_by_host_name(self, host_name, exact_match, host_inventory, output_fields):
+        """ Get host by host name, with its interfaces """
         search_key = "search"
         if exact_match:
             search_key = "filter"
         host_list = self._zapi.host.get({
-            "output": "extend",
+            "output": output_fields,
             "selectParentTemplates": ["name"],
             search_key: {"host": [host_name]},
             "selectInventory": host_inventory,
             "selectGroups": "extend",
             "selectTags": "extend",
-            "selectMacros": "extend"
+            "selectMacros": "extend",
+            "selectInterfaces": "extend"
         })
         if len(host_list) < 1:
             self._module.fail_json(msg="Host not found: %s" % host_name)
         else:
+            for zabbix_host in host_list:
+                zabbix_host["hostinterfaces"] = zabbix_host.pop("interfaces")
             return host_list
 
-    def get_hosts_by_ip(self, host_ips, host_inventory):
-        """ Get host by host ip(s) """
+    def get_hosts_by_ip(self, host_ips, host_inventory, output_fields):
+        """ Get host by host ip(s), one host per matching interface """
         hostinterfaces = self._zapi.hostinterface.get({
             "output": "extend",
             "filter": {
@@ -157,30 +188,31 @@ class Host(ZabbixBase):
         })
         if len(hostinterfaces) < 1:
             self._module.fail_json(msg="Host not found: %s" % host_ips)
+        hosts = self._zapi.host.get({
+            "output": output_fields,
+            "selectGroups": "extend",
+            "selectParentTemplates": ["name"],
+            "hostids": sorted(set(hostinterface["hostid"] for hostinterface in hostinterfaces)),
+            "selectInventory": host_inventory,
+            "selectTags": "extend",
+            "selectMacros": "extend"
+        })
+        hosts_by_id = dict((zabbix_host["hostid"], zabbix_host) for zabbix_host in hosts)
         host_list = []
         for hostinterface in hostinterfaces:
-            host = self._zapi.host.get({
-                "output": "extend",
-                "selectGroups": "extend",
-                "selectParentTemplates": ["name"],
-                "hostids": hostinterface["hostid"],
-                "selectInventory": host_inventory,
-                "selectTags": "extend",
-                "selectMacros": "extend"
-            })
-            host[0]["hostinterfaces"] = hostinterface
-            host_list.append(host[0])
+            if hostinterface["hostid"] in hosts_by_id:
+                host_list.append(dict(hosts_by_id[hostinterface["hostid"]], hostinterfaces=hostinterface))
         return host_list
 
     def delete_duplicate_hosts(self, hosts):
         """ Delete duplicated hosts """
         unique_hosts = []
-        listed_hostnames = []
+        listed_hostnames = set()
         for zabbix_host in hosts:
             if zabbix_host["name"] in listed_hostnames:
                 continue
             unique_hosts.append(zabbix_host)
-            listed_hostnames.append(zabbix_host["name"])
+            listed_hostnames.add(zabbix_host["name"])
         return unique_hosts
 
 
@@ -191,7 +223,8 @@ def main():
         host_ip=dict(type="list", default=[], required=False, elements="str"),
         exact_match=dict(type="bool", required=False, default=False),
         remove_duplicate=dict(type="bool", required=False, default=True),
-        host_inventory=dict(type="list", default=[], required=False, elements="str")
+        host_inventory=dict(type="list", default=[], required=False, elements="str"),
+        output_fields=dict(type="list", default=[], required=False, elements="str")
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -203,29 +236,30 @@ def main():
     exact_match = module.params["exact_match"]
     is_remove_duplicate = module.params["remove_duplicate"]
     host_inventory = module.params["host_inventory"]
+    output_fields = module.params["output_fields"]
 
     if not host_inventory:
         host_inventory = "extend"
 
+    if output_fields:
+        # hostid and name are needed to match interfaces and remove duplicates
+        output_fields = output_fields + [field for field in ("hostid", "name") if field not in output_fields]
+    else:
+        output_fields = "extend"
+
     host = Host(module)
 
     if host_name:
-        hosts = host.get_hosts_by_host_name(host_name, exact_match, host_inventory)
+        hosts = host.get_hosts_by_host_name(host_name, exact_match, host_inventory, output_fields)
         if is_remove_duplicate:
             hosts = host.delete_duplicate_hosts(hosts)
-        extended_hosts = []
-        for zabbix_host in hosts:
-            zabbix_host["hostinterfaces"] = host._zapi.hostinterface.get({
-                "output": "extend", "hostids": zabbix_host["hostid"]
-            })
-            extended_hosts.append(zabbix_host)
-        module.exit_json(ok=True, hosts=extended_hosts)
+        module.exit_json(ok=True, hosts=hosts)
 
     elif host_ips:
-        extended_hosts = host.get_hosts_by_ip(host_ips, host_inventory)
+        hosts = host.get_hosts_by_ip(host_ips, host_inventory, output_fields)
         if is_remove_duplicate:
-            hosts = host.delete_duplicate_hosts(extended_hosts)
-        module.exit_json(ok=True, hosts=extended_hosts)
+            hosts = host.delete_duplicate_hosts(hosts)
+        module.exit_json(ok=True, hosts=hosts)
     else:
         module.exit_json(ok=False, hosts=[], result="No Host present")
 
@@ -23,17 +23,74 @@ options:
     host_name:
         description:
             - Name of the host.
-        required: true
+            - Required if I(hosts), I(host_groups) and I(host_tags) are not used.
+        required: false
         type: str
+    hosts:
+        description:
+            - Names of the hosts to manage the I(macros) of, instead of I(host_name).
+            - Can be combined with I(host_groups) and I(host_tags), the hosts must then match all of them.
+            - Requires I(macros).
+        required: false
+        type: list
+        elements: str
+        version_added: 2.2.0
+    host_groups:
+        description:
+            - Manage the I(macros) of the hosts of these host groups, instead of I(host_name).
+            - Requires I(macros).
+        required: false
+        type: list
+        elements: str
+        version_added: 2.2.0
+    host_tags:
+        description:
+            - Manage the I(macros) of the hosts with these tags, instead of I(host_name).
+            - Requires I(macros).
+        required: false
+        type: list
+        elements: dict
+        version_added: 2.2.0
+        suboptions:
+            tag:
+                description:
+                    - Name of the tag.
+                type: str
+                required: true
+            value:
+                description:
+                    - Value of the tag.
+                type: str
+                default: ""
+            operator:
+                description:
+                    - Condition operator.
+                type: str
+                default: contains
+                choices:
+                    - contains
+                    - equals
+                    - not_like
+                    - not_equal
+                    - exists
+                    - not_exists
+    batch_size:
+        description:
+            - Number of hosts whose macros are read and changed by each API call, when several hosts are selected.
+        required: false
+        type: int
+        default: 500
+        version_added: 2.2.0
     macro_name:
         description:
             - Name of the host macro in zabbix native format C({$MACRO}) or simple format C(MACRO).
-        required: true
+            - Required if I(macros) is not used.
+        required: false
         type: str
     macro_value:
         description:
             - Value of the host macro.
-            - Required if I(state=present).
+            - Required if I(state=present) and I(macros) is not used.
         type: str
     macro_type:
         type: str
@@ -62,6 +119,43 @@ options:
             - Only updates an existing macro if set to C(yes).
         default: "yes"
         type: bool
+    macros:
+        description:
+            - List of host macros to manage at once, instead of I(macro_name).
+            - All the macros of the host are read with a single API call, and created, updated or deleted with at most one API call each.
+            - I(state) and I(force) apply to all of them.
+        type: list
+        elements: dict
+        version_added: 2.2.0
+        suboptions:
+            macro_name:
+                description:
+                    - Name of the host macro in zabbix native format C({$MACRO}) or simple format C(MACRO).
+                required: true
+                type: str
+            macro_value:
+                description:
+                    - Value of the host macro.
+                    - Required if I(state=present).
+                type: str
+            macro_type:
+                description:
+                    - Type of the host macro.
+                choices: ["text", "secret", "vault"]
+                default: "text"
+                type: str
+            macro_description:
+                description:
+                    - Text Description of the host macro.
+                type: str
+                default: ""
+    exclusive:
+        description:
+            - Delete the macros of the hosts which are not in I(macros).
+            - Only used with I(macros) and I(state=present).
+        default: "no"
+        type: bool
+        version_added: 2.2.0
 
 extends_documentation_fragment:
 - community.zabbix.zabbix
@@ -130,6 +224,76 @@ EXAMPLES = r"""
     host_name: ExampleHost
     macro_name: "{$EXAMPLE.MACRO}"
     state: absent
+
+- name: Set all the macros of a host, delete the other ones
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_hostmacro:
+    host_name: ExampleHost
+    macros:
+      - macro_name: EXAMPLE.MACRO
+        macro_value: Example value
+      - macro_name: "{$SNMP_COMMUNITY}"
+        macro_value: public
+        macro_type: secret
+    exclusive: true
+    state: present
+
+- name: Rotate the SNMP community of all the switches
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_hostmacro:
+    host_groups:
+      - Switches
+    host_tags:
+      - tag: snmp
+        operator: exists
+    macros:
+      - macro_name: "{$SNMP_COMMUNITY}"
+        macro_value: "{{ snmp_community }}"
+        macro_type: secret
+    batch_size: 200
+"""
+
+RETURN = r"""
+created:
+    description: Names of the macros created, when I(macros) is used.
+    returned: when I(macros) and I(host_name) are used
+    type: list
+    elements: str
+    sample: ["{$EXAMPLE.MACRO}"]
+updated:
+    description: Names of the macros updated, when I(macros) is used.
+    returned: when I(macros) and I(host_name) are used
+    type: list
+    elements: str
+    sample: ["{$SNMP_COMMUNITY}"]
+deleted:
+    description: Names of the macros deleted, when I(macros) is used.
+    returned: when I(macros) and I(host_name) are used
+    type: list
+    elements: str
+    sample: []
+changes:
+    description: Names of the macros created, updated and deleted of each changed host.
+    returned: when I(macros) is used
+    type: dict
+    sample: {"switch01": {"created": [], "updated": ["{$SNMP_COMMUNITY}"], "deleted": []}}
+    version_added: 2.2.0
 """
 
 
@@ -201,6 +365,81 @@ class HostMacro(ZabbixBase):
         except Exception as e:
             self._module.fail_json(msg="Failed to delete host macro %s: %s" % (macro_name, e))
 
+    # get the names of the hosts matching all the selectors, as {host id: host name}
+    def get_hosts(self, host_names, host_groups, host_tags):
+        params = {"output": ["hostid", "host"]}
+        if host_names:
+            params["filter"] = {"host": host_names}
+        if host_groups:
+            group_ids = self._resolver.get_ids("hostgroup", host_groups)
+            missing = [group for group in host_groups if group not in group_ids]
+            if missing:
+                self._module.fail_json(msg="Host group not found: %s" % ", ".join(missing))
+            params["groupids"] = list(group_ids.values())
+        if host_tags:
+            params["tags"] = [{"tag": tag["tag"], "value": tag["value"], "operator": TAG_OPERATORS[tag["operator"]]}
+                              for tag in host_tags]
+        try:
+            host_list = self._zapi.host.get(params)
+        except Exception as e:
+            self._module.fail_json(msg="Failed to get hosts: %s" % e)
+        if host_names and not host_groups and not host_tags:
+            missing = set(host_names) - set(zabbix_host["host"] for zabbix_host in host_list)
+            if missing:
+                self._module.fail_json(msg="Host not found: %s" % ", ".join(sorted(missing)))
+        return dict((zabbix_host["hostid"], zabbix_host["host"]) for zabbix_host in host_list)
+
+    # get all the macros of the hosts, as {host id: {macro name: macro}}
+    def get_hosts_macros(self, host_ids):
+        try:
+            host_macro_list = self._zapi.usermacro.get({"output": "extend", "hostids": host_ids})
+        except Exception as e:
+            self._module.fail_json(msg="Failed to get host macros: %s" % e)
+        hosts_macros = dict((host_id, {}) for host_id in host_ids)
+        for host_macro_obj in host_macro_list:
+            hosts_macros.setdefault(host_macro_obj["hostid"], {})[host_macro_obj["macro"]] = host_macro_obj
+        return hosts_macros
+
+    # compare the macros of a host with the wanted ones, return the macros to create, update and delete
+    def diff_host_macros(self, host_id, host_macros, macros, state, force, exclusive):
+        to_create = []
+        to_update = []
+        to_delete = []
+        for macro in macros:
+            host_macro_obj = host_macros.get(macro["macro"])
+            if state == "absent":
+                if host_macro_obj:
+                    to_delete.append(host_macro_obj)
+            elif not host_macro_obj:
+                to_create.append(dict(macro, hostid=host_id))
+            elif force:
+                # no change only when macro type == 0. when type = 1 or 2 zabbix will not output value of it.
+                if (host_macro_obj["type"] == "0" and macro["type"] == "0" and host_macro_obj["value"] == macro["value"]
+                        and host_macro_obj["description"] == macro["description"]):
+                    continue
+                to_update.append(dict(macro, hostmacroid=host_macro_obj["hostmacroid"]))
+        if exclusive and state == "present":
+            macro_names = set(macro["macro"] for macro in macros)
+            to_delete.extend(host_macro_obj for macro_name, host_macro_obj in sorted(host_macros.items())
+                             if macro_name not in macro_names)
+        return to_create, to_update, to_delete
+
+    # create, update and delete host macros, with one API call each
+    def apply_host_macros(self, to_create, to_update, to_delete):
+        try:
+            if to_delete:
+                self._zapi.usermacro.delete([host_macro_obj["hostmacroid"] for host_macro_obj in to_delete])
+            if to_update:
+                self._zapi.usermacro.update([dict((k, v) for k, v in macro.items() if k != "macro") for macro in to_update])
+            if to_create:
+                self._zapi.usermacro.create(to_create)
+        except Exception as e:
+            self._module.fail_json(msg="Failed to update host macros: %s" % e)
+
+
+MACRO_TYPES = {"text": "0", "secret": "1", "vault": "2"}
+TAG_OPERATORS = {"contains": 0, "equals": 1, "not_like": 2, "not_equal": 3, "exists": 4, "not_exists": 5}
+
 
 def normalize_macro_name(macro_name):
     # Zabbix handles macro names in upper case characters
@@ -218,37 +457,123 @@ def normalize_macro_name(macro_name):
     return macro_name
 
 
+def bulk_host_macros(module):
+    state = module.params["state"]
+    macros = []
+    for macro in module.params["macros"]:
+        if state == "present" and macro["macro_value"] is None:
+            module.fail_json(msg="macro_value is required for macro %s when state is present" % macro["macro_name"])
+        macros.append({"macro": normalize_macro_name(macro["macro_name"]), "value": macro["macro_value"],
+                       "type": MACRO_TYPES[macro["macro_type"]], "description": macro["macro_description"]})
+
+    host_macro_class_obj = HostMacro(module)
+    host_name = module.params["host_name"]
+    if host_name:
+        hosts = {host_macro_class_obj.get_host_id(host_name): host_name}
+    else:
+        hosts = host_macro_class_obj.get_hosts(module.params["hosts"], module.params["host_groups"], module.params["host_tags"])
+
+    # the macros of batch_size hosts are read, then created, updated and deleted with one API call each
+    changes = {}
+    host_ids = sorted(hosts)
+    batch_size = module.params["batch_size"]
+    for index in range(0, len(host_ids), batch_size):
+        batch = host_ids[index:index + batch_size]
+        hosts_macros = host_macro_class_obj.get_hosts_macros(batch)
+        to_create, to_update, to_delete = [], [], []
+        for host_id in batch:
+            host_to_create, host_to_update, host_to_delete = host_macro_class_obj.diff_host_macros(
+                host_id, hosts_macros[host_id], macros, state, module.params["force"], module.params["exclusive"])
+            if host_to_create or host_to_update or host_to_delete:
+                changes[hosts[host_id]] = {
+                    "created": [macro["macro"] for macro in host_to_create],
+                    "updated": [macro["macro"] for macro in host_to_update],
+                    "deleted": [host_macro_obj["macro"] for host_macro_obj in host_to_delete],
+                }
+            to_create.extend(host_to_create)
+            to_update.extend(host_to_update)
+            to_delete.extend(host_to_delete)
+        if (to_create or to_update or to_delete) and not module.check_mode:
+            host_macro_class_obj.apply_host_macros(to_create, to_update, to_delete)
+
+    if host_name:
+        host_changes = changes.get(host_name, {})
+        module.exit_json(changed=bool(changes), changes=changes,
+                         created=host_changes.get("created", []),
+                         updated=host_changes.get("updated", []),
+                         deleted=host_changes.get("deleted", []))
+    module.exit_json(changed=bool(changes), changes=changes)
+
+
 def main():
     argument_spec = zabbix_utils.zabbix_common_argument_spec()
     argument_spec.update(dict(
-        host_name=dict(type="str", required=True),
-        macro_name=dict(type="str", required=True),
+        host_name=dict(type="str", required=False),
+        hosts=dict(type="list", required=False, elements="str"),
+        host_groups=dict(type="list", required=False, elements="str"),
+        host_tags=dict(
+            type="list",
+            required=False,
+            elements="dict",
+            options=dict(
+                tag=dict(type="str", required=True),
+                value=dict(type="str", default=""),
+                operator=dict(type="str", default="contains", choices=list(TAG_OPERATORS)),
+            )),
+        batch_size=dict(type="int", default=500),
+        macro_name=dict(type="str", required=False),
         macro_value=dict(type="str", required=False),
         macro_type=dict(type="str", default="text", choices=["text", "secret", "vault"]),
         macro_description=dict(type="str", default=""),
         state=dict(type="str", default="present", choices=["present", "absent"]),
-        force=dict(type="bool", default=True)
+        force=dict(type="bool", default=True),
+        macros=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                macro_name=dict(type="str", required=True),
+                macro_value=dict(type="str", required=False),
+                macro_type=dict(type="str", default="text", choices=["text", "secret", "vault"]),
+                macro_description=dict(type="str", default=""),
+            )),
+        exclusive=dict(type="bool", default=False)
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
         required_if=[
-            ["state", "present", ["macro_value"]]
+            ["state", "present", ["macro_value", "macros"], True]
+        ],
+        required_one_of=[
+            ["macro_name", "macros"],
+            ["host_name", "hosts", "host_groups", "host_tags"]
+        ],
+        required_by={
+            "hosts": "macros",
+            "host_groups": "macros",
+            "host_tags": "macros"
+        },
+        mutually_exclusive=[
+            ["macro_name", "macros"],
+            ["macro_value", "macros"],
+            ["host_name", "hosts"],
+            ["host_name", "host_groups"],
+            ["host_name", "host_tags"]
         ],
         supports_check_mode=True
     )
 
+    if module.params["batch_size"] < 1:
+        module.fail_json(msg="batch_size must be greater than 0")
+    if module.params["macros"] is not None:
+        bulk_host_macros(module)
+
     host_name = module.params["host_name"]
     macro_name = normalize_macro_name(module.params["macro_name"])
     macro_value = module.params["macro_value"]
     macro_description = module.params["macro_description"]
     state = module.params["state"]
     force = module.params["force"]
-    if module.params["macro_type"] == "secret":
-        macro_type = "1"
-    elif module.params["macro_type"] == "vault":
-        macro_type = "2"
-    else:
-        macro_type = "0"
+    macro_type = MACRO_TYPES[module.params["macro_type"]]
 
     host_macro_class_obj = HostMacro(module)
 
@@ -0,0 +1,739 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+RETURN = r"""
+---
+created:
+  description: Names of the hosts which were created.
+  returned: always
+  type: list
+  elements: str
+  sample: [ "ExampleHost1" ]
+updated:
+  description: Names of the hosts which were updated.
+  returned: always
+  type: list
+  elements: str
+  sample: [ "ExampleHost2" ]
+deleted:
+  description: Names of the hosts which were deleted.
+  returned: always
+  type: list
+  elements: str
+  sample: [ "ExampleHost3" ]
+"""
+
+DOCUMENTATION = r"""
+---
+module: zabbix_hosts
+short_description: Create/update/delete many Zabbix hosts at once
+description:
+   - This module allows you to create, modify and delete many Zabbix host entries and associated group and template data in one task.
+   - Existing hosts are read with a few C(host.get) requests and compared locally, changes are applied with
+     array forms of C(host.create), C(host.update) and C(host.delete).
+   - Each entry of I(hosts) accepts the same options and behaves the same way as M(community.zabbix.zabbix_host).
+version_added: 2.2.0
+author:
+    - community.zabbix maintainers (!UNKNOWN)
+requirements:
+    - "python >= 3.9"
+options:
+    hosts:
+        description:
+            - List of hosts to manage.
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            host_name:
+                description:
+                    - Name of the host in Zabbix.
+                    - I(host_name) is the unique identifier used and cannot be updated using this module.
+                required: true
+                type: str
+            visible_name:
+                description:
+                    - Visible name of the host in Zabbix.
+                type: str
+            description:
+                description:
+                    - Description of the host in Zabbix.
+                type: str
+            host_groups:
+                description:
+                    - List of host groups the host is part of.
+                    - Make sure the Zabbix user used for Ansible can read these groups.
+                type: list
+                elements: str
+            link_templates:
+                description:
+                    - List of templates linked to the host.
+                type: list
+                elements: str
+            inventory_mode:
+                description:
+                    - Configure the inventory mode.
+                choices: ["automatic", "manual", "disabled"]
+                type: str
+            inventory_zabbix:
+                description:
+                    - Add Facts for a zabbix inventory (e.g. Tag) (see example below).
+                    - Please review the interface documentation for more information on the supported properties
+                    - U(https://www.zabbix.com/documentation/current/en/manual/api/reference/host/object#host-inventory)
+                type: dict
+            status:
+                description:
+                    - Monitoring status of the host.
+                choices: ["enabled", "disabled"]
+                default: "enabled"
+                type: str
+            state:
+                description:
+                    - State of the host.
+                    - On C(present), it will create if host does not exist or update the host if the associated data is different.
+                    - On C(absent) will remove a host if it exists.
+                choices: ["present", "absent"]
+                default: "present"
+                type: str
+            proxy:
+                description:
+                    - The name of the Zabbix proxy to be used.
+                type: str
+            interfaces:
+                type: list
+                elements: dict
+                description:
+                    - List of interfaces to be created for the host (see example below).
+                    - For more information, review host interface documentation at
+                    - U(https://www.zabbix.com/documentation/current/en/manual/api/reference/hostinterface/object#host-interface)
+                default: []
+                suboptions:
+                    type:
+                        type: str
+                        description:
+                            - Interface type to add
+                            - Numerical values are also accepted for interface type
+                            - 1 = agent
+                            - 2 = snmp
+                            - 3 = ipmi
+                            - 4 = jmx
+                        choices: ["agent", "1", "snmp", "2", "ipmi", "3", "jmx", "4"]
+                        required: true
+                    main:
+                        type: int
+                        description:
+                            - Whether the interface is used as default.
+                            - If multiple interfaces with the same type are provided, only one can be default.
+                            - 0 (not default), 1 (default)
+                        default: 0
+                        choices: [0, 1]
+                    useip:
+                        type: int
+                        description:
+                            - Connect to host interface with IP address instead of DNS name.
+                            - 0 (don't use ip), 1 (use ip)
+                        default: 0
+                        choices: [0, 1]
+                    ip:
+                        type: str
+                        description:
+                            - IP address used by host interface.
+                            - Required if I(useip=1).
+                    dns:
+                        type: str
+                        description:
+                            - DNS name of the host interface.
+                            - Required if I(useip=0).
+                    port:
+                        type: str
+                        description:
+                            - Port used by host interface.
+                            - If not specified, default port for each type of interface is used
+                            - 10050 if I(type="agent")
+                            - 161 if I(type="snmp")
+                            - 623 if I(type="ipmi")
+                            - 12345 if I(type="jmx")
+                    details:
+                        type: dict
+                        description:
+                            - Additional details for SNMP host interfaces.
+                            - Required when I(type="snmp").
+                        default: {}
+                        suboptions:
+                            version:
+                                type: int
+                                description:
+                                    - SNMP version.
+                                    - 1 (SNMPv1), 2 (SNMPv2c), 3 (SNMPv3)
+                                choices: [1, 2, 3]
+                                default: 2
+                            bulk:
+                                type: int
+                                description:
+                                    - Whether to use bulk SNMP requests.
+                                    - 0 (don't use bulk requests), 1 (use bulk requests)
+                                choices: [0, 1]
+                                default: 1
+                            community:
+                                type: str
+                                description:
+                                    - SNMPv1 and SNMPv2 community string.
+                                    - Required when I(version=1) or I(version=2).
+                                default: ""
+                            securityname:
+                                type: str
+                                description:
+                                    - SNMPv3 security name.
+                                default: ""
+                            contextname:
+                                type: str
+                                description:
+                                    - SNMPv3 context name.
+                                default: ""
+                            securitylevel:
+                                type: int
+                                description:
+                                    - SNMPv3 security level.
+                                    - 0 (noAuthNoPriv), 1 (authNoPriv), 2 (authPriv).
+                                choices: [0, 1, 2]
+                                default: 0
+                            authprotocol:
+                                type: int
+                                description:
+                                    - SNMPv3 authentication protocol.
+                                    - Used when I(securitylevel=1)(authNoPriv) or I(securitylevel=2)(AuthPriv).
+                                    - Variants 2,3,4,5 are supported only on Zabbix 5.4 or greater
+                                    - 0 (MD5), 1 (SHA1), 2 (SHA224), 3 (SHA256), 4 (SHA384), 5 (SHA512)
+                                default: 0
+                                choices: [0, 1, 2, 3, 4, 5]
+                            authpassphrase:
+                                type: str
+                                description:
+                                    - SNMPv3 authentication passphrase.
+                                    - Used when I(securitylevel=1)(authNoPriv) or I(securitylevel=2)(AuthPriv).
+                                default: ""
+                            privprotocol:
+                                type: int
+                                description:
+                                    - SNMPv3 privacy protocol.
+                                    - Used when I(securitylevel=2)(authPriv).
+                                    - Variants 2,3,4,5 are supported only on Zabbix 5.4 or greater
+                                    - 0 (DES), 1 (AES128), 2 (AES192), 3 (AES256), 4 (AES192C), 5 (AES256C)
+                                default: 0
+                                choices: [0, 1, 2, 3, 4, 5]
+                            privpassphrase:
+                                type: str
+                                description:
+                                    - SNMPv3 privacy passphrase.
+                                    - Used when I(securitylevel=2)(AuthPriv).
+                                default: ""
+            tls_connect:
+                description:
+                    - Specifies what encryption to use for outgoing connections.
+                    - Possible values, 1 (no encryption), 2 (PSK), 4 (certificate).
+                type: int
+            tls_accept:
+                description:
+                    - Specifies what types of connections are allowed for incoming connections.
+                    - The tls_accept parameter accepts values of 1 to 7
+                    - Possible values, 1 (no encryption), 2 (PSK), 4 (certificate).
+                    - Values can be combined.
+                type: int
+            tls_psk_identity:
+                description:
+                    - It is a unique name by which this specific PSK is referred to by Zabbix components
+                    - Do not put sensitive information in the PSK identity string, it is transmitted over the network unencrypted.
+                    - Works only with >= Zabbix 3.0
+                    - Using this parameter with Zabbix >= 5.4 makes this module non-idempotent.
+                type: str
+            tls_psk:
+                description:
+                    - PSK value is a hard to guess string of hexadecimal digits.
+                    - The preshared key, at least 32 hex digits. Required if either I(tls_connect) or I(tls_accept) has PSK enabled.
+                    - Using this parameter makes this module non-idempotent.
+                type: str
+            ca_cert:
+                description:
+                    - Required certificate issuer.
+                aliases: [ tls_issuer ]
+                type: str
+            tls_subject:
+                description:
+                    - Required certificate subject.
+                type: str
+            ipmi_authtype:
+                description:
+                    - IPMI authentication algorithm.
+                    - Please review the Host object documentation for more information on the supported properties
+                    - "https://www.zabbix.com/documentation/3.4/manual/api/reference/host/object"
+                    - Possible values are, C(0) (none), C(1) (MD2), C(2) (MD5), C(4) (straight), C(5) (OEM), C(6) (RMCP+),
+                      with -1 being the API default.
+                    - Please note that the Zabbix API will treat absent settings as default when updating
+                      any of the I(ipmi_)-options; this means that if you attempt to set any of the four
+                      options individually, the rest will be reset to default values.
+                type: int
+            ipmi_privilege:
+                description:
+                    - IPMI privilege level.
+                    - Please review the Host object documentation for more information on the supported properties
+                    - "https://www.zabbix.com/documentation/3.4/manual/api/reference/host/object"
+                    - Possible values are C(1) (callback), C(2) (user), C(3) (operator), C(4) (admin), C(5) (OEM), with C(2)
+                      being the API default.
+                    - also see the last note in the I(ipmi_authtype) documentation
+                type: int
+            ipmi_username:
+                description:
+                    - IPMI username.
+                    - also see the last note in the I(ipmi_authtype) documentation
+                type: str
+            ipmi_password:
+                description:
+                    - IPMI password.
+                    - also see the last note in the I(ipmi_authtype) documentation
+                type: str
+            macros:
+                description:
+                    - List of user macros to assign to the zabbix host.
+                    - Providing I(macros=[]) with I(force=yes) will clean all of the existing user macros from the host.
+                type: list
+                elements: dict
+                suboptions:
+                    macro:
+                        description:
+                            - Name of the user macro.
+                            - Can be in zabbix native format "{$MACRO}" or short format "MACRO".
+                        type: str
+                        required: true
+                    value:
+                        description:
+                            - Value of the user macro.
+                        type: str
+                        required: true
+                    description:
+                        description:
+                            - Description of the user macro.
+                        type: str
+                        required: false
+                        default: ""
+                    type:
+                        description:
+                            - Type of the macro.
+                            - Since value is not returned by API for secret macros, there is no reliable way to
+                              detect changes in the content of secret macro value.
+                            - To update secret macro value, please update description alongside it so it passes
+                              the check.
+                        choices: [text, secret]
+                        type: str
+                        required: false
+                        default: text
+                aliases: [ user_macros ]
+            tags:
+                description:
+                    - List of host tags to assign to the zabbix host.
+                    - Providing I(tags=[]) with I(force=yes) will clean all of the tags from the host.
+                type: list
+                elements: dict
+                suboptions:
+                    tag:
+                        description:
+                            - Name of the host tag.
+                        type: str
+                        required: true
+                    value:
+                        description:
+                            - Value of the host tag.
+                        type: str
+                        default: ""
+                aliases: [ host_tags ]
+    force:
+        description:
+            - Overwrite the host configuration, even if already present.
+            - Applies to all hosts in I(hosts).
+        type: bool
+        default: "yes"
+    batch_size:
+        description:
+            - Maximum number of hosts read or written in one API request.
+        type: int
+        default: 100
+
+extends_documentation_fragment:
+- community.zabbix.zabbix
+
+"""
+
+EXAMPLES = r"""
+# If you want to use Username and Password to be authenticated by Zabbix Server
+- name: Set credentials to access Zabbix Server API
+  ansible.builtin.set_fact:
+    ansible_user: Admin
+    ansible_httpapi_pass: zabbix
+
+# If you want to use API token to be authenticated by Zabbix Server
+# https://www.zabbix.com/documentation/current/en/manual/web_interface/frontend_sections/administration/general#api-tokens
+- name: Set API token
+  ansible.builtin.set_fact:
+    ansible_zabbix_auth_key: 8ec0d52432c15c91fcafe9888500cf9a607f44091ab554dbee860f6b44fac895
+
+- name: Manage several hosts
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_hosts:
+    hosts:
+      - host_name: ExampleHost1
+        host_groups:
+          - Example group1
+        link_templates:
+          - Example template1
+        interfaces:
+          - type: agent
+            main: 1
+            useip: 1
+            ip: 10.1.1.1
+        macros:
+          - macro: EXAMPLEMACRO
+            value: ExampleMacroValue
+        tags:
+          - tag: ExampleHostsTag
+      - host_name: ExampleHost2
+        host_groups:
+          - Example group1
+        interfaces:
+          - type: agent
+            main: 1
+            useip: 1
+            ip: 10.1.1.2
+      - host_name: ExampleHost3
+        state: absent
+"""
+
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
+
+import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
+import ansible_collections.community.zabbix.plugins.module_utils.host_helpers as host_utils
+
+
+class Hosts(ZabbixBase):
+    def get_hosts_by_host_names(self, host_names, batch_size):
+        """Get existing hosts with their interfaces, macros, tags, templates and groups.
+
+        Args:
+            host_names: list of host names
+            batch_size: maximum number of hosts requested at once
+
+        Returns:
+            dict: {host name: host}, groups are returned in "groups" regardless of the Zabbix version
+        """
+        if self._capabilities.split_template_groups:
+            select_groups = "selectHostGroups"
+            groups_key = "hostgroups"
+        else:
+            select_groups = "selectGroups"
+            groups_key = "groups"
+
+        hosts = {}
+        for i in range(0, len(host_names), batch_size):
+            params = {
+                "output": host_utils.HOST_GET_OUTPUT,
+                "selectInventory": "extend",
+                "selectMacros": "extend",
+                "selectTags": ["tag", "value"],
+                "selectInterfaces": "extend",
+                "selectParentTemplates": ["templateid"],
+                select_groups: ["groupid"],
+                "filter": {"host": host_names[i:i + batch_size]}
+            }
+            for host in self._zapi.host.get(params):
+                host["groups"] = host.pop(groups_key, [])
+                # merge_host_interfaces() copies the hostid of the existing interfaces to the requested ones,
+                # hostinterface.get always returns it but selectInterfaces may not
+                for interface in host["interfaces"]:
+                    interface.setdefault("hostid", host["hostid"])
+                hosts[host["host"]] = host
+        return hosts
+
+    def get_ids(self, object_type, names, label):
+        ids = self._resolver.get_ids(object_type, names)
+        for name in names:
+            if name not in ids:
+                self._module.fail_json(msg="%s not found: %s" % (label, name))
+        return ids
+
+    def create_params(self, spec, group_ids, template_ids, proxy_id, interfaces, macros, tags):
+        parameters = {"host": spec["host_name"], "interfaces": interfaces, "groups": group_ids, "status": spec["status"]}
+        if proxy_id:
+            parameters["proxy_hostid"] = proxy_id
+        if spec["visible_name"]:
+            parameters["name"] = spec["visible_name"]
+        if spec["tls_connect"]:
+            parameters["tls_connect"] = spec["tls_connect"]
+        if spec["tls_accept"]:
+            parameters["tls_accept"] = spec["tls_accept"]
+        for key in ["tls_psk_identity", "tls_psk", "tls_subject", "ipmi_authtype", "ipmi_privilege", "ipmi_username", "ipmi_password"]:
+            if spec[key] is not None:
+                parameters[key] = spec[key]
+        if spec["ca_cert"] is not None:
+            parameters["tls_issuer"] = spec["ca_cert"]
+        if spec["description"]:
+            parameters["description"] = spec["description"]
+        if macros is not None:
+            parameters["macros"] = macros
+        if tags is not None:
+            parameters["tags"] = tags
+        if template_ids:
+            parameters["templates"] = [{"templateid": template_id} for template_id in template_ids]
+        if spec["inventory_mode"]:
+            parameters["inventory_mode"] = host_utils.inventory_mode_numeric(spec["inventory_mode"])
+        if spec["inventory_zabbix"]:
+            parameters["inventory"] = spec["inventory_zabbix"]
+        return parameters
+
+    def update_params(self, spec, host, group_ids, template_ids, proxy_id, interfaces, macros, tags, changes):
+        """Return the host.update parameters of the properties listed in changes, see get_host_changes()."""
+        return host_utils.get_host_update_params(
+            host["hostid"], changes, host["flags"] == "4", group_ids, spec["status"], interfaces, template_ids,
+            [t["templateid"] for t in host["parentTemplates"]], proxy_id, spec["visible_name"], spec["description"],
+            spec["inventory_mode"], spec["inventory_zabbix"], spec["tls_accept"], spec["tls_psk_identity"],
+            spec["tls_psk"], spec["ca_cert"], spec["tls_subject"], spec["tls_connect"], spec["ipmi_authtype"],
+            spec["ipmi_privilege"], spec["ipmi_username"], spec["ipmi_password"], macros, tags)
+
+    def apply(self, method, objects, batch_size):
+        """Send objects to host.create, host.update or host.delete in chunks of batch_size."""
+        result_ids = []
+        for i in range(0, len(objects), batch_size):
+            try:
+                result = getattr(self._zapi.host, method)(objects[i:i + batch_size])
+            except Exception as e:
+                self._module.fail_json(msg="Failed to %s hosts: %s" % (method, e))
+            result_ids.extend(result.get("hostids", []))
+        return result_ids
+
+
+def main():
+    interfaces_spec = dict(
+        type="list",
+        elements="dict",
+        default=[],
+        options=dict(
+            type=dict(type="str", required=True, choices=["agent", "1", "snmp", "2", "ipmi", "3", "jmx", "4"]),
+            main=dict(type="int", choices=[0, 1], default=0),
+            useip=dict(type="int", choices=[0, 1], default=0),
+            ip=dict(type="str"),
+            dns=dict(type="str"),
+            port=dict(type="str"),
+            details=dict(
+                type="dict",
+                default={},
+                options=dict(
+                    version=dict(type="int", choices=[1, 2, 3], default=2),
+                    bulk=dict(type="int", choices=[0, 1], default=1),
+                    community=dict(type="str", default=""),
+                    securityname=dict(type="str", default=""),
+                    contextname=dict(type="str", default=""),
+                    securitylevel=dict(type="int", choices=[0, 1, 2], default=0),
+                    authprotocol=dict(type="int", choices=[0, 1, 2, 3, 4, 5], default=0),
+                    authpassphrase=dict(type="str", default="", no_log=True),
+                    privprotocol=dict(type="int", choices=[0, 1, 2, 3, 4, 5], default=0),
+                    privpassphrase=dict(type="str", default="", no_log=True)
+                )
+            )
+        ),
+        required_if=[
+            ["useip", 0, ["dns"]],
+            ["useip", 1, ["ip"]]
+        ]
+    )
+    host_spec = dict(
+        host_name=dict(type="str", required=True),
+        host_groups=dict(type="list", required=False, elements="str"),
+        link_templates=dict(type="list", required=False, elements="str"),
+        status=dict(type="str", default="enabled", choices=["enabled", "disabled"]),
+        state=dict(type="str", default="present", choices=["present", "absent"]),
+        inventory_mode=dict(type="str", required=False, choices=["automatic", "manual", "disabled"]),
+        ipmi_authtype=dict(type="int", default=None),
+        ipmi_privilege=dict(type="int", default=None),
+        ipmi_username=dict(type="str", required=False, default=None),
+        ipmi_password=dict(type="str", required=False, default=None, no_log=True),
+        tls_connect=dict(type="int", required=False),
+        tls_accept=dict(type="int", required=False),
+        tls_psk_identity=dict(type="str", required=False),
+        tls_psk=dict(type="str", required=False, no_log=True),
+        ca_cert=dict(type="str", required=False, aliases=["tls_issuer"]),
+        tls_subject=dict(type="str", required=False),
+        inventory_zabbix=dict(type="dict", required=False),
+        interfaces=interfaces_spec,
+        proxy=dict(type="str", required=False),
+        visible_name=dict(type="str", required=False),
+        description=dict(type="str", required=False),
+        macros=dict(
+            type="list",
+            elements="dict",
+            aliases=["user_macros"],
+            options=dict(
+                macro=dict(type="str", required=True),
+                value=dict(type="str", required=True),
+                description=dict(type="str", default=""),
+                type=dict(type="str", default="text", choices=["text", "secret"])
+            )
+        ),
+        tags=dict(
+            type="list",
+            elements="dict",
+            aliases=["host_tags"],
+            options=dict(
+                tag=dict(type="str", required=True),
+                value=dict(type="str", default="")
+            )
+        )
+    )
+    argument_spec = zabbix_utils.zabbix_common_argument_spec()
+    argument_spec.update(dict(
+        hosts=dict(type="list", required=True, elements="dict", options=host_spec),
+        force=dict(type="bool", default=True),
+        batch_size=dict(type="int", default=100)
+    ))
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True
+    )
+
+    specs = module.params["hosts"]
+    force = module.params["force"]
+    batch_size = module.params["batch_size"]
+
+    if batch_size < 1:
+        module.fail_json(msg="batch_size must be greater than 0")
+
+    host_names = [spec["host_name"] for spec in specs]
+    duplicates = sorted(set(name for name in host_names if host_names.count(name) > 1))
+    if duplicates:
+        module.fail_json(msg="Hosts defined more than once: %s" % ", ".join(duplicates))
+
+    hosts = Hosts(module)
+
+    # resolve all referenced names in one request
+    for spec in specs:
+        if spec["state"] == "present":
+            hosts._resolver.add("template", spec["link_templates"])
+            hosts._resolver.add("hostgroup", spec["host_groups"])
+            if spec["proxy"]:
+                hosts._resolver.add("proxy", [spec["proxy"]])
+    hosts._resolver.resolve()
+
+    exist_hosts = hosts.get_hosts_by_host_names(host_names, batch_size)
+
+    to_create = []
+    to_update = []
+    to_delete = []
+    created = []
+    updated = []
+    deleted = []
+    for spec in specs:
+        host_name = spec["host_name"]
+        zabbix_host_obj = exist_hosts.get(host_name)
+
+        if spec["state"] == "absent":
+            if zabbix_host_obj:
+                to_delete.append(zabbix_host_obj["hostid"])
+                deleted.append(host_name)
+            continue
+
+        # convert enabled to 0; disabled to 1
+        spec["status"] = 1 if spec["status"] == "disabled" else 0
+
+        template_ids = []
+        if spec["link_templates"]:
+            resolved = hosts.get_ids("template", spec["link_templates"], "Template")
+            template_ids = [resolved[name] for name in spec["link_templates"]]
+
+        group_ids = []
+        if spec["host_groups"]:
+            resolved = hosts.get_ids("hostgroup", spec["host_groups"], "Hostgroup")
+            group_ids = [{"groupid": group_id} for group_id in sorted(set(resolved.values()))]
+
+        interfaces, dummy = host_utils.construct_host_interfaces(module, spec["interfaces"])
+        macros = host_utils.normalize_host_macros(spec["macros"])
+        tags = spec["tags"]
+
+        # Use proxy specified, or set to 0
+        if spec["proxy"]:
+            proxy_id = int(hosts.get_ids("proxy", [spec["proxy"]], "Proxy")[spec["proxy"]])
+        else:
+            proxy_id = 0
+
+        if not zabbix_host_obj:
+            if not group_ids:
+                module.fail_json(msg="Specify at least one group for creating host '%s'." % host_name)
+            to_create.append(hosts.create_params(spec, group_ids, template_ids, proxy_id, interfaces, macros, tags))
+            created.append(host_name)
+            continue
+
+        # If proxy is not specified, use the existing setting
+        if spec["proxy"] is None:
+            proxy_id = int(zabbix_host_obj["proxy_hostid"])
+
+        exist_group_ids = [{"groupid": group["groupid"]} for group in zabbix_host_obj["groups"]]
+        exist_template_ids = [template["templateid"] for template in zabbix_host_obj["parentTemplates"]]
+
+        if not spec["host_groups"]:
+            # if host_groups have not been specified when updating an existing host, just
+            # get the group_ids from the existing host without updating them.
+            group_ids = list(exist_group_ids)
+
+        exist_interfaces = host_utils.normalize_exist_interfaces(zabbix_host_obj["interfaces"])
+        host_utils.merge_host_interfaces(interfaces, exist_interfaces, force)
+
+        if not force or spec["link_templates"] is None:
+            template_ids = list(set(template_ids + exist_template_ids))
+
+        if not force:
+            for group_id in exist_group_ids:
+                if group_id not in group_ids:
+                    group_ids.append(group_id)
+
+            # Macros not present in host.update will be removed if we dont copy them when force=no
+            if macros is not None:
+                host_utils.merge_host_macros(macros, zabbix_host_obj["macros"])
+
+            # Tags not present in host.update will be removed if we dont copy them when force=no
+            if tags is not None:
+                host_utils.merge_host_tags(tags, zabbix_host_obj["tags"])
+
+        changes = host_utils.get_host_changes(
+            zabbix_host_obj, exist_interfaces, exist_group_ids, exist_template_ids, group_ids, spec["status"],
+            interfaces, template_ids, proxy_id, spec["visible_name"], spec["description"], spec["inventory_mode"],
+            spec["inventory_zabbix"], spec["tls_accept"], spec["tls_psk_identity"], spec["tls_psk"], spec["ca_cert"],
+            spec["tls_subject"], spec["tls_connect"], spec["ipmi_authtype"], spec["ipmi_privilege"],
+            spec["ipmi_username"], spec["ipmi_password"], macros, tags)
+        if changes:
+            to_update.append(hosts.update_params(spec, zabbix_host_obj, group_ids, template_ids, proxy_id, interfaces, macros, tags,
+                                                 changes))
+            updated.append(host_name)
+
+    changed = bool(to_create or to_update or to_delete)
+    if changed and not module.check_mode:
+        hosts.apply("delete", to_delete, batch_size)
+        hosts.apply("update", to_update, batch_size)
+        hosts.apply("create", to_create, batch_size)
+
+    module.exit_json(changed=changed, created=created, updated=updated, deleted=deleted)
+
+
+if __name__ == "__main__":
+    main()
@@ -368,19 +368,17 @@ class Map(ZabbixBase):
     # get list of map elements (nodes)
     def _get_selements(self, graph, nodes, icon_ids):
         selements = []
-        icon_sizes = {}
         scales = self._get_scales(graph)
-        for selementid, (node, data) in enumerate(nodes.items(), start=1):
+        images_infos = [self._get_images_info(data, icon_ids) for data in nodes.values()]
+        icon_sizes = self._get_icon_sizes(set(images_info["iconid_off"] for images_info in images_infos))
+        for selementid, ((node, data), images_info) in enumerate(zip(nodes.items(), images_infos), start=1):
             selement = {
                 "selementid": selementid
             }
             data["selementid"] = selementid
 
-            images_info = self._get_images_info(data, icon_ids)
             selement.update(images_info)
             image_id = images_info["iconid_off"]
-            if image_id not in icon_sizes:
-                icon_sizes[image_id] = self._get_icon_size(image_id)
 
             pos = self._convert_coordinates(data["pos"], scales, icon_sizes[image_id])
             selement.update(pos)
@@ -649,20 +647,20 @@ class Map(ZabbixBase):
             icon_ids[icon["name"]] = icon["imageid"]
         return icon_ids
 
-    def _get_icon_size(self, icon_id):
+    def _get_icon_sizes(self, icon_ids):
+        """ Get the sizes of the icons, the images are downloaded with a single request """
         icons_list = self._zapi.image.get({
-            "imageids": [
-                icon_id
-            ],
+            "imageids": sorted(icon_ids),
             "select_image": True
         })
-        if len(icons_list) > 0:
-            icon_base64 = icons_list[0]["image"]
-        else:
-            self._module.fail_json(msg="Failed to find image with id %s" % icon_id)
-        image = Image.open(BytesIO(base64.b64decode(icon_base64)))
-        icon_width, icon_height = image.size
-        return icon_width, icon_height
+        icons = dict((icon["imageid"], icon["image"]) for icon in icons_list)
+        icon_sizes = {}
+        for icon_id in sorted(icon_ids):
+            if icon_id not in icons:
+                self._module.fail_json(msg="Failed to find image with id %s" % icon_id)
+            image = Image.open(BytesIO(base64.b64decode(icons[icon_id])))
+            icon_sizes[icon_id] = image.size
+        return icon_sizes
 
     @staticmethod
     def _get_node_attributes(node):
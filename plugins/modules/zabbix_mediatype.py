@@ -416,7 +416,6 @@ EXAMPLES = r"""
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
-from ansible.module_utils.compat.version import LooseVersion
 
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
@@ -534,7 +533,7 @@ class MediaTypeModule(ZabbixBase):
             return parameters
 
         elif self._module.params["type"] == "script":
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.4"):
+            if not self._capabilities.script_parameter_objects:
                 if self._module.params["script_params"] is None:
                     _script_params = ""  # ZBX-15706
                 else:
@@ -627,7 +626,7 @@ class MediaTypeModule(ZabbixBase):
             for key in kwargs:
                 # sort list of parameters to prevent mismatch due to reordering
                 if key == "parameters" and (kwargs[key] != [] or existing_mediatype[key] != []):
-                    if LooseVersion(self._zbx_api_version) < LooseVersion("6.4"):
+                    if not self._capabilities.script_parameter_objects:
                         kwargs[key] = sorted(kwargs[key], key=lambda x: x["name"])
                         existing_mediatype[key] = sorted(existing_mediatype[key], key=lambda x: x["name"])
                     else:
@@ -0,0 +1,421 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+module: zabbix_problem_info
+short_description: Gather information about Zabbix problems
+version_added: 2.2.0
+description:
+    - This module allows you to get the problems of Zabbix, filtered by the Zabbix server.
+    - Problems are read with the C(problem.get) API method, in pages of I(page_size) problems ordered by event ID.
+      The I(next_eventid) return value is the cursor to pass as I(eventid_from) to get the next page.
+    - All the filters are applied by the Zabbix server.
+    - The problems can be written to a local file, one JSON object per line, instead of being returned.
+requirements:
+    - "python >= 3.9"
+options:
+    host_groups:
+        description:
+            - Only return the problems of the hosts of these host groups.
+        required: false
+        type: list
+        elements: str
+    hosts:
+        description:
+            - Only return the problems of these hosts, by technical name.
+        required: false
+        type: list
+        elements: str
+    severities:
+        description:
+            - Only return the problems with these severities.
+        required: false
+        type: list
+        elements: str
+        choices:
+            - not_classified
+            - information
+            - warning
+            - average
+            - high
+            - disaster
+    tags:
+        description:
+            - Only return the problems with these tags.
+        required: false
+        type: list
+        elements: dict
+        suboptions:
+            tag:
+                description:
+                    - Name of the tag.
+                type: str
+                required: true
+            value:
+                description:
+                    - Value of the tag.
+                type: str
+                default: ""
+            operator:
+                description:
+                    - Condition operator.
+                type: str
+                default: contains
+                choices:
+                    - contains
+                    - equals
+                    - not_like
+                    - not_equal
+                    - exists
+                    - not_exists
+    tags_evaltype:
+        description:
+            - Whether all the I(tags) (C(and_or)) or any of them (C(or)) must match.
+        required: false
+        type: str
+        default: and_or
+        choices:
+            - and_or
+            - or
+    acknowledged:
+        description:
+            - Only return the acknowledged problems if true, only the unacknowledged ones if false.
+        required: false
+        type: bool
+    suppressed:
+        description:
+            - Only return the suppressed problems if true, only the unsuppressed ones if false.
+        required: false
+        type: bool
+    recent:
+        description:
+            - Also return the problems resolved recently.
+        required: false
+        default: false
+        type: bool
+    time_from:
+        description:
+            - Only return the problems created at or after this Unix timestamp.
+        required: false
+        type: int
+    time_till:
+        description:
+            - Only return the problems created at or before this Unix timestamp.
+        required: false
+        type: int
+    output_fields:
+        description:
+            - Problem fields to return, all of them by default.
+            - C(eventid) is always returned.
+        required: false
+        type: list
+        elements: str
+    select_tags:
+        description:
+            - Return the tags of each problem.
+        required: false
+        default: true
+        type: bool
+    select_acknowledges:
+        description:
+            - Return the acknowledges of each problem.
+        required: false
+        default: false
+        type: bool
+    eventid_from:
+        description:
+            - Only return the problems with an event ID greater than or equal to this one.
+            - Pass the I(next_eventid) of the previous run to get the next page or the problems created since then.
+        required: false
+        type: str
+    page_size:
+        description:
+            - Maximum number of problems requested by each C(problem.get) call.
+        required: false
+        default: 1000
+        type: int
+    all_pages:
+        description:
+            - Request pages until all the matching problems are read, instead of returning a single page.
+        required: false
+        default: false
+        type: bool
+    ndjson_path:
+        description:
+            - Write the problems to this local file, one JSON object per line, instead of returning them in I(problems).
+            - Pages are written as they are read, so the problems are never all held in memory.
+            - The file is replaced once all the pages are written.
+        required: false
+        type: path
+extends_documentation_fragment:
+- community.zabbix.zabbix
+
+"""
+
+EXAMPLES = """
+# If you want to use Username and Password to be authenticated by Zabbix Server
+- name: Set credentials to access Zabbix Server API
+  ansible.builtin.set_fact:
+    ansible_user: Admin
+    ansible_httpapi_pass: zabbix
+
+# If you want to use API token to be authenticated by Zabbix Server
+# https://www.zabbix.com/documentation/current/en/manual/web_interface/frontend_sections/administration/general#api-tokens
+- name: Set API token
+  ansible.builtin.set_fact:
+    ansible_zabbix_auth_key: 8ec0d52432c15c91fcafe9888500cf9a607f44091ab554dbee860f6b44fac895
+
+- name: Get the unacknowledged high and disaster problems of the Linux servers
+  # set task level variables as we change ansible_connection plugin here
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_problem_info:
+    host_groups:
+      - Linux servers
+    severities:
+      - high
+      - disaster
+    acknowledged: false
+    tags:
+      - tag: service
+        value: web
+        operator: equals
+  register: zbx_problems
+
+- name: Get the problems created since the last poll
+  vars:
+    ansible_network_os: community.zabbix.zabbix
+    ansible_connection: httpapi
+    ansible_httpapi_port: 443
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_zabbix_url_path: "zabbixeu"  # If Zabbix WebUI runs on non-default (zabbix) path ,e.g. http://<FQDN>/zabbixeu
+    ansible_host: zabbix-example-fqdn.org
+  community.zabbix.zabbix_problem_info:
+    eventid_from: "{{ last_poll.next_eventid | default(omit) }}"
+    all_pages: true
+    ndjson_path: /var/tmp/zabbix_problems.ndjson
+  register: last_poll
+"""
+
+RETURN = """
+problems:
+  description: The problems, empty if I(ndjson_path) is set.
+  returned: always
+  type: list
+  elements: dict
+  sample: [
+    {
+      "acknowledged": "0",
+      "clock": "1700000000",
+      "eventid": "1205",
+      "name": "High CPU utilization",
+      "ns": "0",
+      "object": "0",
+      "objectid": "23297",
+      "opdata": "",
+      "r_clock": "0",
+      "r_eventid": "0",
+      "r_ns": "0",
+      "severity": "4",
+      "source": "0",
+      "suppressed": "0",
+      "tags": [
+        {
+          "tag": "service",
+          "value": "web"
+        }
+      ]
+    }
+  ]
+count:
+  description: Number of problems returned or written to I(ndjson_path).
+  returned: always
+  type: int
+  sample: 1
+next_eventid:
+  description:
+    - Event ID following the last problem read, to pass as I(eventid_from) to get the next page or, once all
+      the problems were read, the problems created since this run.
+    - Null if no problem was read and I(eventid_from) is not set.
+  returned: always
+  type: str
+  sample: "1206"
+more:
+  description: Whether more problems match after I(next_eventid), i.e. only one page of problems was read.
+  returned: always
+  type: bool
+  sample: false
+ndjson_path:
+  description: Path of the file the problems were written to.
+  returned: when I(ndjson_path) is set
+  type: str
+  sample: /var/tmp/zabbix_problems.ndjson
+"""
+
+
+import os
+import tempfile
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
+from ansible_collections.community.zabbix.plugins.module_utils.codec import json_dumps
+import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
+
+
+SEVERITIES = {"not_classified": 0, "information": 1, "warning": 2, "average": 3, "high": 4, "disaster": 5}
+TAG_OPERATORS = {"contains": 0, "equals": 1, "not_like": 2, "not_equal": 3, "exists": 4, "not_exists": 5}
+TAG_EVALTYPES = {"and_or": 0, "or": 2}
+
+
+class Problem(ZabbixBase):
+    next_eventid = None
+    more = False
+
+    def get_ids(self, object_type, names, label):
+        ids = self._resolver.get_ids(object_type, names)
+        missing = [name for name in names if name not in ids]
+        if missing:
+            self._module.fail_json(msg="%s not found: %s" % (label, ", ".join(missing)))
+        return list(ids.values())
+
+    def get_params(self):
+        output_fields = self._module.params["output_fields"]
+        if output_fields and "eventid" not in output_fields:
+            # eventid is needed to page through the problems
+            output_fields = output_fields + ["eventid"]
+        params = {
+            "output": output_fields or "extend",
+            "recent": self._module.params["recent"],
+            "sortfield": ["eventid"],
+            "sortorder": "ASC",
+        }
+        if self._module.params["host_groups"]:
+            params["groupids"] = self.get_ids("hostgroup", self._module.params["host_groups"], "Host group(s)")
+        if self._module.params["hosts"]:
+            params["hostids"] = self.get_ids("host", self._module.params["hosts"], "Host(s)")
+        if self._module.params["severities"]:
+            params["severities"] = [SEVERITIES[severity] for severity in self._module.params["severities"]]
+        if self._module.params["tags"]:
+            params["tags"] = [{"tag": tag["tag"], "value": tag["value"], "operator": TAG_OPERATORS[tag["operator"]]}
+                              for tag in self._module.params["tags"]]
+            params["evaltype"] = TAG_EVALTYPES[self._module.params["tags_evaltype"]]
+        for key in ("acknowledged", "suppressed", "time_from", "time_till"):
+            if self._module.params[key] is not None:
+                params[key] = self._module.params[key]
+        if self._module.params["select_tags"]:
+            params["selectTags"] = "extend"
+        if self._module.params["select_acknowledges"]:
+            params["selectAcknowledges"] = "extend"
+        return params
+
+    def get_pages(self, params, eventid_from, page_size, all_pages):
+        """
+        Yield pages of page_size problems from eventid_from, only the first one unless all_pages is true.
+        self.next_eventid follows the last problem read and self.more tells if there are more problems after it.
+        """
+        self.next_eventid = eventid_from
+        while True:
+            page_params = dict(params, limit=page_size)
+            if self.next_eventid is not None:
+                page_params["eventid_from"] = self.next_eventid
+            problems = self._zapi.problem.get(page_params)
+            if problems:
+                self.next_eventid = str(int(problems[-1]["eventid"]) + 1)
+            # a page shorter than the limit is the last one
+            self.more = len(problems) >= page_size
+            yield problems
+            if not self.more or not all_pages:
+                break
+
+
+def write_ndjson(module, path, pages):
+    """Write the problems of each page to path, one JSON object per line, return the number of problems."""
+    count = 0
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".zabbix_problem_info", dir=os.path.dirname(os.path.abspath(path)))
+    except (IOError, OSError) as e:
+        module.fail_json(msg="Failed to write problems to %s: %s" % (path, e))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for page in pages:
+                f.write(b"".join(json_dumps(problem) + b"\n" for problem in page))
+                count += len(page)
+        module.atomic_move(tmp_path, path)
+    except (IOError, OSError) as e:
+        module.fail_json(msg="Failed to write problems to %s: %s" % (path, e))
+    finally:
+        # left behind when reading a page or writing failed
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return count
+
+
+def main():
+    argument_spec = zabbix_utils.zabbix_common_argument_spec()
+    argument_spec.update(dict(
+        host_groups=dict(type="list", required=False, elements="str"),
+        hosts=dict(type="list", required=False, elements="str"),
+        severities=dict(type="list", required=False, elements="str", choices=list(SEVERITIES)),
+        tags=dict(
+            type="list",
+            required=False,
+            elements="dict",
+            options=dict(
+                tag=dict(type="str", required=True),
+                value=dict(type="str", default=""),
+                operator=dict(type="str", default="contains", choices=list(TAG_OPERATORS)),
+            )),
+        tags_evaltype=dict(type="str", required=False, default="and_or", choices=list(TAG_EVALTYPES)),
+        acknowledged=dict(type="bool", required=False),
+        suppressed=dict(type="bool", required=False),
+        recent=dict(type="bool", required=False, default=False),
+        time_from=dict(type="int", required=False),
+        time_till=dict(type="int", required=False),
+        output_fields=dict(type="list", required=False, elements="str"),
+        select_tags=dict(type="bool", required=False, default=True),
+        select_acknowledges=dict(type="bool", required=False, default=False),
+        eventid_from=dict(type="str", required=False),
+        page_size=dict(type="int", required=False, default=1000),
+        all_pages=dict(type="bool", required=False, default=False),
+        ndjson_path=dict(type="path", required=False),
+    ))
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True
+    )
+
+    if module.params["page_size"] < 1:
+        module.fail_json(msg="page_size must be greater than 0")
+    ndjson_path = module.params["ndjson_path"]
+
+    problem = Problem(module)
+    pages = problem.get_pages(problem.get_params(), module.params["eventid_from"],
+                              module.params["page_size"], module.params["all_pages"])
+
+    if ndjson_path:
+        count = write_ndjson(module, ndjson_path, pages)
+        module.exit_json(changed=False, problems=[], count=count, next_eventid=problem.next_eventid, more=problem.more,
+                         ndjson_path=ndjson_path)
+
+    problems = [item for page in pages for item in page]
+    module.exit_json(changed=False, problems=problems, count=len(problems), next_eventid=problem.next_eventid,
+                     more=problem.more)
+
+
+if __name__ == "__main__":
+    main()
@@ -133,7 +133,6 @@ msg:
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
-from ansible.module_utils.compat.version import LooseVersion
 
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
@@ -141,7 +140,7 @@ import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabb
 class RegularExpression(ZabbixBase):
     def __init__(self, module, zbx=None, zapi_wrapper=None):
         super(RegularExpression, self).__init__(module, zbx, zapi_wrapper)
-        if LooseVersion(self._zbx_api_version) < LooseVersion("6.0"):
+        if not self._capabilities.regexp_api:
             module.fail_json(
                 msg="This module doesn't support Zabbix versions lower than 6.0"
             )
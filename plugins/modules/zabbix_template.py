@@ -295,7 +295,6 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.six import PY2
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
-from ansible.module_utils.compat.version import LooseVersion
 
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
@@ -305,7 +304,7 @@ class Template(ZabbixBase):
     def get_group_ids_by_group_names(self, group_names):
         group_ids = []
         for group_name in group_names:
-            if LooseVersion(self._zbx_api_version) >= LooseVersion("6.2"):
+            if self._capabilities.split_template_groups:
                 group = self._zapi.templategroup.get({"output": ["groupid"], "filter": {"name": group_name}})
             else:
                 group = self._zapi.hostgroup.get({"output": ["groupid"], "filter": {"name": group_name}})
@@ -372,7 +371,7 @@ class Template(ZabbixBase):
 
         # If neither template_json or template_xml were used, user provided all parameters via module options
         if template_groups is not None:
-            if LooseVersion(self._zbx_api_version) >= LooseVersion("6.2"):
+            if self._capabilities.split_template_groups:
                 existing_groups = [g["name"] for g in existing_template["zabbix_export"]["template_groups"]]
             else:
                 existing_groups = [g["name"] for g in existing_template["zabbix_export"]["groups"]]
@@ -599,7 +598,7 @@ class Template(ZabbixBase):
             update_rules["templateDashboards"] = update_rules.pop("templateScreens")
 
             # before Zabbix 6.2 host_groups and template_group are joined into groups parameter
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.2"):
+            if not self._capabilities.split_template_groups:
                 update_rules["groups"] = {"createMissing": True}
                 update_rules.pop("host_groups", None)
                 update_rules.pop("template_groups", None)
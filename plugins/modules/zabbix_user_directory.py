@@ -421,7 +421,6 @@ EXAMPLES = r"""
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
-from ansible.module_utils.compat.version import LooseVersion
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
 
@@ -522,10 +521,10 @@ def main():
 
     user_directory = ZabbixBase(module)
 
-    if LooseVersion(user_directory._zbx_api_version) < LooseVersion("6.2"):
+    if not user_directory._capabilities.user_directories:
         module.fail_json(msg="Zabbix < 6.2 does not support user directories.")
 
-    if LooseVersion(user_directory._zbx_api_version) < LooseVersion("6.4"):
+    if not user_directory._capabilities.user_provisioning:
         parameters["search_filter"] = module.params["search_filter"]
         directory = user_directory._zapi.userdirectory.get(
             {"filter": {"name": parameters["name"]}}
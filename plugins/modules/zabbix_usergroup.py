@@ -323,7 +323,6 @@ msg:
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.zabbix.plugins.module_utils.base import ZabbixBase
-from ansible.module_utils.compat.version import LooseVersion
 import ansible_collections.community.zabbix.plugins.module_utils.helpers as zabbix_utils
 
 
@@ -533,7 +532,7 @@ class UserGroup(ZabbixBase):
             ),
             "tag_filters": kwargs["tag_filters"],
         }
-        if LooseVersion(self._zbx_api_version) < LooseVersion("6.2"):
+        if not self._capabilities.split_template_groups:
             _params["rights"] = kwargs["rights"]
         else:
             _params["hostgroup_rights"] = kwargs["hostgroup_rights"]
@@ -541,20 +540,14 @@ class UserGroup(ZabbixBase):
 
             if kwargs["userdirectory"]:
                 try:
-                    if LooseVersion(self._zbx_api_version) <= LooseVersion("6.2"):
-                        _userdir = self._zapi.userdirectory.get(
-                            {
-                                "output": "extend",
-                                "filter": {"name": [kwargs["userdirectory"]]},
-                            }
-                        )
-                    else:
-                        _userdir = self._zapi.userdirectory.get(
-                            {
-                                "output": "extend",
-                                "search": {"name": [kwargs["userdirectory"]]},
-                            }
-                        )
+                    # Zabbix reports x.y.z versions, so the former 'version <= "6.2"' test for
+                    # the "filter" lookup never matched and every version used "search"
+                    _userdir = self._zapi.userdirectory.get(
+                        {
+                            "output": "extend",
+                            "search": {"name": [kwargs["userdirectory"]]},
+                        }
+                    )
                 except Exception as e:
                     self._module.fail_json(
                         msg="Failed to get user directory '%s': %s"
@@ -598,7 +591,7 @@ class UserGroup(ZabbixBase):
             User group matching user group name.
         """
         try:
-            if LooseVersion(self._zbx_api_version) < LooseVersion("6.2"):
+            if not self._capabilities.split_template_groups:
                 _usergroup = self._zapi.usergroup.get(
                     {
                         "output": "extend",
@@ -794,7 +787,7 @@ def main():
 
     userGroup = UserGroup(module)
     zbx = userGroup._zapi
-    if LooseVersion(userGroup._zbx_api_version) < LooseVersion("6.2"):
+    if not userGroup._capabilities.split_template_groups:
         rgts = Rights(module, zbx)
     else:
         hostgroup_rgts = HostgroupRights(module, zbx)
@@ -815,7 +808,7 @@ def main():
                 msg="User group deleted: %s, ID: %s" % (name, usrgrpid),
             )
         else:
-            if LooseVersion(userGroup._zbx_api_version) < LooseVersion("6.2"):
+            if not userGroup._capabilities.split_template_groups:
                 difference = userGroup.check_difference(
                     usrgrpid=usrgrpid,
                     name=name,
@@ -867,7 +860,7 @@ def main():
                 msg="User group %s does not exists, nothing to delete" % name,
             )
         else:
-            if LooseVersion(userGroup._zbx_api_version) < LooseVersion("6.2"):
+            if not userGroup._capabilities.split_template_groups:
                 usrgrpid = userGroup.add(
                     name=name,
                     gui_access=gui_access,
@@ -37,6 +37,7 @@ from __future__ import print_function
 
 import os
 import sys
+import gzip
 import argparse
 import json
 import atexit
@@ -45,6 +46,19 @@ from ansible.module_utils.compat.version import LooseVersion
 from ansible.module_utils.urls import Request
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
+try:
+    # fast JSON codec of the collection, when the script runs next to an installed collection
+    from ansible_collections.community.zabbix.plugins.module_utils.codec import gzip_decompress, json_dumps, json_loads
+except ImportError:
+    def gzip_decompress(data):
+        # older ansible-core versions do not decompress responses by themselves
+        if data[:2] == b"\x1f\x8b":
+            return gzip.decompress(data)
+        return data
+
+    json_dumps = json.dumps
+    json_loads = json.loads
+
 
 class ZabbixInventory(object):
 
@@ -98,7 +112,7 @@ class ZabbixInventory(object):
         validate_certs = self.validate_certs
         timeout = self.timeout
 
-        headers = {"Content-Type": "application/json-rpc"}
+        headers = {"Content-Type": "application/json-rpc", "Accept-Encoding": "gzip"}
         payload = {
             "jsonrpc": "2.0",
             "method": method,
@@ -110,7 +124,7 @@ class ZabbixInventory(object):
             payload["params"] = params
 
         if self.auth != "":
-            if (LooseVersion(self.zabbix_version) >= LooseVersion("6.4")):
+            if self.bearer_auth:
                 headers["Authorization"] = "Bearer " + self.auth
             else:
                 payload["auth"] = self.auth
@@ -122,7 +136,7 @@ class ZabbixInventory(object):
             validate_certs=validate_certs
         )
         try:
-            response = req.post(api_url, data=json.dumps(payload))
+            response = json_loads(gzip_decompress(req.post(api_url, data=json_dumps(payload)).read()))
         except ValueError:
             print("Error: Something went wrong with JSON loading.", file=sys.stderr)
             sys.exit(1)
@@ -132,11 +146,12 @@ class ZabbixInventory(object):
         return response
 
     def get_version(self):
-        response = self.api_request(
+        res = self.api_request(
             "apiinfo.version"
         )
-        res = json.load(response)
         self.zabbix_version = res["result"]
+        # Zabbix >= 6.4 expects the session id in an "Authorization: Bearer" header
+        self.bearer_auth = LooseVersion(self.zabbix_version) >= LooseVersion("6.4")
 
     def login_zabbix(self):
         auth_token = self.auth_token
@@ -148,14 +163,13 @@ class ZabbixInventory(object):
 
         login_user = self.zabbix_username
         login_password = self.zabbix_password
-        response = self.api_request(
+        res = self.api_request(
             "user.login",
             {
                 "username": login_user,
                 "password": login_password
             }
         )
-        res = json.load(response)
         self.auth = res["result"]
 
     def logout_zabbix(self):
@@ -173,8 +187,7 @@ class ZabbixInventory(object):
 
         data = {"ansible_ssh_host": name}
         if self.use_host_interface or self.read_host_inventory:
-            response = self.api_request("host.get", api_query)
-            response_obj = json.load(response)
+            response_obj = self.api_request("host.get", api_query)
             if len(response_obj['result']) > 0:
                 host_data = response_obj['result'][0]
                 # check if zabbix api returned interfaces element
@@ -197,8 +210,7 @@ class ZabbixInventory(object):
         if self.read_host_inventory:
             api_query["selectInventory"] = "extend"
 
-        response = self.api_request("host.get", api_query)
-        hosts_data = json.load(response)["result"]
+        hosts_data = self.api_request("host.get", api_query)["result"]
         data = {"_meta": {"hostvars": {}}}
         data[self.defaultgroup] = self.hoststub()
         for host in hosts_data:
@@ -241,6 +253,7 @@ class ZabbixInventory(object):
         self.read_host_inventory = False
         self.use_host_interface = True
         self.zabbix_version = ""
+        self.bearer_auth = False
 
         self.meta = {}
 
@@ -0,0 +1,819 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+In-process stand-in for the Zabbix JSON-RPC API (api_jsonrpc.php).
+
+FakeZabbixAPI keeps the Zabbix objects in memory and implements the generic
+"<object>.get/create/update/delete" semantics used by the modules of this collection:
+output, filter, search, <object>ids and relation filters, select* joins, sorting, limit,
+countOutput and preservekeys. It is not a Zabbix server: it does not validate object
+properties beyond what the modules rely on.
+
+FakeZabbixServer serves a FakeZabbixAPI over HTTP on 127.0.0.1, with JSON-RPC batches,
+gzip compression, body and Bearer authentication, configurable per-call latency and failure
+injection, and counts API calls, bytes and connections.
+
+It can also be run standalone:
+
+    python tests/benchmarks/fake_zabbix.py --port 8080 --hosts 1000 --latency 0.005
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import copy
+import fnmatch
+import gzip
+import itertools
+import json
+import random
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+except ImportError:  # pragma: no cover, Python 2 is not supported by the benchmarks
+    raise SystemExit("The fake Zabbix server requires Python 3.7 or newer")
+
+
+# object type: (ID field, name field)
+OBJECT_TYPES = {
+    "action": ("actionid", "name"),
+    "auditlog": ("auditid", "resourcename"),
+    "drule": ("druleid", "name"),
+    "event": ("eventid", "name"),
+    "globalmacro": ("globalmacroid", "macro"),
+    "host": ("hostid", "host"),
+    "hostgroup": ("groupid", "name"),
+    "hostinterface": ("interfaceid", "ip"),
+    "maintenance": ("maintenanceid", "name"),
+    "mediatype": ("mediatypeid", "name"),
+    "problem": ("eventid", "name"),
+    "proxy": ("proxyid", "host"),
+    "role": ("roleid", "name"),
+    "script": ("scriptid", "name"),
+    "template": ("templateid", "host"),
+    "templategroup": ("groupid", "name"),
+    "token": ("tokenid", "name"),
+    "trigger": ("triggerid", "description"),
+    "user": ("userid", "username"),
+    "usergroup": ("usrgrpid", "name"),
+    "usermacro": ("hostmacroid", "macro"),
+}
+
+# properties set on new objects when not given
+DEFAULTS = {
+    "host": {"status": "0", "flags": "0", "description": "", "proxyid": "0", "inventory_mode": "-1",
+             "tls_connect": "1", "tls_accept": "1", "tls_issuer": "", "tls_subject": "",
+             "ipmi_authtype": "-1", "ipmi_privilege": "2", "ipmi_username": "", "ipmi_password": ""},
+    "template": {"description": ""},
+    "hostinterface": {"main": "1", "useip": "1", "ip": "", "dns": "", "port": "10050", "available": "0"},
+    "usermacro": {"type": "0", "description": ""},
+    "globalmacro": {"type": "0", "description": ""},
+    "action": {"status": "0", "esc_period": "1h"},
+    "usergroup": {"gui_access": "0", "users_status": "0", "debug_mode": "0"},
+    "trigger": {"value": "0", "priority": "0", "status": "0", "comments": "", "error": "", "expression": "",
+                "lastchange": "0", "state": "0", "type": "0", "url": ""},
+    "event": {"source": "0", "object": "0", "value": "1", "acknowledged": "0", "severity": "0", "r_eventid": "0"},
+    "problem": {"source": "0", "object": "0", "acknowledged": "0", "severity": "0", "r_eventid": "0"},
+}
+
+# objects of which there is a single instance, with get and update methods only
+SINGLETONS = {
+    "authentication": {"authentication_type": "0", "passwd_min_length": "8", "passwd_check_rules": "8",
+                       "http_auth_enabled": "0", "ldap_auth_enabled": "0", "saml_auth_enabled": "0"},
+    "housekeeping": {"hk_events_mode": "1", "hk_history_mode": "1", "hk_trends_mode": "1"},
+    "settings": {"default_lang": "en_US", "default_timezone": "system", "server_check_interval": "10"},
+}
+
+# methods callable without authentication
+NO_AUTH_METHODS = ("apiinfo.version", "user.login", "user.checkAuthentication")
+
+# auditlog resource types of the objects logged on create/update/delete
+AUDIT_RESOURCE_TYPES = {"host": "4"}
+
+
+class ZabbixAPIError(Exception):
+    def __init__(self, message, data="", code=-32602):
+        super(ZabbixAPIError, self).__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _stringify(value):
+    """Zabbix returns all scalar values as strings."""
+    if isinstance(value, dict):
+        return dict((k, _stringify(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_stringify(v) for v in value]
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _project(obj, output, keep=()):
+    """Apply the "output" parameter: scalar properties only, structured ones come from select* joins."""
+    if output in (None, "extend"):
+        return dict((k, v) for k, v in obj.items() if not isinstance(v, (list, dict)) and not k.startswith("_"))
+    if output == "count":
+        return {}
+    fields = _as_list(output)
+    return dict((k, obj[k]) for k in itertools.chain(fields, keep) if k in obj and not k.startswith("_"))
+
+
+class FakeZabbixAPI(object):
+    """
+    In-memory Zabbix objects and the JSON-RPC methods working on them.
+
+    latency is the time in seconds spent on each API call, method_latency overrides it per
+    method pattern (fnmatch), e.g. {"host.get": 0.05}.
+    failures maps method patterns to the probability of the call failing with a JSON-RPC error,
+    http_failure_rate is the probability of an HTTP request failing with HTTP 503.
+    """
+    def __init__(self, version="6.4.0", latency=0.0, method_latency=None, failures=None,
+                 http_failure_rate=0.0, seed=0, username="Admin", password="zabbix"):
+        self.version = version
+        self.latency = latency
+        self.method_latency = method_latency or {}
+        self.failures = failures or {}
+        self.http_failure_rate = http_failure_rate
+        self.random = random.Random(seed)
+        self.credentials = (username, password)
+        self.objects = dict((object_type, {}) for object_type in OBJECT_TYPES)
+        self.singletons = copy.deepcopy(SINGLETONS)
+        self.sessions = set()
+        self.api_tokens = set()
+        self._names = dict((object_type, {}) for object_type in OBJECT_TYPES)
+        self._children = {"hostinterface": {}, "usermacro": {}}
+        self._ids = itertools.count(10000)
+        self._lock = threading.RLock()
+        self.reset_stats()
+
+    # statistics
+
+    def reset_stats(self):
+        self.stats = {"requests": 0, "calls": 0, "errors": 0, "http_errors": 0, "connections": 0,
+                      "bytes_received": 0, "bytes_sent": 0, "methods": {}}
+
+    def _count(self, method):
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["methods"][method] = self.stats["methods"].get(method, 0) + 1
+
+    # JSON-RPC
+
+    def handle(self, request, authorization=None):
+        """Process a decoded JSON-RPC request or batch, return the response (None for notifications only)."""
+        if isinstance(request, list):
+            if not request:
+                return self._error(None, ZabbixAPIError("Invalid Request.", "Empty batch.", -32600))
+            responses = [self._handle_one(call, authorization) for call in request]
+            responses = [response for response in responses if response is not None]
+            return responses or None
+        return self._handle_one(request, authorization)
+
+    def _error(self, request_id, error):
+        return {"jsonrpc": "2.0", "id": request_id,
+                "error": {"code": error.code, "message": error.message, "data": error.data}}
+
+    def _handle_one(self, call, authorization):
+        request_id = call.get("id") if isinstance(call, dict) else None
+        try:
+            if not isinstance(call, dict) or call.get("jsonrpc") != "2.0" or "method" not in call:
+                raise ZabbixAPIError("Invalid Request.", "Invalid JSON-RPC request.", -32600)
+            method = call["method"]
+            self._count(method)
+            self._sleep(method)
+            self._inject_failure(method)
+            if method not in NO_AUTH_METHODS:
+                self._check_auth(call.get("auth") or authorization)
+            result = self.call(method, call.get("params", {}))
+        except ZabbixAPIError as e:
+            with self._lock:
+                self.stats["errors"] += 1
+            return self._error(request_id, e)
+        if "id" not in call:
+            return None
+        return {"jsonrpc": "2.0", "result": result, "id": request_id}
+
+    def _sleep(self, method):
+        latency = self.latency
+        for pattern, value in self.method_latency.items():
+            if fnmatch.fnmatchcase(method, pattern):
+                latency = value
+                break
+        if latency:
+            time.sleep(latency)
+
+    def _inject_failure(self, method):
+        for pattern, probability in self.failures.items():
+            if fnmatch.fnmatchcase(method, pattern) and self.random.random() < probability:
+                raise ZabbixAPIError("Application error.", "Injected failure of %s." % method, -32500)
+
+    def _check_auth(self, auth):
+        if auth not in self.sessions and auth not in self.api_tokens:
+            raise ZabbixAPIError("Invalid params.", "Session terminated, re-login, please.", -32602)
+
+    def call(self, method, params):
+        """Call an API method directly, raises ZabbixAPIError on errors."""
+        object_type, dummy, action = method.partition(".")
+        special = getattr(self, "_api_%s_%s" % (object_type, action), None)
+        with self._lock:
+            if special is not None:
+                return special(params)
+            if object_type in self.singletons and action in ("get", "update"):
+                if action == "update":
+                    self.singletons[object_type].update(_stringify(params))
+                    return list(params)
+                return _project(self.singletons[object_type], params.get("output", "extend"))
+            if object_type not in OBJECT_TYPES or action not in ("get", "create", "update", "delete"):
+                raise ZabbixAPIError("Method not found.", "Incorrect API \"%s\"." % method, -32601)
+            return getattr(self, action)(object_type, params)
+
+    # generic methods
+
+    def get(self, object_type, params):
+        params = params or {}
+        id_field, name_field = OBJECT_TYPES[object_type]
+        candidates = self._candidates(object_type, params)
+
+        for key, values in (params.get("filter") or {}).items():
+            values = set(_stringify(_as_list(values)))
+            candidates = [obj for obj in candidates if obj.get(key) in values]
+
+        search = dict((k, v) for k, v in (params.get("search") or {}).items() if v not in (None, "", []))
+        if search:
+            match = any if params.get("searchByAny") else all
+            candidates = [obj for obj in candidates if match(
+                self._search_match(obj.get(key, ""), value, params) for key, value in search.items())]
+
+        if object_type in ("event", "problem", "host"):
+            candidates = self._filter_events(candidates, params)
+
+        for field, bound, compare in (("time_from", "clock", 1), ("time_till", "clock", -1),
+                                      ("eventid_from", "eventid", 1), ("eventid_till", "eventid", -1)):
+            if params.get(field) is not None:
+                limit = int(params[field])
+                candidates = [obj for obj in candidates if (int(obj.get(bound, 0)) - limit) * compare >= 0]
+
+        if params.get("countOutput"):
+            return str(len(candidates))
+
+        sortfields = _as_list(params.get("sortfield"))
+        if sortfields:
+            descending = _as_list(params.get("sortorder"))[:1] == ["DESC"]
+            candidates.sort(key=lambda obj: [self._sort_key(obj.get(field, "")) for field in sortfields],
+                            reverse=descending)
+        if params.get("limit"):
+            candidates = candidates[:int(params["limit"])]
+
+        result = []
+        for obj in candidates:
+            item = _project(obj, params.get("output", "extend"), keep=[id_field] if params.get("preservekeys") else [])
+            for select, value in params.items():
+                if select.startswith("select") and value is not None:
+                    item.update(self._select(object_type, obj, select, value))
+            result.append(copy.deepcopy(item))
+
+        if params.get("preservekeys"):
+            return dict((candidate[id_field], item) for candidate, item in zip(candidates, result))
+        return result
+
+    def create(self, object_type, params):
+        id_field = OBJECT_TYPES[object_type][0]
+        ids = []
+        for properties in _as_list(params):
+            obj = dict(DEFAULTS.get(object_type, {}))
+            if object_type == "host" and self.version < "7.0":
+                obj["proxy_hostid"] = obj.pop("proxyid")
+            obj[id_field] = self.new_id()
+            self._store(object_type, obj, properties)
+            self._audit(object_type, "0", obj)
+            ids.append(obj[id_field])
+        return {id_field + "s": ids}
+
+    def update(self, object_type, params):
+        id_field = OBJECT_TYPES[object_type][0]
+        ids = []
+        for properties in _as_list(params):
+            obj = self._existing(object_type, properties.get(id_field))
+            self._store(object_type, obj, properties)
+            self._audit(object_type, "1", obj)
+            ids.append(obj[id_field])
+        return {id_field + "s": ids}
+
+    def delete(self, object_type, params):
+        id_field = OBJECT_TYPES[object_type][0]
+        ids = [str(object_id) for object_id in _as_list(params)]
+        objects = [self._existing(object_type, object_id) for object_id in ids]
+        for obj in objects:
+            self._remove(object_type, obj)
+            self._audit(object_type, "2", obj)
+        return {id_field + "s": ids}
+
+    # storage
+
+    def new_id(self):
+        return str(next(self._ids))
+
+    def _existing(self, object_type, object_id):
+        obj = self.objects[object_type].get(str(object_id))
+        if obj is None:
+            raise ZabbixAPIError("Invalid params.", "No permissions to referred object or it does not exist!")
+        return obj
+
+    def _index_name(self, object_type, obj, add):
+        name_field = OBJECT_TYPES[object_type][1]
+        if name_field not in obj:
+            return
+        ids = self._names[object_type].setdefault(obj[name_field], set())
+        if add:
+            ids.add(obj[OBJECT_TYPES[object_type][0]])
+        else:
+            ids.discard(obj[OBJECT_TYPES[object_type][0]])
+
+    def _store(self, object_type, obj, properties):
+        id_field = OBJECT_TYPES[object_type][0]
+        properties = dict(properties)
+        properties.pop(id_field, None)
+        self._index_name(object_type, obj, False)
+
+        children = {}
+        for key in ("interfaces", "macros"):
+            if key in properties and object_type in ("host", "template"):
+                children[key] = properties.pop(key)
+        if "templates_clear" in properties:
+            cleared = set(str(t["templateid"]) for t in properties.pop("templates_clear"))
+            obj["parentTemplates"] = [t for t in obj.get("parentTemplates", []) if t["templateid"] not in cleared]
+        if "templates" in properties:
+            obj["parentTemplates"] = [{"templateid": str(t["templateid"] if isinstance(t, dict) else t)}
+                                      for t in properties.pop("templates")]
+        if "groups" in properties:
+            obj["groups"] = [{"groupid": str(g["groupid"] if isinstance(g, dict) else g)} for g in properties.pop("groups")]
+        if "inventory" in properties:
+            obj["inventory"] = dict(obj.get("inventory") or {}, **_stringify(properties.pop("inventory") or {}))
+        if object_type == "host" and "name" not in properties and "name" not in obj:
+            obj["name"] = properties.get("host", "")
+        if object_type == "template" and "name" not in properties and "name" not in obj:
+            obj["name"] = properties.get("host", "")
+        obj.update(_stringify(properties))
+
+        self.objects[object_type][obj[id_field]] = obj
+        self._index_name(object_type, obj, True)
+
+        if "interfaces" in children:
+            self._replace_children("hostinterface", obj, children["interfaces"])
+        if "macros" in children:
+            self._replace_children("usermacro", obj, children["macros"])
+
+    def _replace_children(self, child_type, parent, children):
+        hostid = parent.get("hostid") or parent.get("templateid")
+        child_id = OBJECT_TYPES[child_type][0]
+        existing = self._children[child_type].pop(hostid, set())
+        kept = set()
+        for properties in children:
+            properties = dict(properties, hostid=hostid)
+            if properties.get(child_id) in existing:
+                child = self.objects[child_type][str(properties[child_id])]
+            else:
+                properties.pop(child_id, None)
+                child = dict(DEFAULTS.get(child_type, {}), **{child_id: self.new_id()})
+            self._store(child_type, child, properties)
+            kept.add(child[child_id])
+        for child_id_value in existing - kept:
+            self._remove(child_type, self.objects[child_type][child_id_value])
+        self._children[child_type][hostid] = kept
+
+    def _remove(self, object_type, obj):
+        id_field = OBJECT_TYPES[object_type][0]
+        self._index_name(object_type, obj, False)
+        self.objects[object_type].pop(obj[id_field], None)
+        if object_type in self._children and obj.get("hostid"):
+            self._children[object_type].get(obj["hostid"], set()).discard(obj[id_field])
+        if object_type in ("host", "template"):
+            for child_type in self._children:
+                for child_id in list(self._children[child_type].pop(obj[id_field], set())):
+                    self._remove(child_type, self.objects[child_type][child_id])
+
+    def _audit(self, object_type, action, obj):
+        resource_type = AUDIT_RESOURCE_TYPES.get(object_type)
+        if resource_type is None:
+            return
+        id_field, name_field = OBJECT_TYPES[object_type]
+        auditlog = {"auditid": self.new_id(), "clock": str(int(time.time())), "action": action,
+                    "resourcetype": resource_type, "resourceid": obj[id_field], "resourcename": obj.get(name_field, "")}
+        self.objects["auditlog"][auditlog["auditid"]] = auditlog
+
+    # get helpers
+
+    def _candidates(self, object_type, params):
+        id_field, name_field = OBJECT_TYPES[object_type]
+        objects = self.objects[object_type]
+        ids_param = id_field + "s"
+        if params.get(ids_param) is not None:
+            candidates = [objects[i] for i in _stringify(_as_list(params[ids_param])) if i in objects]
+        elif object_type in self._children and params.get("hostids") is not None:
+            ids = set()
+            for hostid in _stringify(_as_list(params["hostids"])):
+                ids.update(self._children[object_type].get(hostid, ()))
+            candidates = [objects[i] for i in ids]
+        elif name_field in (params.get("filter") or {}):
+            ids = set()
+            for name in _stringify(_as_list(params["filter"][name_field])):
+                ids.update(self._names[object_type].get(name, ()))
+            candidates = [objects[i] for i in ids]
+        else:
+            candidates = list(objects.values())
+
+        for related, values in params.items():
+            if related == ids_param or not related.endswith("ids") or values is None:
+                continue
+            if object_type in self._children and related == "hostids":
+                continue
+            values = set(_stringify(_as_list(values)))
+            candidates = [obj for obj in candidates if values & self._related_ids(object_type, obj, related)]
+        candidates.sort(key=lambda obj: self._sort_key(obj[id_field]))
+        return candidates
+
+    def _related_ids(self, object_type, obj, related):
+        """IDs of the objects of the "<related>ids" parameter the object is related to."""
+        if related == "groupids":
+            if object_type in ("trigger", "event", "problem"):
+                return set(g["groupid"] for hostid in self._related_ids(object_type, obj, "hostids")
+                           for g in self.objects["host"].get(hostid, {}).get("groups", []))
+            return set(g["groupid"] for g in obj.get("groups", []))
+        if related == "templateids" and object_type in ("host", "template"):
+            return set(t["templateid"] for t in obj.get("parentTemplates", []))
+        if related == "proxyids":
+            return set([obj.get("proxyid", "0"), obj.get("proxy_hostid", "0")])
+        if related == "hostids":
+            if object_type in ("hostgroup", "template"):
+                key, id_field = ("groups", "groupid") if object_type == "hostgroup" else ("parentTemplates", "templateid")
+                return set(host["hostid"] for host in self.objects["host"].values()
+                           if any(o[id_field] == obj[OBJECT_TYPES[object_type][0]] for o in host.get(key, [])))
+            if object_type in ("event", "problem"):
+                trigger = self.objects["trigger"].get(obj.get("objectid"), {})
+                return set(h["hostid"] for h in trigger.get("hosts", []))
+            return set(h["hostid"] for h in obj.get("hosts", [])) | set([obj.get("hostid")])
+        if related == "objectids":
+            return set([obj.get("objectid")])
+        return set([obj.get(related[:-1] + "id")])
+
+    @staticmethod
+    def _sort_key(value):
+        try:
+            return (0, int(value), "")
+        except (TypeError, ValueError):
+            return (1, 0, str(value))
+
+    @staticmethod
+    def _search_match(value, pattern, params):
+        value = str(value).lower()
+        patterns = [str(p).lower() for p in _as_list(pattern)]
+        for pattern in patterns:
+            if params.get("searchWildcardsEnabled"):
+                if fnmatch.fnmatchcase(value, pattern if params.get("startSearch") else "*%s*" % pattern):
+                    return True
+            elif value.startswith(pattern) if params.get("startSearch") else pattern in value:
+                return True
+        return False
+
+    @staticmethod
+    def _filter_events(candidates, params):
+        """Filters of event.get and problem.get: severities, acknowledged, suppressed and tags, also used for the tags of host.get."""
+        if params.get("severities") is not None:
+            severities = set(_stringify(_as_list(params["severities"])))
+            candidates = [obj for obj in candidates if obj.get("severity") in severities]
+        for flag in ("acknowledged", "suppressed"):
+            if params.get(flag) is not None:
+                candidates = [obj for obj in candidates if obj.get(flag, "0") == ("1" if params[flag] else "0")]
+        if params.get("tags"):
+            operators = {
+                0: lambda tags, t: any(tag["tag"] == t["tag"] and t.get("value", "") in tag["value"] for tag in tags),
+                1: lambda tags, t: any(tag["tag"] == t["tag"] and t.get("value", "") == tag["value"] for tag in tags),
+                2: lambda tags, t: not operators[0](tags, t),
+                3: lambda tags, t: not operators[1](tags, t),
+                4: lambda tags, t: any(tag["tag"] == t["tag"] for tag in tags),
+                5: lambda tags, t: not operators[4](tags, t),
+            }
+            match = any if int(params.get("evaltype", 0)) == 2 else all
+            candidates = [obj for obj in candidates if match(
+                operators[int(t.get("operator", 0))](obj.get("tags", []), t) for t in params["tags"])]
+        return candidates
+
+    def _select_objects(self, object_type, ids, output):
+        objects = self.objects[object_type]
+        return [_project(objects[i], output) for i in ids if i in objects]
+
+    def _select(self, object_type, obj, select, output):
+        if output == "count":
+            joined = self._select(object_type, obj, select, "extend")
+            return dict((key, str(len(value))) for key, value in joined.items())
+        if select in ("selectGroups", "selectHostGroups", "selectTemplateGroups"):
+            group_type = self._template_group_type() if object_type == "template" else "hostgroup"
+            key = {"selectGroups": "groups", "selectHostGroups": "hostgroups", "selectTemplateGroups": "templategroups"}[select]
+            return {key: self._select_objects(group_type, [g["groupid"] for g in obj.get("groups", [])], output)}
+        if select in ("selectParentTemplates", "selectTemplates") and object_type in ("host", "template"):
+            templates = self._select_objects("template", [t["templateid"] for t in obj.get("parentTemplates", [])], output)
+            return {select[6].lower() + select[7:]: templates}
+        if select == "selectInterfaces":
+            return {"interfaces": self._select_objects("hostinterface", self._child_ids("hostinterface", obj), output)}
+        if select == "selectMacros":
+            return {"macros": self._select_objects("usermacro", self._child_ids("usermacro", obj), output)}
+        if select == "selectHosts":
+            if object_type in ("hostgroup", "template"):
+                ids = self._reverse_related(object_type, obj)
+            else:
+                ids = [h["hostid"] for h in obj.get("hosts", [])]
+            return {"hosts": self._select_objects("host", ids, output)}
+        if select == "selectInventory":
+            inventory = obj.get("inventory") or []
+            if inventory and output != "extend":
+                inventory = dict((k, v) for k, v in inventory.items() if k in _as_list(output))
+            return {"inventory": inventory}
+        if select == "selectLastEvent":
+            events = [e for e in self.objects["event"].values() if e.get("objectid") == obj.get("triggerid")]
+            events.sort(key=lambda e: self._sort_key(e["eventid"]))
+            return {"lastEvent": _project(events[-1], output) if events else []}
+        # select<Property>, e.g. selectTags, selectOperations or selectRecoveryOperations
+        key = select[6].lower() + "".join("_" + c.lower() if c.isupper() else c for c in select[7:])
+        if key not in obj:
+            key = select[6].lower() + select[7:]
+        return {key: copy.deepcopy(obj.get(key, []))}
+
+    def _template_group_type(self):
+        return "templategroup" if self.version >= "6.2" else "hostgroup"
+
+    def _child_ids(self, child_type, obj):
+        return sorted(self._children[child_type].get(obj.get("hostid") or obj.get("templateid"), ()), key=self._sort_key)
+
+    def _reverse_related(self, object_type, obj):
+        object_id = obj[OBJECT_TYPES[object_type][0]]
+        key, id_field = ("groups", "groupid") if object_type == "hostgroup" else ("parentTemplates", "templateid")
+        return [host["hostid"] for host in self.objects["host"].values()
+                if any(o[id_field] == object_id for o in host.get(key, []))]
+
+    # special methods
+
+    def _api_apiinfo_version(self, params):
+        return self.version
+
+    def _api_user_login(self, params):
+        username = params.get("username", params.get("user"))
+        if (username, params.get("password")) != self.credentials:
+            raise ZabbixAPIError("Invalid params.", "Incorrect user name or password or account is temporarily blocked.")
+        session = "%032x" % self.random.getrandbits(128)
+        self.sessions.add(session)
+        return session
+
+    def _api_user_logout(self, params):
+        return True
+
+    def _api_user_checkAuthentication(self, params):
+        session = params.get("sessionid") or params.get("token")
+        if session not in self.sessions and session not in self.api_tokens:
+            raise ZabbixAPIError("Invalid params.", "Session terminated, re-login, please.")
+        return {"userid": "1", "username": self.credentials[0], "sessionid": session}
+
+    def _api_usermacro_get(self, params):
+        if params.get("globalmacro"):
+            params = dict(params)
+            params.pop("globalmacro")
+            return self.get("globalmacro", params)
+        return self.get("usermacro", params)
+
+    def _api_usermacro_create(self, params):
+        macros = _as_list(params)
+        for macro in macros:
+            hostid = str(macro.get("hostid"))
+            if hostid not in self.objects["host"] and hostid not in self.objects["template"]:
+                raise ZabbixAPIError("Invalid params.", "No permissions to referred object or it does not exist!")
+        result = self.create("usermacro", macros)
+        for macro_id in result["hostmacroids"]:
+            macro = self.objects["usermacro"][macro_id]
+            self._children["usermacro"].setdefault(macro["hostid"], set()).add(macro_id)
+        return result
+
+    def _api_usermacro_createglobal(self, params):
+        return self.create("globalmacro", params)
+
+    def _api_usermacro_updateglobal(self, params):
+        return self.update("globalmacro", params)
+
+    def _api_usermacro_deleteglobal(self, params):
+        return self.delete("globalmacro", params)
+
+    def _api_configuration_export(self, params):
+        options = params.get("options", {})
+        template_groups = {}
+        templates = []
+        for template_id in _stringify(_as_list(options.get("templates"))):
+            template = self._existing("template", template_id)
+            groups = [g["name"] for g in self._select_objects(self._template_group_type(), [g["groupid"] for g in template.get("groups", [])], "extend")]
+            template_groups.update((name, {"name": name}) for name in groups)
+            exported = {"template": template["host"], "name": template.get("name", template["host"]),
+                        "groups": [{"name": name} for name in groups]}
+            linked = self._select_objects("template", [t["templateid"] for t in template.get("parentTemplates", [])], "extend")
+            if linked:
+                exported["templates"] = [{"name": t["host"]} for t in linked]
+            macros = self._select_objects("usermacro", self._child_ids("usermacro", template), "extend")
+            if macros:
+                exported["macros"] = [dict((k, m[k]) for k in ("macro", "value", "description") if m.get(k)) for m in macros]
+            if template.get("tags"):
+                exported["tags"] = template["tags"]
+            templates.append(exported)
+        export = {"version": ".".join(self.version.split(".")[:2]), "templates": templates}
+        export["template_groups" if self.version >= "6.2" else "groups"] = list(template_groups.values())
+        return json.dumps({"zabbix_export": export})
+
+    def _api_configuration_import(self, params):
+        return True
+
+    # synthetic data
+
+    def add_fleet(self, hosts, groups=None, templates=None, macros_per_host=2, tags_per_host=2, triggers_per_host=0,
+                  problems_per_host=0):
+        """
+        Create a synthetic fleet of hosts, spread over host groups and linked to templates.
+        Hosts are named "host-<n>", groups "Group <n>" and templates "Template <n>". The first call also
+        creates the "Admin" user and the "Email" media type.
+        """
+        groups = groups if groups is not None else max(1, hosts // 100)
+        templates = templates if templates is not None else max(1, hosts // 100)
+        with self._lock:
+            if not self.objects["user"]:
+                usergroup = self.create("usergroup", [{"name": "Zabbix administrators"}])["usrgrpids"][0]
+                role = self.create("role", [{"name": "Super admin role", "type": "3"}])["roleids"][0]
+                self.create("user", [{"username": self.credentials[0], "roleid": role, "usrgrps": [{"usrgrpid": usergroup}]}])
+                self.create("mediatype", [{"name": "Email", "type": "0"}])
+            group_ids = self.create("hostgroup", [{"name": "Group %d" % i} for i in range(groups)])["groupids"]
+            template_group = self.create(self._template_group_type(), [{"name": "Templates"}])["groupids"]
+            template_ids = self.create("template", [
+                {"host": "Template %d" % i, "groups": [{"groupid": template_group[0]}],
+                 "macros": [{"macro": "{$TEMPLATE_%d}" % i, "value": str(i)}]} for i in range(templates)])["templateids"]
+            host_ids = self.create("host", [{
+                "host": "host-%d" % i,
+                "groups": [{"groupid": group_ids[i % groups]}],
+                "templates": [{"templateid": template_ids[i % templates]}],
+                "interfaces": [{"type": 1, "main": 1, "useip": 1, "ip": "10.%d.%d.%d" % (i >> 16 & 255, i >> 8 & 255, i & 255),
+                                "dns": "", "port": "10050"}],
+                "macros": [{"macro": "{$MACRO_%d}" % m, "value": "value-%d" % i} for m in range(macros_per_host)],
+                "tags": [{"tag": "tag-%d" % t, "value": "value-%d" % (i % 10)} for t in range(tags_per_host)],
+                "inventory_mode": "0",
+                "inventory": {"location": "Rack %d" % (i % 42)},
+            } for i in range(hosts)])["hostids"]
+            for i, host_id in enumerate(host_ids):
+                for t in range(triggers_per_host):
+                    trigger_id = self.create("trigger", [{
+                        "description": "Problem %d on host-%d" % (t, i), "priority": str(t % 6),
+                        "value": "1" if t < problems_per_host else "0", "hosts": [{"hostid": host_id}]}])["triggerids"][0]
+                    if t < problems_per_host:
+                        event = {"name": "Problem %d on host-%d" % (t, i), "objectid": trigger_id, "severity": str(t % 6),
+                                 "clock": str(int(time.time()) - i),
+                                 "tags": [{"tag": "tag-%d" % n, "value": "value-%d" % (i % 10)} for n in range(tags_per_host)]}
+                        event_id = self.create("event", [event])["eventids"][0]
+                        self.objects["problem"][event_id] = dict(DEFAULTS["problem"], eventid=event_id, **event)
+        return host_ids
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # send the headers and the body of a response in one segment, Nagle's algorithm and the delayed
+    # ACK of the client would otherwise add 40ms to each request of a kept-alive connection
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.api._lock:
+            self.server.api.stats["connections"] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, code, body=b"", content_type="application/json"):
+        if body and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            gzipped = True
+        else:
+            gzipped = False
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.api._lock:
+            self.server.api.stats["bytes_sent"] += len(body)
+
+    def do_POST(self):
+        api = self.server.api
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with api._lock:
+            api.stats["requests"] += 1
+            api.stats["bytes_received"] += len(body)
+
+        if not self.path.rstrip("/").endswith("api_jsonrpc.php"):
+            return self._reply(404, b"Not Found", "text/plain")
+        if api.http_failure_rate and api.random.random() < api.http_failure_rate:
+            with api._lock:
+                api.stats["http_errors"] += 1
+            return self._reply(503, b"Service Unavailable", "text/plain")
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        try:
+            request = json.loads(body)
+        except ValueError:
+            response = {"jsonrpc": "2.0", "id": None,
+                        "error": {"code": -32700, "message": "Parse error.", "data": "Invalid JSON."}}
+        else:
+            authorization = self.headers.get("Authorization") or ""
+            bearer = authorization[7:] if authorization.startswith("Bearer ") else None
+            response = api.handle(request, bearer)
+        if response is None:
+            return self._reply(200)
+        self._reply(200, json.dumps(response).encode("utf-8"))
+
+
+class FakeZabbixServer(object):
+    """
+    Serves a FakeZabbixAPI over HTTP in a background thread.
+
+        with FakeZabbixServer(FakeZabbixAPI()) as server:
+            requests.post(server.url + "/api_jsonrpc.php", ...)
+    """
+    def __init__(self, api=None, host="127.0.0.1", port=0):
+        self.api = api if api is not None else FakeZabbixAPI()
+        self.httpd = ThreadingHTTPServer((host, port), _RequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self.api
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    @property
+    def url(self):
+        return "http://%s:%d" % self.httpd.server_address[:2]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fake-zabbix")
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake Zabbix JSON-RPC API with a synthetic fleet of hosts.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--version", default="6.4.0", help="Zabbix version returned by apiinfo.version")
+    parser.add_argument("--hosts", type=int, default=100, help="number of synthetic hosts")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds spent on each API call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="probability of an API call failing")
+    parser.add_argument("--http-failure-rate", type=float, default=0.0, help="probability of HTTP 503 responses")
+    args = parser.parse_args()
+
+    api = FakeZabbixAPI(version=args.version, latency=args.latency, http_failure_rate=args.http_failure_rate,
+                        failures={"*": args.failure_rate} if args.failure_rate else None)
+    api.add_fleet(args.hosts)
+    server = FakeZabbixServer(api, port=args.port)
+    print("Fake Zabbix %s with %d hosts listening on %s/api_jsonrpc.php" % (args.version, args.hosts, server.url))
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(api.stats, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Runs the modules and the inventory plugin of this collection against the fake Zabbix API
+(fake_zabbix.py) with synthetic fleets of different sizes, and records the number of API
+calls, the bytes exchanged and the wall time of each scenario into a JSON report.
+
+    python tests/benchmarks/run_benchmarks.py --sizes 100,1000,10000 --output report.json
+    python tests/benchmarks/run_benchmarks.py --baseline report.json
+
+With --baseline, the results are compared with a previous report and the script exits with
+status 1 when a scenario makes more API calls than in the baseline.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from fake_zabbix import FakeZabbixAPI, FakeZabbixServer
+
+
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _host_task(name, state="present", **params):
+    params.update(host_name=name, state=state)
+    return {"name": "zabbix_host %s %s" % (state, name), "community.zabbix.zabbix_host": params}
+
+
+def scenario_zabbix_host(size):
+    host = {
+        "host_groups": ["Group 0"],
+        "link_templates": ["Template 0"],
+        "interfaces": [{"type": "agent", "main": 1, "useip": 1, "ip": "192.0.2.1"}],
+        "macros": [{"macro": "{$BENCH}", "value": "1"}],
+        "tags": [{"tag": "bench"}],
+    }
+    groups = max(1, size // 100)
+    return [
+        _host_task("bench-host", **host),
+        _host_task("bench-host", **host),
+        _host_task("bench-host", **dict(host, host_groups=["Group 0", "Group %d" % (groups - 1)])),
+        # existing host of the fleet, moved to another group and template
+        _host_task("host-%d" % (size // 2), **dict(host, host_groups=["Group %d" % (size // 2 % groups)],
+                                                   link_templates=["Template %d" % (size // 2 % groups)])),
+        _host_task("bench-host", state="absent"),
+    ]
+
+
+def scenario_zabbix_action(size):
+    action = {
+        "name": "Bench action",
+        "event_source": "trigger",
+        "esc_period": 60,
+        "conditions": [
+            {"type": "host_group", "operator": "=", "value": "Group 0"},
+            {"type": "host_template", "operator": "=", "value": "Template 0"},
+            {"type": "host", "operator": "=", "value": "host-%d" % (size - 1)},
+        ],
+        "operations": [{"type": "send_message", "subject": "Bench", "op_message": "Bench", "media_type": "Email",
+                        "send_to_users": ["Admin"]}],
+    }
+    return [
+        {"name": "zabbix_action present", "community.zabbix.zabbix_action": action},
+        {"name": "zabbix_action present (again)", "community.zabbix.zabbix_action": action},
+        {"name": "zabbix_action absent", "community.zabbix.zabbix_action": {"name": "Bench action", "state": "absent"}},
+    ]
+
+
+def scenario_zabbix_template(size):
+    template = {
+        "template_name": "Bench template",
+        "template_groups": ["Templates"],
+        "link_templates": ["Template 0", "Template %d" % (max(1, size // 100) - 1)],
+        "macros": [{"macro": "{$BENCH}", "value": "1"}],
+        "tags": [{"tag": "bench"}],
+    }
+    return [
+        {"name": "zabbix_template present", "community.zabbix.zabbix_template": template},
+        {"name": "zabbix_template present (again)", "community.zabbix.zabbix_template": template},
+        {"name": "zabbix_template absent", "community.zabbix.zabbix_template": {"template_name": "Bench template", "state": "absent"}},
+    ]
+
+
+def scenario_zabbix_host_info(size):
+    return [
+        {"name": "zabbix_host_info", "community.zabbix.zabbix_host_info": {
+            "host_name": "host-1", "host_inventory": ["location"]}},
+        {"name": "zabbix_host_info by IP", "community.zabbix.zabbix_host_info": {
+            "host_ip": ["10.0.0.1", "10.0.0.2"]}},
+    ]
+
+
+def scenario_inventory(size):
+    return {
+        "plugin": "community.zabbix.zabbix_inventory",
+        "add_zabbix_groups": True,
+        "host_zapi_query": {"selectInterfaces": ["ip"], "selectTags": "extend"},
+        "compose": {"ansible_host": "zbx_interfaces[0].ip"},
+    }
+
+
+# scenario: (kind, function returning the playbook tasks or the inventory configuration)
+SCENARIOS = {
+    "zabbix_host": ("playbook", scenario_zabbix_host),
+    "zabbix_host_info": ("playbook", scenario_zabbix_host_info),
+    "zabbix_action": ("playbook", scenario_zabbix_action),
+    "zabbix_template": ("playbook", scenario_zabbix_template),
+    "inventory": ("inventory", scenario_inventory),
+}
+
+
+def collections_path(workdir):
+    """Return a collections path from which community.zabbix is loaded from this checkout."""
+    parents = COLLECTION_ROOT.split(os.sep)
+    if parents[-3:-1] == ["ansible_collections", "community"]:
+        return os.sep.join(parents[:-3])
+    path = os.path.join(workdir, "collections")
+    os.makedirs(os.path.join(path, "ansible_collections", "community"))
+    os.symlink(COLLECTION_ROOT, os.path.join(path, "ansible_collections", "community", "zabbix"))
+    return path
+
+
+def write_json(path, data):
+    # JSON is valid YAML, the playbooks and inventories are written as JSON
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def run_scenario(args, workdir, env, name, size):
+    kind, scenario = SCENARIOS[name]
+    api = FakeZabbixAPI(version=args.zabbix_version, latency=args.latency, seed=size,
+                        failures={"*": args.failure_rate} if args.failure_rate else None,
+                        http_failure_rate=args.http_failure_rate)
+    api.add_fleet(size)
+
+    with FakeZabbixServer(api) as server:
+        if kind == "playbook":
+            inventory = write_json(os.path.join(workdir, "hosts.yml"), {"all": {"hosts": {"zabbix": {
+                "ansible_connection": "httpapi",
+                "ansible_network_os": "community.zabbix.zabbix",
+                "ansible_host": "127.0.0.1",
+                "ansible_httpapi_port": server.port,
+                "ansible_httpapi_use_ssl": False,
+                "ansible_zabbix_url_path": "",
+                "ansible_user": "Admin",
+                "ansible_httpapi_pass": "zabbix",
+            }}}})
+            playbook = write_json(os.path.join(workdir, "%s.yml" % name), [
+                {"hosts": "zabbix", "gather_facts": False, "tasks": scenario(size)}])
+            command = ["ansible-playbook", "-i", inventory, playbook]
+        else:
+            config = dict(scenario(size), server_url=server.url, login_user="Admin", login_password="zabbix")
+            inventory = write_json(os.path.join(workdir, "zabbix_inventory.yml"), config)
+            command = ["ansible-inventory", "-i", inventory, "--list"]
+
+        api.reset_stats()
+        start = time.time()
+        process = subprocess.Popen(command, env=env, cwd=workdir, stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output = process.communicate()[0].decode("utf-8", "replace")
+        wall_time = time.time() - start
+
+    result = {
+        "scenario": name,
+        "size": size,
+        "rc": process.returncode,
+        "wall_time": round(wall_time, 3),
+    }
+    result.update(api.stats)
+    if process.returncode != 0:
+        result["output"] = output[-4000:]
+    return result
+
+
+def compare(report, baseline):
+    """Print the differences with the baseline report, return False if a scenario makes more API calls."""
+    previous = dict(((r["scenario"], r["size"]), r) for r in baseline["results"])
+    ok = True
+    for result in report["results"]:
+        before = previous.get((result["scenario"], result["size"]))
+        if before is None:
+            continue
+        regression = result["calls"] > before["calls"]
+        ok = ok and not regression
+        print("%-18s %6d  calls %6d -> %-6d bytes %10d -> %-10d time %8.2fs -> %-8.2fs%s" % (
+            result["scenario"], result["size"], before["calls"], result["calls"],
+            before["bytes_received"] + before["bytes_sent"], result["bytes_received"] + result["bytes_sent"],
+            before["wall_time"], result["wall_time"], "  REGRESSION" if regression else ""))
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000",
+                        help="comma separated numbers of hosts of the synthetic fleets (default: %(default)s)")
+    parser.add_argument("--scenarios", default=",".join(sorted(SCENARIOS)),
+                        help="comma separated scenarios to run (default: %(default)s)")
+    parser.add_argument("--zabbix-version", default="6.4.0", help="Zabbix version of the fake API (default: %(default)s)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds spent on each API call (default: %(default)s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="probability of an API call failing")
+    parser.add_argument("--http-failure-rate", type=float, default=0.0, help="probability of HTTP 503 responses")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare with this JSON report, exit with status 1 on more API calls")
+    parser.add_argument("--keep-workdir", action="store_true", help="do not remove the generated playbooks")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    scenarios = [name.strip() for name in args.scenarios.split(",")]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error("unknown scenarios: %s" % ", ".join(sorted(unknown)))
+
+    workdir = tempfile.mkdtemp(prefix="zabbix-benchmarks-")
+    env = dict(os.environ)
+    env.update({
+        "ANSIBLE_COLLECTIONS_PATH": collections_path(workdir),
+        "ANSIBLE_HOST_KEY_CHECKING": "False",
+        "ANSIBLE_INVENTORY_ENABLED": "community.zabbix.zabbix_inventory,yaml",
+        "ANSIBLE_PERSISTENT_COMMAND_TIMEOUT": "600",
+        "ANSIBLE_RETRY_FILES_ENABLED": "False",
+    })
+
+    report = {
+        "meta": {
+            "zabbix_version": args.zabbix_version,
+            "latency": args.latency,
+            "failure_rate": args.failure_rate,
+            "http_failure_rate": args.http_failure_rate,
+            "python": platform.python_version(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": [],
+    }
+    try:
+        for name in scenarios:
+            for size in sizes:
+                result = run_scenario(args, workdir, env, name, size)
+                report["results"].append(result)
+                print("%-18s %6d hosts: %6d calls %5d requests %10d bytes %8.2fs%s" % (
+                    name, size, result["calls"], result["requests"], result["bytes_received"] + result["bytes_sent"],
+                    result["wall_time"], "" if result["rc"] == 0 else "  FAILED (rc=%d)" % result["rc"]))
+    finally:
+        if args.keep_workdir:
+            print("Generated files kept in %s" % workdir)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        write_json(args.output, report)
+
+    ok = all(result["rc"] == 0 for result in report["results"])
+    if args.baseline:
+        with open(args.baseline) as f:
+            ok = compare(report, json.load(f)) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())